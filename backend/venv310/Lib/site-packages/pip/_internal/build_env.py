@@ -1,6 +1,9 @@
 """Build Environment used for isolation during sdist building
 """
 
+import contextlib
+import hashlib
+import json
 import logging
 import os
 import pathlib
@@ -9,21 +12,50 @@ import sys
 import textwrap
 from collections import OrderedDict
 from types import TracebackType
-from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pip._vendor.certifi import where
-from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
 
 from pip import __file__ as pip_location
+from pip._internal.cache import BuildEnvironmentCache
 from pip._internal.cli.spinners import open_spinner
+from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_platlib, get_purelib, get_scheme
 from pip._internal.metadata import get_default_environment, get_environment
-from pip._internal.utils.subprocess import call_subprocess
+from pip._internal.utils.logging import (
+    VERBOSE,
+    CapturedRecord,
+    capture_logs,
+    indent_log,
+    replay_logs,
+)
+from pip._internal.utils.markers import evaluate_marker
+from pip._internal.utils.packaging import get_requirement
+from pip._internal.utils.specifiers import specifier_contains
+from pip._internal.utils.subprocess import call_subprocess, subprocess_environ
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 
 if TYPE_CHECKING:
+    from pip._internal.cache import MetadataCache, WheelCache
     from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.metadata import BaseDistribution
+    from pip._internal.network.session import PipSession
+    from pip._internal.operations.build.build_tracker import BuildTracker
+    from pip._internal.req.req_set import RequirementSet
+    from pip._internal.resolution.base import BaseResolver
 
 logger = logging.getLogger(__name__)
 
@@ -77,83 +109,423 @@ def _get_system_sitepackages() -> Set[str]:
     return {os.path.normcase(path) for path in system_sites}
 
 
+# The canonical name, version and URL of a distribution to install.
+ResolvedBuildRequirement = Tuple[str, str, str]
+
+
+class BuildEnvironmentInstaller:
+    """Installs build dependencies with a pip subprocess."""
+
+    def resolve(
+        self,
+        finder: "PackageFinder",
+        requirements: List[str],
+        *,
+        kind: str,
+    ) -> List[ResolvedBuildRequirement]:
+        """Find out what installing the requirements would install, sorted."""
+        with TempDirectory(kind="build-env-report") as temp_dir:
+            report_path = os.path.join(temp_dir.path, "report.json")
+            args = self._get_install_args(
+                finder,
+                requirements,
+                [
+                    "--ignore-installed",
+                    "--no-user",
+                    "--dry-run",
+                    "--report",
+                    report_path,
+                ],
+            )
+            with open_spinner(f"Resolving {kind}") as spinner:
+                call_subprocess(
+                    args,
+                    command_desc=f"pip subprocess to resolve {kind}",
+                    spinner=spinner,
+                    extra_environ={"_PIP_STANDALONE_CERT": where()},
+                )
+            with open(report_path, encoding="utf-8") as f:
+                report = json.load(f)
+
+        return sorted(
+            (
+                canonicalize_name(item["metadata"]["name"]),
+                item["metadata"]["version"],
+                item["download_info"]["url"],
+            )
+            for item in report["install"]
+        )
+
+    def install(
+        self,
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        prefix: str,
+        *,
+        kind: str,
+        ignore_dependencies: bool = False,
+    ) -> None:
+        install_args = [
+            "--ignore-installed",
+            "--no-user",
+            "--prefix",
+            prefix,
+            "--no-warn-script-location",
+        ]
+        if ignore_dependencies:
+            install_args.append("--no-deps")
+        args = self._get_install_args(finder, requirements, install_args)
+        extra_environ = {"_PIP_STANDALONE_CERT": where()}
+        with open_spinner(f"Installing {kind}") as spinner:
+            call_subprocess(
+                args,
+                command_desc=f"pip subprocess to install {kind}",
+                spinner=spinner,
+                extra_environ=extra_environ,
+            )
+
+    @staticmethod
+    def _get_install_args(
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        install_args: List[str],
+    ) -> List[str]:
+        args: List[str] = [
+            sys.executable,
+            get_runnable_pip(),
+            "install",
+            *install_args,
+        ]
+        if logger.getEffectiveLevel() <= logging.DEBUG:
+            args.append("-v")
+        for format_control in ("no_binary", "only_binary"):
+            formats = getattr(finder.format_control, format_control)
+            args.extend(
+                (
+                    "--" + format_control.replace("_", "-"),
+                    ",".join(sorted(formats or {":none:"})),
+                )
+            )
+
+        index_urls = finder.index_urls
+        if index_urls:
+            args.extend(["-i", index_urls[0]])
+            for extra_index in index_urls[1:]:
+                args.extend(["--extra-index-url", extra_index])
+        else:
+            args.append("--no-index")
+        for link in finder.find_links:
+            args.extend(["--find-links", link])
+
+        for host in finder.trusted_hosts:
+            args.extend(["--trusted-host", host])
+        if finder.allow_all_prereleases:
+            args.append("--pre")
+        if finder.prefer_binary:
+            args.append("--prefer-binary")
+        args.append("--")
+        args.extend(requirements)
+        return args
+
+
+@contextlib.contextmanager
+def _reporting_like_subprocess(message: str) -> Generator[None, None, None]:
+    """Report on work done in this process like on a pip subprocess.
+
+    Its logs are shown only if it fails, unless pip is verbose.
+    """
+    if logger.getEffectiveLevel() <= VERBOSE:
+        with open_spinner(message), indent_log():
+            yield
+        return
+    captured: List[CapturedRecord] = []
+    try:
+        with open_spinner(message):
+            with capture_logs() as captured:
+                yield
+    except Exception:
+        replay_logs(captured)
+        raise
+
+
+class InprocessBuildEnvironmentInstaller(BuildEnvironmentInstaller):
+    """Installs build dependencies in the running pip process.
+
+    This uses the finder of this process, with what it already got from the
+    indexes, and the same session and caches. Build dependencies for another
+    interpreter than the running one are still installed by a subprocess.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: "PipSession",
+        build_tracker: "BuildTracker",
+        wheel_cache: "WheelCache",
+        progress_bar: str,
+        download_workers: int,
+        resume_retries: int,
+        verbosity: int,
+        metadata_cache: Optional["MetadataCache"] = None,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
+    ) -> None:
+        self._session = session
+        self._build_tracker = build_tracker
+        self._wheel_cache = wheel_cache
+        self._progress_bar = progress_bar
+        self._download_workers = download_workers
+        self._resume_retries = resume_retries
+        self._verbosity = verbosity
+        self._metadata_cache = metadata_cache
+        self._build_env_cache = build_env_cache
+
+    def resolve(
+        self,
+        finder: "PackageFinder",
+        requirements: List[str],
+        *,
+        kind: str,
+    ) -> List[ResolvedBuildRequirement]:
+        if finder.target_python.format_given():
+            return super().resolve(finder, requirements, kind=kind)
+        with _reporting_like_subprocess(f"Resolving {kind}"):
+            _, requirement_set = self._resolve(finder, requirements)
+        resolved = []
+        for req in requirement_set.requirements_to_install:
+            assert req.name is not None
+            assert req.download_info is not None
+            version = req.get_dist().metadata["Version"]
+            resolved.append(
+                (canonicalize_name(req.name), version, req.download_info.url)
+            )
+        return sorted(resolved)
+
+    def install(
+        self,
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        prefix: str,
+        *,
+        kind: str,
+        ignore_dependencies: bool = False,
+    ) -> None:
+        if finder.target_python.format_given():
+            super().install(
+                finder,
+                requirements,
+                prefix,
+                kind=kind,
+                ignore_dependencies=ignore_dependencies,
+            )
+            return
+
+        from pip._internal.req import install_given_reqs
+        from pip._internal.wheel_builder import build, should_build_for_install_command
+
+        with _reporting_like_subprocess(f"Installing {kind}"):
+            resolver, requirement_set = self._resolve(
+                finder, requirements, ignore_dependencies=ignore_dependencies
+            )
+            reqs_to_build = [
+                r
+                for r in requirement_set.requirements.values()
+                if should_build_for_install_command(r)
+            ]
+            _, build_failures = build(
+                reqs_to_build,
+                wheel_cache=self._wheel_cache,
+                verify=True,
+                build_options=[],
+                global_options=[],
+            )
+            if build_failures:
+                raise InstallationError(
+                    "Could not build wheels for {}, which are required to "
+                    "install {}".format(
+                        ", ".join(r.name for r in build_failures),  # type: ignore
+                        kind,
+                    )
+                )
+            install_given_reqs(
+                resolver.get_installation_order(requirement_set),
+                [],
+                root=None,
+                home=None,
+                prefix=prefix,
+                warn_script_location=False,
+                use_user_site=False,
+                pycompile=True,
+            )
+
+    def _resolve(
+        self,
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        ignore_dependencies: bool = False,
+    ) -> Tuple["BaseResolver", "RequirementSet"]:
+        # Imported here, as building sdists needs this module.
+        from pip._internal.operations.prepare import RequirementPreparer
+        from pip._internal.req.constructors import (
+            install_req_from_line,
+            install_req_from_req_string,
+        )
+        from pip._internal.resolution.resolvelib.resolver import Resolver
+
+        build_dir = TempDirectory(kind=tempdir_kinds.REQ_BUILD, globally_managed=True)
+        # Progress bars are not logged, so they would be drawn even when the
+        # rest of the output is held back until something fails.
+        if logger.getEffectiveLevel() <= VERBOSE:
+            progress_bar = self._progress_bar
+        else:
+            progress_bar = "off"
+        preparer = RequirementPreparer(
+            build_dir=build_dir.path,
+            download_dir=None,
+            src_dir=build_dir.path,
+            build_isolation=True,
+            check_build_deps=False,
+            build_tracker=self._build_tracker,
+            session=self._session,
+            progress_bar=progress_bar,
+            download_workers=self._download_workers,
+            resume_retries=self._resume_retries,
+            finder=finder,
+            require_hashes=False,
+            use_user_site=False,
+            lazy_wheel=False,
+            verbosity=self._verbosity,
+            legacy_resolver=False,
+            metadata_cache=self._metadata_cache,
+            build_env_cache=self._build_env_cache,
+            build_env_installer=self,
+        )
+        resolver = Resolver(
+            preparer=preparer,
+            finder=finder,
+            wheel_cache=self._wheel_cache,
+            make_install_req=install_req_from_req_string,
+            use_user_site=False,
+            ignore_dependencies=ignore_dependencies,
+            ignore_installed=True,
+            ignore_requires_python=False,
+            force_reinstall=False,
+            upgrade_strategy="to-satisfy-only",
+        )
+        reqs = [install_req_from_line(r, user_supplied=True) for r in requirements]
+        return resolver, resolver.resolve(reqs, check_supported_wheels=True)
+
+
 class BuildEnvironment:
-    """Creates and manages an isolated environment to install build deps"""
+    """Creates and manages an isolated environment to install build deps
 
-    def __init__(self) -> None:
+    :param cache: If given, build dependencies are installed in prefixes kept
+        in it, and reused by later builds needing the same distributions.
+    :param installer: What installs build dependencies, with a pip subprocess
+        by default.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[BuildEnvironmentCache] = None,
+        installer: Optional[BuildEnvironmentInstaller] = None,
+    ) -> None:
         temp_dir = TempDirectory(kind=tempdir_kinds.BUILD_ENV, globally_managed=True)
+        self._cache = cache
+        self._installer = installer or BuildEnvironmentInstaller()
 
         self._prefixes = OrderedDict(
             (name, _Prefix(os.path.join(temp_dir.path, name)))
             for name in ("normal", "overlay")
         )
 
+        self._temp_site_root = os.path.join(temp_dir.path, "site")
+        self._update_paths()
+
+    def _update_paths(self) -> None:
         self._bin_dirs: List[str] = []
         self._lib_dirs: List[str] = []
+        site_lib_dirs: List[str] = []
         for prefix in reversed(list(self._prefixes.values())):
             self._bin_dirs.append(prefix.bin_dir)
             self._lib_dirs.extend(prefix.lib_dirs)
+            if prefix.setup:
+                site_lib_dirs.extend(prefix.lib_dirs)
 
         # Customize site to:
         # - ensure .pth files are honored
         # - prevent access to system site packages
         system_sites = _get_system_sitepackages()
 
-        self._site_dir = os.path.join(temp_dir.path, "site")
-        if not os.path.exists(self._site_dir):
-            os.mkdir(self._site_dir)
+        sitecustomize = textwrap.dedent(
+            """
+            import os, site, sys
+
+            # First, drop system-sites related paths.
+            original_sys_path = sys.path[:]
+            known_paths = set()
+            for path in {system_sites!r}:
+                site.addsitedir(path, known_paths=known_paths)
+            system_paths = set(
+                os.path.normcase(path)
+                for path in sys.path[len(original_sys_path):]
+            )
+            original_sys_path = [
+                path for path in original_sys_path
+                if os.path.normcase(path) not in system_paths
+            ]
+            sys.path = original_sys_path
+
+            # Second, add lib directories.
+            # ensuring .pth file are processed.
+            for path in {lib_dirs!r}:
+                assert not path in sys.path
+                site.addsitedir(path)
+            """
+        ).format(system_sites=system_sites, lib_dirs=site_lib_dirs)
+
+        # Only the prefixes installed so far are put on sys.path, and each
+        # sitecustomize gets its own site directory: processes started before
+        # and after an installation are then told apart by their environment.
+        # Build environments made of the same cached prefixes share their site
+        # directory, so that they are identical to the processes using them.
+        cache = self._cache
+        if cache is not None and all(
+            cache.contains(prefix.path)
+            for prefix in self._prefixes.values()
+            if prefix.setup
+        ):
+            self._site_dir = cache.get_site_dir(sitecustomize)
+            return
+        self._site_dir = os.path.join(
+            self._temp_site_root,
+            hashlib.sha256(sitecustomize.encode()).hexdigest()[:16],
+        )
+        os.makedirs(self._site_dir, exist_ok=True)
         with open(
             os.path.join(self._site_dir, "sitecustomize.py"), "w", encoding="utf-8"
         ) as fp:
-            fp.write(
-                textwrap.dedent(
-                    """
-                import os, site, sys
-
-                # First, drop system-sites related paths.
-                original_sys_path = sys.path[:]
-                known_paths = set()
-                for path in {system_sites!r}:
-                    site.addsitedir(path, known_paths=known_paths)
-                system_paths = set(
-                    os.path.normcase(path)
-                    for path in sys.path[len(original_sys_path):]
-                )
-                original_sys_path = [
-                    path for path in original_sys_path
-                    if os.path.normcase(path) not in system_paths
-                ]
-                sys.path = original_sys_path
-
-                # Second, add lib directories.
-                # ensuring .pth file are processed.
-                for path in {lib_dirs!r}:
-                    assert not path in sys.path
-                    site.addsitedir(path)
-                """
-                ).format(system_sites=system_sites, lib_dirs=self._lib_dirs)
-            )
-
-    def __enter__(self) -> None:
-        self._save_env = {
-            name: os.environ.get(name, None)
-            for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
-        }
+            fp.write(sitecustomize)
 
+    def _get_environ(self) -> Dict[str, str]:
         path = self._bin_dirs[:]
-        old_path = self._save_env["PATH"]
+        old_path = os.environ.get("PATH")
         if old_path:
             path.extend(old_path.split(os.pathsep))
 
         pythonpath = [self._site_dir]
 
-        os.environ.update(
-            {
-                "PATH": os.pathsep.join(path),
-                "PYTHONNOUSERSITE": "1",
-                "PYTHONPATH": os.pathsep.join(pythonpath),
-            }
-        )
+        return {
+            "PATH": os.pathsep.join(path),
+            "PYTHONNOUSERSITE": "1",
+            "PYTHONPATH": os.pathsep.join(pythonpath),
+        }
+
+    def __enter__(self) -> None:
+        self._save_env = {
+            name: os.environ.get(name, None)
+            for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
+        }
+        os.environ.update(self._get_environ())
 
     def __exit__(
         self,
@@ -167,6 +539,16 @@ class BuildEnvironment:
             else:
                 os.environ[varname] = old_value
 
+    @contextlib.contextmanager
+    def for_current_thread(self) -> Generator[None, None, None]:
+        """Use the environment in the subprocesses of the current thread only.
+
+        Unlike entering the environment, this can be done in several threads
+        at the same time.
+        """
+        with subprocess_environ(self._get_environ()):
+            yield
+
     def check_requirements(
         self, reqs: Iterable[str]
     ) -> Tuple[Set[Tuple[str, str]], Set[str]]:
@@ -183,10 +565,10 @@ class BuildEnvironment:
                 else get_default_environment()
             )
             for req_str in reqs:
-                req = Requirement(req_str)
+                req = get_requirement(req_str)
                 # We're explicitly evaluating with an empty extra value, since build
                 # environments are not provided any mechanism to select specific extras.
-                if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+                if req.marker is not None and not evaluate_marker(req.marker, ""):
                     continue
                 dist = env.get_distribution(req.name)
                 if not dist:
@@ -196,11 +578,20 @@ class BuildEnvironment:
                     installed_req_str = f"{req.name}=={dist.version}"
                 else:
                     installed_req_str = f"{req.name}==={dist.version}"
-                if not req.specifier.contains(dist.version, prereleases=True):
+                if not specifier_contains(
+                    req.specifier, dist.version, prereleases=True
+                ):
                     conflicting.add((installed_req_str, req_str))
                 # FIXME: Consider direct URL?
         return conflicting, missing
 
+    def get_installed_distributions(self) -> List["BaseDistribution"]:
+        """Get the distributions installed in the environment, by name."""
+        if not hasattr(self, "_lib_dirs"):
+            return []
+        env = get_environment(self._lib_dirs)
+        return sorted(env.iter_all_distributions(), key=lambda d: d.canonical_name)
+
     def install_requirements(
         self,
         finder: "PackageFinder",
@@ -212,72 +603,68 @@ class BuildEnvironment:
         prefix = self._prefixes[prefix_as_string]
         assert not prefix.setup
         prefix.setup = True
-        if not requirements:
+        if self._cache is not None:
+            self._install_requirements_cached(
+                self._cache,
+                finder,
+                list(requirements),
+                prefix_as_string,
+                kind=kind,
+            )
             return
-        self._install_requirements(
-            get_runnable_pip(),
-            finder,
-            requirements,
-            prefix,
-            kind=kind,
-        )
+        if requirements:
+            self._installer.install(finder, requirements, prefix.path, kind=kind)
+        self._update_paths()
 
-    @staticmethod
-    def _install_requirements(
-        pip_runnable: str,
+    def _install_requirements_cached(
+        self,
+        cache: BuildEnvironmentCache,
         finder: "PackageFinder",
-        requirements: Iterable[str],
-        prefix: _Prefix,
+        requirements: List[str],
+        prefix_as_string: str,
         *,
         kind: str,
     ) -> None:
-        args: List[str] = [
-            sys.executable,
-            pip_runnable,
-            "install",
-            "--ignore-installed",
-            "--no-user",
-            "--prefix",
-            prefix.path,
-            "--no-warn-script-location",
-        ]
-        if logger.getEffectiveLevel() <= logging.DEBUG:
-            args.append("-v")
-        for format_control in ("no_binary", "only_binary"):
-            formats = getattr(finder.format_control, format_control)
-            args.extend(
-                (
-                    "--" + format_control.replace("_", "-"),
-                    ",".join(sorted(formats or {":none:"})),
-                )
-            )
+        """Use a cached prefix with the distributions requirements resolve to.
 
-        index_urls = finder.index_urls
-        if index_urls:
-            args.extend(["-i", index_urls[0]])
-            for extra_index in index_urls[1:]:
-                args.extend(["--extra-index-url", extra_index])
-        else:
-            args.append("--no-index")
-        for link in finder.find_links:
-            args.extend(["--find-links", link])
+        They are resolved every time, so that the prefix has what a fresh
+        installation would give. Without requirements, the prefix is empty.
+        """
+        resolved: List[ResolvedBuildRequirement] = []
+        if requirements:
+            resolved = self._installer.resolve(finder, requirements, kind=kind)
+        key_parts = {
+            "interpreter": [sys.executable, sys.version],
+            "resolved": resolved,
+        }
+        key = hashlib.sha256(
+            json.dumps(key_parts, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+        # Install exactly what the key describes, not what resolving the
+        # requirements again would give by now.
+        pinned = {name: f"{name}=={version}" for name, version, _ in resolved}
+        for requirement in requirements:
+            parsed = get_requirement(requirement)
+            name = canonicalize_name(parsed.name)
+            if parsed.url and name in pinned:
+                pinned[name] = f"{parsed.name} @ {parsed.url}"
+
+        def populate(path: str) -> None:
+            if pinned:
+                self._installer.install(
+                    finder,
+                    sorted(pinned.values()),
+                    path,
+                    kind=kind,
+                    ignore_dependencies=True,
+                )
 
-        for host in finder.trusted_hosts:
-            args.extend(["--trusted-host", host])
-        if finder.allow_all_prereleases:
-            args.append("--pre")
-        if finder.prefer_binary:
-            args.append("--prefer-binary")
-        args.append("--")
-        args.extend(requirements)
-        extra_environ = {"_PIP_STANDALONE_CERT": where()}
-        with open_spinner(f"Installing {kind}") as spinner:
-            call_subprocess(
-                args,
-                command_desc=f"pip subprocess to install {kind}",
-                spinner=spinner,
-                extra_environ=extra_environ,
-            )
+        path = cache.get_prefix(key, populate)
+        logger.debug("Using build environment prefix %s for %s", path, kind)
+        prefix = self._prefixes[prefix_as_string] = _Prefix(path)
+        prefix.setup = True
+        self._update_paths()
 
 
 class NoOpBuildEnvironment(BuildEnvironment):
@@ -286,6 +673,9 @@ class NoOpBuildEnvironment(BuildEnvironment):
     def __init__(self) -> None:
         pass
 
+    def _get_environ(self) -> Dict[str, str]:
+        return {}
+
     def __enter__(self) -> None:
         pass
 
@@ -1,12 +1,18 @@
 """Cache Management
 """
 
+import errno
 import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 from pip._vendor.packaging.utils import canonicalize_name
@@ -15,7 +21,12 @@ from pip._internal.exceptions import InvalidWheelFilename
 from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.network.cache import suppressed_cache_errors
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.filetypes import is_archive_file
+from pip._internal.utils.misc import ensure_dir, hash_file
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
+from pip._internal.utils.unpacking import unzip_file
 from pip._internal.utils.urls import path_to_url
 
 logger = logging.getLogger(__name__)
@@ -136,6 +147,7 @@ class SimpleWheelCache(Cache):
         if not package_name:
             return link
 
+        tag_priorities: Optional[Dict[Tag, int]] = None
         canonical_package_name = canonicalize_name(package_name)
         for wheel_name, wheel_dir in self._get_candidates(link, canonical_package_name):
             try:
@@ -151,16 +163,14 @@ class SimpleWheelCache(Cache):
                     package_name,
                 )
                 continue
-            if not wheel.supported(supported_tags):
+            if tag_priorities is None:
+                tag_priorities = {tag: idx for idx, tag in enumerate(supported_tags)}
+            try:
+                priority = wheel.find_most_preferred_tag(supported_tags, tag_priorities)
+            except ValueError:
                 # Built for a different python/arch/etc
                 continue
-            candidates.append(
-                (
-                    wheel.support_index_min(supported_tags),
-                    wheel_name,
-                    wheel_dir,
-                )
-            )
+            candidates.append((priority, wheel_name, wheel_dir))
 
         if not candidates:
             return link
@@ -288,3 +298,382 @@ class WheelCache(Cache):
                         download_info.url,
                     )
         origin_path.write_text(download_info.to_json(), encoding="utf-8")
+
+
+# The FICLONE ioctl of Linux, which makes dst share the data blocks of src on
+# filesystems supporting it (btrfs, XFS, ...), copying them on write.
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported", dst)
+    import fcntl
+
+    with open(src, "rb") as src_file, open(dst, "xb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except OSError:
+            dst_file.close()
+            os.unlink(dst)
+            raise
+    shutil.copymode(src, dst)
+
+
+# Created in the directory of a wheel once it has been fully unpacked. No wheel
+# can have a file with that name at its root.
+_UNPACKED_MARKER = ".unpacked"
+
+
+class UnpackedWheelStore:
+    """A content-addressed store of unpacked wheels.
+
+    Each wheel is unpacked once, under the sha256 of the wheel file. Its files
+    are then installed from the store with reflinks where the filesystem
+    supports them, else with hardlinks, and copied when neither works (e.g.
+    across filesystems). Installed files that get rewritten (scripts, RECORD)
+    are always replaced by new files, so the store is never modified.
+    """
+
+    def __init__(self, directory: str) -> None:
+        assert os.path.isabs(directory)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._link_methods: List[Callable[[str, str], None]] = [
+            _clone_file,
+            os.link,
+        ]
+
+    def get_unpacked_dir(self, wheel_path: str) -> str:
+        """Get the directory holding the unpacked files of a wheel.
+
+        The wheel is unpacked first if it is not in the store yet.
+        """
+        digest = hash_file(wheel_path)[0].hexdigest()
+        path = os.path.join(self.directory, digest[:2], digest[2:4], digest[4:])
+        if os.path.isfile(os.path.join(path, _UNPACKED_MARKER)):
+            return path
+        if os.path.isdir(path):
+            # What is left of the wheel after 'pip cache purge'.
+            shutil.rmtree(path)
+
+        parent = os.path.dirname(path)
+        ensure_dir(parent)
+        unpacking_dir = tempfile.mkdtemp(prefix=f"{digest[4:]}-", dir=parent)
+        try:
+            unzip_file(wheel_path, unpacking_dir, flatten=False)
+            with open(os.path.join(unpacking_dir, _UNPACKED_MARKER), "wb"):
+                pass
+            os.rename(unpacking_dir, path)
+        except OSError:
+            shutil.rmtree(unpacking_dir, ignore_errors=True)
+            # Another pip process may have unpacked the same wheel meanwhile.
+            if not os.path.isdir(path):
+                raise
+        return path
+
+    def install_file(self, unpacked_dir: str, record_path: str, dest: str) -> None:
+        """Install a file of an unpacked wheel at dest, which must not exist."""
+        src = os.path.join(unpacked_dir, record_path)
+        for method in list(self._link_methods):
+            try:
+                method(src, dest)
+            except FileNotFoundError:
+                raise
+            except OSError as e:
+                logger.debug("Could not %s %s: %s", method.__name__, dest, e)
+                # The method is not going to work for the other files either.
+                with self._lock:
+                    if method in self._link_methods:
+                        self._link_methods.remove(method)
+            else:
+                return
+        shutil.copyfile(src, dest)
+        shutil.copymode(src, dest)
+
+
+# The hashes of a wheel file strong enough to trust its cached metadata by.
+_METADATA_CACHE_HASHES = ("sha256", "sha384", "sha512")
+_HEX_DIGEST_RE = re.compile(r"[0-9a-f]{64,128}")
+
+
+class MetadataCache:
+    """A persistent cache of the core metadata of distributions.
+
+    Entries are keyed by the hash the index gives for a wheel file, so the
+    metadata of a wheel seen before needs neither to be fetched again, nor the
+    wheel to be downloaded, to resolve its dependencies. Wheels whose link has
+    no such hash are not cached.
+
+    If include_sdists is set, the .dist-info directories build backends
+    prepare for source distributions are cached too. They are keyed by the
+    hash of the archive, or of the local file, and by the build options they
+    were prepared with, which are for the caller to give, and then by the
+    build environment they were prepared in (see SourceMetadataEntry).
+    """
+
+    def __init__(self, directory: str, include_sdists: bool = False) -> None:
+        assert os.path.isabs(directory)
+        self.directory = directory
+        self.include_sdists = include_sdists
+
+    def _get_cache_path(self, link: Link) -> Optional[str]:
+        if not link.is_wheel or link.hash_name not in _METADATA_CACHE_HASHES:
+            return None
+        digest = link.hash
+        assert digest is not None
+        digest = digest.lower()
+        if not _HEX_DIGEST_RE.fullmatch(digest):
+            return None
+        return os.path.join(
+            self.directory, link.hash_name, digest[:2], digest[2:4], digest[4:]
+        )
+
+    def get(self, link: Link) -> Optional[bytes]:
+        """Get the METADATA file contents of a wheel, if cached."""
+        path = self._get_cache_path(link)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def should_cache(self, link: Link) -> bool:
+        """Whether the metadata of a wheel can be cached, and is not yet."""
+        path = self._get_cache_path(link)
+        return path is not None and not os.path.exists(path)
+
+    def set(self, link: Link, metadata: bytes) -> None:
+        path = self._get_cache_path(link)
+        if path is None:
+            return
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(metadata)
+            replace(f.name, path)
+
+    def _get_source_cache_path(
+        self, link: Link, build_options: Dict[str, Any]
+    ) -> Optional[str]:
+        if not self.include_sdists or link.is_wheel or link.is_vcs:
+            return None
+        if not is_archive_file(link.filename):
+            return None
+        digest = (link.hash or "").lower()
+        if link.hash_name in _METADATA_CACHE_HASHES and _HEX_DIGEST_RE.fullmatch(
+            digest
+        ):
+            archive_hash = [link.hash_name, digest]
+        elif link.is_file and os.path.isfile(link.file_path):
+            try:
+                archive_hash = ["sha256", hash_file(link.file_path)[0].hexdigest()]
+            except OSError:
+                return None
+        else:
+            return None
+        key_parts = {"archive": archive_hash, "build": build_options}
+        key = hashlib.sha256(
+            json.dumps(key_parts, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+        return os.path.join(self.directory, "sdists", key[:2], key[2:4], key[4:])
+
+    def get_source_entry(
+        self, link: Link, build_options: Dict[str, Any]
+    ) -> Optional["SourceMetadataEntry"]:
+        """Get where the metadata prepared for an sdist is cached, if it can be."""
+        path = self._get_source_cache_path(link, build_options)
+        if path is None:
+            return None
+        return SourceMetadataEntry(path)
+
+
+def _find_metadata_directory(path: str) -> Optional[str]:
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return None
+    for name in names:
+        metadata_directory = os.path.join(path, name)
+        if name.endswith(".dist-info") and os.path.isfile(
+            os.path.join(metadata_directory, "METADATA")
+        ):
+            return metadata_directory
+    return None
+
+
+_SOURCE_METADATA_REQUIRES = "build-requires.json"
+
+
+class SourceMetadataEntry:
+    """The metadata prepared for an sdist with some build options, in the cache.
+
+    A backend may prepare different metadata depending on the versions of the
+    distributions installed in its build environment, so one .dist-info
+    directory is kept per environment, keyed by a digest of what is installed
+    in it. Each is stored along with the static build requirements of the
+    sdist, and the version of the distribution installed for each of them.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def get(self, build_env_key: str) -> Optional[str]:
+        """Get the .dist-info directory prepared in a build environment."""
+        return _find_metadata_directory(os.path.join(self.path, build_env_key))
+
+    def iter_prepared(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over the .dist-info directories prepared in any build
+        environment, along with the build requirements each was prepared with.
+        """
+        try:
+            build_env_keys = sorted(os.listdir(self.path))
+        except OSError:
+            return
+        for build_env_key in build_env_keys:
+            path = os.path.join(self.path, build_env_key)
+            metadata_directory = _find_metadata_directory(path)
+            if metadata_directory is None:
+                continue
+            try:
+                with open(os.path.join(path, _SOURCE_METADATA_REQUIRES)) as f:
+                    build_requirements = json.load(f)
+            except (OSError, ValueError):
+                continue
+            yield metadata_directory, build_requirements
+
+    def set(
+        self,
+        build_env_key: str,
+        metadata_directory: str,
+        build_requirements: Dict[str, Any],
+    ) -> None:
+        """Store the .dist-info directory a backend prepared in a build
+        environment.
+        """
+        path = os.path.join(self.path, build_env_key)
+        with suppressed_cache_errors():
+            if os.path.isdir(path):
+                if _find_metadata_directory(path) is not None:
+                    return
+                # What is left of the entry after 'pip cache purge'.
+                shutil.rmtree(path)
+            ensure_dir(self.path)
+            temp_path = tempfile.mkdtemp(prefix=f"{build_env_key}-", dir=self.path)
+            try:
+                shutil.copytree(
+                    metadata_directory,
+                    os.path.join(temp_path, os.path.basename(metadata_directory)),
+                )
+                with open(os.path.join(temp_path, _SOURCE_METADATA_REQUIRES), "w") as f:
+                    json.dump(build_requirements, f)
+                os.rename(temp_path, path)
+            finally:
+                # Left behind if another pip process stored the entry meanwhile.
+                shutil.rmtree(temp_path, ignore_errors=True)
+
+
+class ResolutionCache:
+    """A persistent cache of the outcome of dependency resolutions.
+
+    Entries are JSON documents, keyed by a digest of everything the resolution
+    depended on that is known before it starts. What is only known afterwards,
+    like the state of the index pages consulted, is stored in the entry for the
+    resolver to check.
+    """
+
+    def __init__(self, directory: str) -> None:
+        assert os.path.isabs(directory)
+        self.directory = directory
+
+    def _get_cache_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._get_cache_path(key), "rb") as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._get_cache_path(key)
+        data = json.dumps(entry, sort_keys=True, separators=(",", ":"))
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(data.encode("utf-8"))
+            replace(f.name, path)
+
+
+# Created in a build environment prefix once everything is installed in it.
+_BUILD_ENV_MARKER = ".complete"
+
+
+class BuildEnvironmentCache:
+    """A persistent cache of prefixes with build dependencies installed.
+
+    Entries are keyed by a digest of the distributions installed and of the
+    interpreter they were installed for. A prefix is never changed once it
+    is in the cache, so builds use it without installing anything again.
+    """
+
+    def __init__(self, directory: str) -> None:
+        assert os.path.isabs(directory)
+        self.directory = directory
+
+    def get_prefix(self, key: str, populate: Callable[[str], None]) -> str:
+        """Get the prefix of the build dependencies with the given key.
+
+        If they are not in the cache yet, populate is called to install them
+        in a new prefix, given as its argument, which is then stored.
+        """
+        path = os.path.join(self.directory, key[:2], key[2:])
+        if os.path.isfile(os.path.join(path, _BUILD_ENV_MARKER)):
+            return path
+        if os.path.isdir(path):
+            # What is left of the prefix after 'pip cache purge'.
+            shutil.rmtree(path)
+
+        parent = os.path.dirname(path)
+        ensure_dir(parent)
+        populating_dir = tempfile.mkdtemp(prefix=f"{key[2:]}-", dir=parent)
+        try:
+            populate(populating_dir)
+            with open(os.path.join(populating_dir, _BUILD_ENV_MARKER), "wb"):
+                pass
+            os.rename(populating_dir, path)
+        except OSError:
+            shutil.rmtree(populating_dir, ignore_errors=True)
+            # Another pip process may have populated the same prefix meanwhile.
+            if not os.path.isdir(path):
+                raise
+        except BaseException:
+            shutil.rmtree(populating_dir, ignore_errors=True)
+            raise
+        return path
+
+    def contains(self, path: str) -> bool:
+        """Check whether a path is in the cache."""
+        try:
+            return os.path.commonpath([self.directory, path]) == self.directory
+        except ValueError:  # On different drives.
+            return False
+
+    def get_site_dir(self, sitecustomize: str) -> str:
+        """Get a directory with the given sitecustomize.py, to share it."""
+        key = hashlib.sha256(sitecustomize.encode("utf-8")).hexdigest()
+        path = os.path.join(self.directory, "sites", key)
+        sitecustomize_path = os.path.join(path, "sitecustomize.py")
+        if os.path.isfile(sitecustomize_path):
+            return path
+        ensure_dir(path)
+        with adjacent_tmp_file(sitecustomize_path) as f:
+            f.write(sitecustomize.encode("utf-8"))
+        replace(f.name, sitecustomize_path)
+        return path
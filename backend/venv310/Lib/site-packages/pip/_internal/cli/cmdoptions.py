@@ -231,6 +231,61 @@ progress_bar: Callable[..., Option] = partial(
     help="Specify whether the progress bar should be used [on, off] (default: on)",
 )
 
+download_workers: Callable[..., Option] = partial(
+    Option,
+    "--download-workers",
+    dest="download_workers",
+    metavar="n",
+    type="int",
+    default=1,
+    help=(
+        "Number of files to download concurrently once dependency resolution "
+        "has finished. Values above 1 also fetch index pages and metadata of "
+        "likely candidates in the background during resolution "
+        "(default %default)."
+    ),
+)
+
+resume_retries: Callable[..., Option] = partial(
+    Option,
+    "--resume-retries",
+    dest="resume_retries",
+    metavar="n",
+    type="int",
+    default=5,
+    help=(
+        "Maximum number of times an interrupted download is resumed, using "
+        "HTTP range requests where the server supports them (default %default)."
+    ),
+)
+
+compile_jobs: Callable[..., Option] = partial(
+    Option,
+    "--compile-jobs",
+    dest="compile_jobs",
+    metavar="n",
+    type="int",
+    default=1,
+    help=(
+        "Number of processes compiling Python source files to bytecode, "
+        "shared by all the packages being installed (default %default)."
+    ),
+)
+
+build_jobs: Callable[..., Option] = partial(
+    Option,
+    "--build-jobs",
+    dest="build_jobs",
+    metavar="n",
+    type="int",
+    default=1,
+    help=(
+        "Number of packages to build wheels for concurrently, each in its own "
+        "build backend processes. The output of each build is shown once it "
+        "has finished (default %default)."
+    ),
+)
+
 log: Callable[..., Option] = partial(
     PipOption,
     "--log",
@@ -1007,8 +1062,14 @@ use_new_feature: Callable[..., Option] = partial(
     action="append",
     default=[],
     choices=[
+        "build-env-cache",
         "fast-deps",
+        "hook-workers",
+        "inprocess-build-deps",
+        "resolution-cache",
+        "sdist-metadata-cache",
         "truststore",
+        "unpacked-wheel-store",
     ]
     + ALWAYS_ENABLED_FEATURES,
     help="Enable new functionality, that may be backward incompatible.",
@@ -1,4 +1,6 @@
+import contextlib
 import functools
+import threading
 from typing import Callable, Generator, Iterable, Iterator, Optional, Tuple
 
 from pip._vendor.rich.progress import (
@@ -17,6 +19,7 @@ from pip._vendor.rich.progress import (
 from pip._internal.utils.logging import get_indentation
 
 DownloadProgressRenderer = Callable[[Iterable[bytes]], Iterator[bytes]]
+BatchProgressCallback = Callable[[int, bool], None]
 
 
 def _rich_progress_bar(
@@ -66,3 +69,58 @@ def get_download_progress_renderer(
         return functools.partial(_rich_progress_bar, bar_type=bar_type, size=size)
     else:
         return iter  # no-op, when passed an iterator
+
+
+@contextlib.contextmanager
+def _rich_batch_progress_bar(
+    *,
+    bar_type: str,
+    file_count: int,
+) -> Generator[BatchProgressCallback, None, None]:
+    assert bar_type == "on", "This should only be used in the default mode."
+
+    columns: Tuple[ProgressColumn, ...] = (
+        TextColumn("[progress.description]{task.description}"),
+        SpinnerColumn("line", speed=1.5),
+        FileSizeColumn(),
+        TransferSpeedColumn(),
+        TimeElapsedColumn(),
+    )
+    progress = Progress(*columns, refresh_per_second=30)
+    indent = " " * (get_indentation() + 2)
+    task_id = progress.add_task(f"{indent}0/{file_count} files", total=float("inf"))
+    completed = 0
+    lock = threading.Lock()
+
+    def advance(size: int, finished: bool) -> None:
+        nonlocal completed
+        if not finished:
+            progress.update(task_id, advance=size)
+            return
+        with lock:
+            completed += 1
+            description = f"{indent}{completed}/{file_count} files"
+        progress.update(task_id, advance=size, description=description)
+
+    with progress:
+        yield advance
+
+
+@contextlib.contextmanager
+def _no_batch_progress_bar() -> Generator[BatchProgressCallback, None, None]:
+    yield lambda size, finished: None
+
+
+def get_batch_download_progress_renderer(
+    *, bar_type: str, file_count: int
+) -> "contextlib.AbstractContextManager[BatchProgressCallback]":
+    """Get a context manager rendering the aggregated progress of a batch.
+
+    The context manager yields a callback taking the number of bytes received
+    and whether a file has just been completed. It may be called from several
+    threads at once.
+    """
+    if bar_type == "on":
+        return _rich_batch_progress_bar(bar_type=bar_type, file_count=file_count)
+    else:
+        return _no_batch_progress_bar()
@@ -12,7 +12,13 @@ from functools import partial
 from optparse import Values
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-from pip._internal.cache import WheelCache
+from pip._internal.build_env import InprocessBuildEnvironmentInstaller
+from pip._internal.cache import (
+    BuildEnvironmentCache,
+    MetadataCache,
+    ResolutionCache,
+    WheelCache,
+)
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.command_context import CommandContextMixIn
@@ -305,6 +311,31 @@ class RequirementCommand(IndexGroupCommand):
                     "fast-deps has no effect when used with the legacy resolver."
                 )
 
+        metadata_cache = None
+        build_env_cache = None
+        if options.cache_dir:
+            metadata_cache = MetadataCache(
+                os.path.join(options.cache_dir, "metadata"),
+                include_sdists="sdist-metadata-cache" in options.features_enabled,
+            )
+            if "build-env-cache" in options.features_enabled:
+                build_env_cache = BuildEnvironmentCache(
+                    os.path.join(options.cache_dir, "build-envs")
+                )
+        build_env_installer = None
+        if "inprocess-build-deps" in options.features_enabled:
+            build_env_installer = InprocessBuildEnvironmentInstaller(
+                session=session,
+                build_tracker=build_tracker,
+                wheel_cache=WheelCache(options.cache_dir),
+                progress_bar=options.progress_bar,
+                download_workers=options.download_workers,
+                resume_retries=options.resume_retries,
+                verbosity=verbosity,
+                metadata_cache=metadata_cache,
+                build_env_cache=build_env_cache,
+            )
+
         return RequirementPreparer(
             build_dir=temp_build_dir_path,
             src_dir=options.src_dir,
@@ -314,12 +345,17 @@ class RequirementCommand(IndexGroupCommand):
             build_tracker=build_tracker,
             session=session,
             progress_bar=options.progress_bar,
+            download_workers=options.download_workers,
+            resume_retries=options.resume_retries,
             finder=finder,
             require_hashes=options.require_hashes,
             use_user_site=use_user_site,
             lazy_wheel=lazy_wheel,
             verbosity=verbosity,
             legacy_resolver=legacy_resolver,
+            metadata_cache=metadata_cache,
+            build_env_cache=build_env_cache,
+            build_env_installer=build_env_installer,
         )
 
     @classmethod
@@ -352,6 +388,12 @@ class RequirementCommand(IndexGroupCommand):
         if resolver_variant == "resolvelib":
             import pip._internal.resolution.resolvelib.resolver
 
+            resolution_cache = None
+            if "resolution-cache" in options.features_enabled and options.cache_dir:
+                resolution_cache = ResolutionCache(
+                    os.path.join(options.cache_dir, "resolutions")
+                )
+
             return pip._internal.resolution.resolvelib.resolver.Resolver(
                 preparer=preparer,
                 finder=finder,
@@ -364,6 +406,7 @@ class RequirementCommand(IndexGroupCommand):
                 force_reinstall=force_reinstall,
                 upgrade_strategy=upgrade_strategy,
                 py_version_info=py_version_info,
+                resolution_cache=resolution_cache,
             )
         import pip._internal.resolution.legacy.resolver
 
@@ -6,7 +6,7 @@ import time
 from typing import IO, Generator, Optional
 
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import get_indentation
+from pip._internal.utils.logging import capturing_logs, get_indentation
 
 logger = logging.getLogger(__name__)
 
@@ -118,13 +118,19 @@ def open_spinner(message: str) -> Generator[SpinnerInterface, None, None]:
     # through the logging system, but it acts like it has level INFO,
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
-    # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # in sync with logging configuration. It is also used while logs are held
+    # back, as there may be other spinners at the same time.
+    interactive = (
+        sys.stdout.isatty()
+        and logger.getEffectiveLevel() <= logging.INFO
+        and not capturing_logs()
+    )
+    if interactive:
         spinner: SpinnerInterface = InteractiveSpinner(message)
     else:
         spinner = NonInteractiveSpinner(message)
     try:
-        with hidden_cursor(sys.stdout):
+        with hidden_cursor(sys.stdout) if interactive else contextlib.nullcontext():
             yield spinner
     except KeyboardInterrupt:
         spinner.finish("canceled")
@@ -53,6 +53,11 @@ commands_dict: Dict[str, CommandInfo] = {
         "ShowCommand",
         "Show information about installed packages.",
     ),
+    "compile-pending": CommandInfo(
+        "pip._internal.commands.compile_pending",
+        "CompilePendingCommand",
+        "Compile installed packages whose compilation was deferred.",
+    ),
     "check": CommandInfo(
         "pip._internal.commands.check",
         "CheckCommand",
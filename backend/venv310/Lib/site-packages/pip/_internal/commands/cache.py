@@ -101,6 +101,16 @@ class CacheCommand(Command):
             + filesystem.directory_size(old_http_cache_location)
         )
         wheels_cache_size = filesystem.format_directory_size(wheels_cache_location)
+        links_cache_location = self._cache_dir(options, "links")
+        links_cache_size = filesystem.format_directory_size(links_cache_location)
+        unpacked_location = self._cache_dir(options, "unpacked")
+        unpacked_size = filesystem.format_directory_size(unpacked_location)
+        metadata_location = self._cache_dir(options, "metadata")
+        metadata_size = filesystem.format_directory_size(metadata_location)
+        resolutions_location = self._cache_dir(options, "resolutions")
+        resolutions_size = filesystem.format_directory_size(resolutions_location)
+        build_envs_location = self._cache_dir(options, "build-envs")
+        build_envs_size = filesystem.format_directory_size(build_envs_location)
 
         message = (
             textwrap.dedent(
@@ -109,9 +119,19 @@ class CacheCommand(Command):
                     Package index page cache location (older pips): {old_http_cache_location}
                     Package index page cache size: {http_cache_size}
                     Number of HTTP files: {num_http_files}
+                    Parsed index page links location: {links_cache_location}
+                    Parsed index page links size: {links_cache_size}
                     Locally built wheels location: {wheels_cache_location}
                     Locally built wheels size: {wheels_cache_size}
                     Number of locally built wheels: {package_count}
+                    Unpacked wheel store location: {unpacked_location}
+                    Unpacked wheel store size: {unpacked_size}
+                    Distribution metadata location: {metadata_location}
+                    Distribution metadata size: {metadata_size}
+                    Resolution results location: {resolutions_location}
+                    Resolution results size: {resolutions_size}
+                    Build environments location: {build_envs_location}
+                    Build environments size: {build_envs_size}
                 """  # noqa: E501
             )
             .format(
@@ -119,9 +139,19 @@ class CacheCommand(Command):
                 old_http_cache_location=old_http_cache_location,
                 http_cache_size=http_cache_size,
                 num_http_files=num_http_files,
+                links_cache_location=links_cache_location,
+                links_cache_size=links_cache_size,
                 wheels_cache_location=wheels_cache_location,
                 package_count=num_packages,
                 wheels_cache_size=wheels_cache_size,
+                unpacked_location=unpacked_location,
+                unpacked_size=unpacked_size,
+                metadata_location=metadata_location,
+                metadata_size=metadata_size,
+                resolutions_location=resolutions_location,
+                resolutions_size=resolutions_size,
+                build_envs_location=build_envs_location,
+                build_envs_size=build_envs_size,
             )
             .strip()
         )
@@ -171,8 +201,13 @@ class CacheCommand(Command):
 
         no_matching_msg = "No matching packages"
         if args[0] == "*":
-            # Only fetch http files if no specific pattern given
+            # Only fetch http and link files if no specific pattern given
             files += self._find_http_files(options)
+            files += self._find_link_files(options)
+            files += self._find_unpacked_files(options)
+            files += self._find_metadata_files(options)
+            files += self._find_resolution_files(options)
+            files += self._find_build_env_files(options)
         else:
             # Add the pattern to the log message
             no_matching_msg += f' for pattern "{args[0]}"'
@@ -201,6 +236,26 @@ class CacheCommand(Command):
             new_http_dir, "*"
         )
 
+    def _find_link_files(self, options: Values) -> List[str]:
+        links_dir = self._cache_dir(options, "links")
+        return filesystem.find_files(links_dir, "*")
+
+    def _find_unpacked_files(self, options: Values) -> List[str]:
+        unpacked_dir = self._cache_dir(options, "unpacked")
+        return filesystem.find_files(unpacked_dir, "*")
+
+    def _find_metadata_files(self, options: Values) -> List[str]:
+        metadata_dir = self._cache_dir(options, "metadata")
+        return filesystem.find_files(metadata_dir, "*")
+
+    def _find_resolution_files(self, options: Values) -> List[str]:
+        resolutions_dir = self._cache_dir(options, "resolutions")
+        return filesystem.find_files(resolutions_dir, "*")
+
+    def _find_build_env_files(self, options: Values) -> List[str]:
+        build_envs_dir = self._cache_dir(options, "build-envs")
+        return filesystem.find_files(build_envs_dir, "*")
+
     def _find_wheels(self, options: Values, pattern: str) -> List[str]:
         wheel_dir = self._cache_dir(options, "wheels")
 
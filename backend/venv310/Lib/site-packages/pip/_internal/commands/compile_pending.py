@@ -0,0 +1,57 @@
+import logging
+from optparse import Values
+from typing import List
+
+from pip._internal.cli import cmdoptions
+from pip._internal.cli.base_command import Command
+from pip._internal.cli.status_codes import SUCCESS
+from pip._internal.metadata import get_environment
+from pip._internal.operations.install.bytecode import (
+    BytecodeCompiler,
+    compile_pending,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CompilePendingCommand(Command):
+    """
+    Compile the Python source files of installed packages to bytecode, when
+    their compilation was deferred by 'pip install --deferred-compile'.
+    """
+
+    ignore_require_venv = True
+    usage = """
+      %prog [options]"""
+
+    def add_options(self) -> None:
+        self.cmd_opts.add_option(
+            cmdoptions.PipOption(
+                "--path",
+                dest="path",
+                type="path",
+                action="append",
+                help=(
+                    "Restrict to the packages installed in the specified "
+                    "installation path (can be used multiple times)."
+                ),
+            )
+        )
+        self.cmd_opts.add_option(cmdoptions.compile_jobs())
+        self.parser.insert_option_group(0, self.cmd_opts)
+
+    def run(self, options: Values, args: List[str]) -> int:
+        env = get_environment(options.path)
+        compiled = []
+        with BytecodeCompiler(options.compile_jobs) as compiler:
+            for dist in env.iter_all_distributions():
+                info_location = dist.info_location
+                if info_location is None:
+                    continue
+                if compile_pending(info_location, compiler):
+                    compiled.append(dist.raw_name)
+        if compiled:
+            logger.info("Compiled %s", ", ".join(sorted(compiled)))
+        else:
+            logger.info("Nothing to compile.")
+        return SUCCESS
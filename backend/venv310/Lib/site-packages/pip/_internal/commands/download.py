@@ -10,6 +10,7 @@ from pip._internal.cli.status_codes import SUCCESS
 from pip._internal.operations.build.build_tracker import get_build_tracker
 from pip._internal.req.req_install import check_legacy_setup_py_options
 from pip._internal.utils.misc import ensure_dir, normalize_path, write_output
+from pip._internal.utils.subprocess import hook_workers
 from pip._internal.utils.temp_dir import TempDirectory
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,8 @@ class DownloadCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.pre())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_workers())
+        self.cmd_opts.add_option(cmdoptions.resume_retries())
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.no_use_pep517())
@@ -97,6 +100,8 @@ class DownloadCommand(RequirementCommand):
         )
 
         build_tracker = self.enter_context(get_build_tracker())
+        if "hook-workers" in options.features_enabled:
+            self.enter_context(hook_workers())
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -4,12 +4,15 @@ import operator
 import os
 import shutil
 import site
+import subprocess
+import sys
 from optparse import SUPPRESS_HELP, Values
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pip._vendor.rich import print_json
 
-from pip._internal.cache import WheelCache
+from pip._internal.build_env import get_runnable_pip
+from pip._internal.cache import UnpackedWheelStore, WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.req_command import (
@@ -21,6 +24,7 @@ from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, InstallationError
 from pip._internal.locations import get_scheme
 from pip._internal.metadata import get_environment
+from pip._internal.metadata.base import INSTALLED_INDEX_FILENAME
 from pip._internal.models.installation_report import InstallationReport
 from pip._internal.operations.build.build_tracker import get_build_tracker
 from pip._internal.operations.check import ConflictDetails, check_install_conflicts
@@ -39,6 +43,7 @@ from pip._internal.utils.misc import (
     protect_pip_from_modification_on_windows,
     write_output,
 )
+from pip._internal.utils.subprocess import hook_workers
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.virtualenv import (
     running_under_virtualenv,
@@ -217,6 +222,33 @@ class InstallCommand(RequirementCommand):
             help="Do not compile Python source files to bytecode",
         )
 
+        self.cmd_opts.add_option(
+            "--deferred-compile",
+            action="store_true",
+            dest="deferred_compile",
+            default=False,
+            help=(
+                "Compile Python source files to bytecode in the background, "
+                "once the installation has completed. Files left uncompiled "
+                "can be compiled with 'pip compile-pending'."
+            ),
+        )
+
+        self.cmd_opts.add_option(cmdoptions.compile_jobs())
+
+        self.cmd_opts.add_option(
+            "--install-workers",
+            dest="install_workers",
+            type="int",
+            default=1,
+            metavar="n",
+            help=(
+                "Number of packages to install concurrently. Packages that write "
+                "to the same paths are still installed one at a time "
+                "(default %default)."
+            ),
+        )
+
         self.cmd_opts.add_option(
             "--no-warn-script-location",
             action="store_false",
@@ -236,6 +268,9 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.prefer_binary())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_workers())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.resume_retries())
         self.cmd_opts.add_option(cmdoptions.root_user_action())
 
         index_opts = cmdoptions.make_option_group(
@@ -331,6 +366,8 @@ class InstallCommand(RequirementCommand):
             ignore_requires_python=options.ignore_requires_python,
         )
         build_tracker = self.enter_context(get_build_tracker())
+        if "hook-workers" in options.features_enabled:
+            self.enter_context(hook_workers())
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -423,6 +460,7 @@ class InstallCommand(RequirementCommand):
                 verify=True,
                 build_options=[],
                 global_options=global_options,
+                jobs=options.build_jobs,
             )
 
             if build_failures:
@@ -449,6 +487,17 @@ class InstallCommand(RequirementCommand):
             if options.target_dir or options.prefix_path:
                 warn_script_location = False
 
+            wheel_store = None
+            if "unpacked-wheel-store" in options.features_enabled:
+                if options.cache_dir:
+                    wheel_store = UnpackedWheelStore(
+                        os.path.join(options.cache_dir, "unpacked")
+                    )
+                else:
+                    logger.warning(
+                        "The unpacked wheel store is disabled, as the cache is."
+                    )
+
             installed = install_given_reqs(
                 to_install,
                 global_options,
@@ -458,6 +507,10 @@ class InstallCommand(RequirementCommand):
                 warn_script_location=warn_script_location,
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
+                compile_jobs=options.compile_jobs,
+                deferred_compile=options.deferred_compile,
+                install_workers=options.install_workers,
+                wheel_store=wheel_store,
             )
 
             lib_locations = get_lib_location_guesses(
@@ -468,6 +521,8 @@ class InstallCommand(RequirementCommand):
                 isolated=options.isolated_mode,
             )
             env = get_environment(lib_locations)
+            if not options.target_dir:
+                env.update_installed_index()
 
             installed.sort(key=operator.attrgetter("name"))
             items = []
@@ -510,10 +565,44 @@ class InstallCommand(RequirementCommand):
             self._handle_target_dir(
                 options.target_dir, target_temp_dir, options.upgrade
             )
+            lib_locations = [options.target_dir]
+            get_environment(lib_locations).update_installed_index()
+        if options.compile and options.deferred_compile and installed:
+            self._compile_pending_in_background(lib_locations, options.compile_jobs)
         if options.root_user_action == "warn":
             warn_if_run_as_root()
         return SUCCESS
 
+    def _compile_pending_in_background(
+        self, lib_locations: List[str], compile_jobs: int
+    ) -> None:
+        """Start compiling what the installation left pending, without waiting."""
+        args = [sys.executable, get_runnable_pip(), "compile-pending"]
+        args.extend(f"--path={location}" for location in lib_locations)
+        args.append(f"--compile-jobs={compile_jobs}")
+        kwargs: Dict[str, Any] = {}
+        if WINDOWS:
+            kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            kwargs["start_new_session"] = True
+        logger.debug("Compiling installed files in the background: %s", args)
+        try:
+            subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **kwargs,
+            )
+        except OSError as e:
+            logger.warning(
+                "Could not start compiling installed files in the background "
+                "(%s). Run 'pip compile-pending' to compile them.",
+                e,
+            )
+
     def _handle_target_dir(
         self, target_dir: str, target_temp_dir: TempDirectory, upgrade: bool
     ) -> None:
@@ -539,6 +628,9 @@ class InstallCommand(RequirementCommand):
 
         for lib_dir in lib_dir_list:
             for item in os.listdir(lib_dir):
+                if item == INSTALLED_INDEX_FILENAME:
+                    # Describes the temporary directory, not the target one.
+                    continue
                 if lib_dir == data_dir:
                     ddir = os.path.join(data_dir, item)
                     if any(s.startswith(ddir) for s in lib_dir_list[:-1]):
@@ -88,7 +88,7 @@ def search_packages_info(query: List[str]) -> Generator[_PackageInfo, None, None
 
     def _get_requiring_packages(current_dist: BaseDistribution) -> Iterator[str]:
         return (
-            dist.metadata["Name"] or "UNKNOWN"
+            dist.metadata_headers["Name"] or "UNKNOWN"
             for dist in installed.values()
             if current_dist.canonical_name
             in {canonicalize_name(d.name) for d in dist.iter_dependencies()}
@@ -9,6 +9,8 @@ from pip._internal.cli.base_command import Command
 from pip._internal.cli.req_command import SessionCommandMixin, warn_if_run_as_root
 from pip._internal.cli.status_codes import SUCCESS
 from pip._internal.exceptions import InstallationError
+from pip._internal.locations import get_platlib, get_purelib, user_site
+from pip._internal.metadata import get_environment
 from pip._internal.req import parse_requirements
 from pip._internal.req.constructors import (
     install_req_from_line,
@@ -101,6 +103,7 @@ class UninstallCommand(Command, SessionCommandMixin):
             modifying_pip="pip" in reqs_to_uninstall
         )
 
+        uninstalled = False
         for req in reqs_to_uninstall.values():
             uninstall_pathset = req.uninstall(
                 auto_confirm=options.yes,
@@ -108,6 +111,12 @@ class UninstallCommand(Command, SessionCommandMixin):
             )
             if uninstall_pathset:
                 uninstall_pathset.commit()
+                uninstalled = True
+        if uninstalled:
+            lib_locations = {get_purelib(), get_platlib()}
+            if user_site:
+                lib_locations.add(user_site)
+            get_environment(sorted(lib_locations)).update_installed_index()
         if options.root_user_action == "warn":
             warn_if_run_as_root()
         return SUCCESS
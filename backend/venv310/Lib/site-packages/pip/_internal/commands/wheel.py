@@ -15,6 +15,7 @@ from pip._internal.req.req_install import (
     check_legacy_setup_py_options,
 )
 from pip._internal.utils.misc import ensure_dir, normalize_path
+from pip._internal.utils.subprocess import hook_workers
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.wheel_builder import build, should_build_for_wheel_command
 
@@ -67,6 +68,9 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.ignore_requires_python())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_workers())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.resume_retries())
 
         self.cmd_opts.add_option(
             "--no-verify",
@@ -110,6 +114,8 @@ class WheelCommand(RequirementCommand):
         ensure_dir(options.wheel_dir)
 
         build_tracker = self.enter_context(get_build_tracker())
+        if "hook-workers" in options.features_enabled:
+            self.enter_context(hook_workers())
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -163,6 +169,7 @@ class WheelCommand(RequirementCommand):
             verify=(not options.no_verify),
             build_options=options.build_options or [],
             global_options=options.global_options or [],
+            jobs=options.build_jobs,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
@@ -1,6 +1,8 @@
 import abc
 from typing import Optional
 
+from pip._internal.build_env import BuildEnvironmentInstaller
+from pip._internal.cache import BuildEnvironmentCache
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata.base import BaseDistribution
 from pip._internal.req import InstallRequirement
@@ -47,5 +49,7 @@ class AbstractDistribution(metaclass=abc.ABCMeta):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache: Optional[BuildEnvironmentCache],
+        build_env_installer: Optional[BuildEnvironmentInstaller],
     ) -> None:
         raise NotImplementedError()
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from pip._internal.build_env import BuildEnvironmentInstaller
+from pip._internal.cache import BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution
@@ -25,5 +27,7 @@ class InstalledDistribution(AbstractDistribution):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache: Optional[BuildEnvironmentCache],
+        build_env_installer: Optional[BuildEnvironmentInstaller],
     ) -> None:
         pass
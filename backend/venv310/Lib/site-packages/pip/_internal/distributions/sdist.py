@@ -1,7 +1,8 @@
 import logging
 from typing import Iterable, Optional, Set, Tuple
 
-from pip._internal.build_env import BuildEnvironment
+from pip._internal.build_env import BuildEnvironment, BuildEnvironmentInstaller
+from pip._internal.cache import BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.exceptions import InstallationError
 from pip._internal.index.package_finder import PackageFinder
@@ -32,6 +33,8 @@ class SourceDistribution(AbstractDistribution):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache: Optional[BuildEnvironmentCache],
+        build_env_installer: Optional[BuildEnvironmentInstaller],
     ) -> None:
         # Load pyproject.toml, to determine whether PEP 517 is to be used
         self.req.load_pyproject_toml()
@@ -41,7 +44,7 @@ class SourceDistribution(AbstractDistribution):
         if should_isolate:
             # Setup an isolated environment and install the build backend static
             # requirements in it.
-            self._prepare_build_backend(finder)
+            self._prepare_build_backend(finder, build_env_cache, build_env_installer)
             # Check that if the requirement is editable, it either supports PEP 660 or
             # has a setup.py or a setup.cfg. This cannot be done earlier because we need
             # to setup the build backend to verify it supports build_editable, nor can
@@ -66,13 +69,18 @@ class SourceDistribution(AbstractDistribution):
                 self._raise_missing_reqs(missing)
         self.req.prepare_metadata()
 
-    def _prepare_build_backend(self, finder: PackageFinder) -> None:
+    def _prepare_build_backend(
+        self,
+        finder: PackageFinder,
+        build_env_cache: Optional[BuildEnvironmentCache],
+        build_env_installer: Optional[BuildEnvironmentInstaller],
+    ) -> None:
         # Isolate in a BuildEnvironment and install the build-time
         # requirements.
         pyproject_requires = self.req.pyproject_requires
         assert pyproject_requires is not None
 
-        self.req.build_env = BuildEnvironment()
+        self.req.build_env = BuildEnvironment(build_env_cache, build_env_installer)
         self.req.build_env.install_requirements(
             finder, pyproject_requires, "overlay", kind="build dependencies"
         )
@@ -2,6 +2,8 @@ from typing import Optional
 
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.build_env import BuildEnvironmentInstaller
+from pip._internal.cache import BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import (
@@ -36,5 +38,7 @@ class WheelDistribution(AbstractDistribution):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache: Optional[BuildEnvironmentCache],
+        build_env_installer: Optional[BuildEnvironmentInstaller],
     ) -> None:
         pass
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from typing import Literal
 
     from pip._internal.metadata import BaseDistribution
+    from pip._internal.models.link import Link
     from pip._internal.req.req_install import InstallRequirement
 
 logger = logging.getLogger(__name__)
@@ -316,6 +317,36 @@ class NetworkConnectionError(PipError):
         return str(self.error_msg)
 
 
+class IncompleteDownloadError(DiagnosticPipError):
+    """Raised when the downloader receives fewer bytes than it was promised."""
+
+    reference = "incomplete-download"
+
+    def __init__(
+        self, link: "Link", received: int, expected: Optional[int], retries: int
+    ) -> None:
+        if expected is not None:
+            progress = f"{received} of {expected} bytes"
+        else:
+            progress = f"{received} bytes"
+        if retries:
+            hint = (
+                f"The download was resumed {retries} time(s) without completing. "
+                "Use --resume-retries to allow more attempts."
+            )
+        else:
+            hint = "Use --resume-retries to allow pip to resume the download."
+        super().__init__(
+            message=(
+                f"Download failed after receiving {progress} of "
+                f"{escape(str(link))}."
+            ),
+            context="The network connection was interrupted.",
+            hint_stmt=hint,
+            note_stmt="This is an issue with network connectivity, not pip.",
+        )
+
+
 class InvalidWheelFilename(InstallationError):
     """Invalid wheel filename."""
 
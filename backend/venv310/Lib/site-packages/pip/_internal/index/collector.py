@@ -5,13 +5,15 @@ The main purpose of this module is to expose LinkCollector.collect_sources().
 import collections
 import email.message
 import functools
+import hashlib
+import html
 import itertools
 import json
 import logging
 import os
+import re
 import urllib.parse
 import urllib.request
-from html.parser import HTMLParser
 from optparse import Values
 from typing import (
     TYPE_CHECKING,
@@ -32,12 +34,14 @@ from pip._vendor.requests import Response
 from pip._vendor.requests.exceptions import RetryError, SSLError
 
 from pip._internal.exceptions import NetworkConnectionError
-from pip._internal.models.link import Link
+from pip._internal.models.link import Link, MetadataFile
 from pip._internal.models.search_scope import SearchScope
+from pip._internal.network.cache import suppressed_cache_errors
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import raise_for_status
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
 from pip._internal.utils.filetypes import is_archive_file
-from pip._internal.utils.misc import redact_auth_from_url
+from pip._internal.utils.misc import ensure_dir, redact_auth_from_url
 from pip._internal.vcs import vcs
 
 from .sources import CandidatesFromPage, LinkSource, build_source
@@ -51,6 +55,13 @@ logger = logging.getLogger(__name__)
 
 ResponseHeaders = MutableMapping[str, str]
 
+# Called with the URL and yanked reason of every file on a page, before a Link
+# is created for it. Files it returns False for are skipped.
+LinkFilter = Callable[[str, Optional[str]], bool]
+
+# The ETag and Last-Modified headers of a page, or None if it was not found.
+PageValidators = Optional[Tuple[Optional[str], Optional[str]]]
+
 
 def _match_vcs_scheme(url: str) -> Optional[str]:
     """Look for VCS schemes in the URL.
@@ -230,30 +241,96 @@ def parse_links(page: "IndexContent") -> Iterable[Link]:
     """
     Parse a Simple API's Index Content, and yield its anchor elements as Link objects.
     """
+    return _parse_links(page)
 
+
+def _parse_links(
+    page: "IndexContent", link_filter: Optional[LinkFilter] = None
+) -> Iterable[Link]:
+    """
+    Yield the Link objects of a page, skipping the files link_filter rejects
+    before any Link is created for them.
+    """
     content_type_l = page.content_type.lower()
     if content_type_l.startswith("application/vnd.pypi.simple.v1+json"):
         data = json.loads(page.content)
         for file in data.get("files", []):
+            if link_filter is not None:
+                file_url = file.get("url")
+                yanked_reason = file.get("yanked")
+                if file_url is not None and not link_filter(
+                    file_url,
+                    (
+                        (yanked_reason if isinstance(yanked_reason, str) else "")
+                        if yanked_reason
+                        else None
+                    ),
+                ):
+                    continue
             link = Link.from_json(file, page.url)
             if link is None:
                 continue
             yield link
         return
 
-    parser = HTMLLinkParser(page.url)
     encoding = page.encoding or "utf-8"
-    parser.feed(page.content.decode(encoding))
+    text = page.content.decode(encoding)
 
     url = page.url
-    base_url = parser.base_url or url
-    for anchor in parser.anchors:
-        link = Link.from_element(anchor, page_url=url, base_url=base_url)
+    base_url = None
+    for tag, attrs in _iter_html_tags(text):
+        if tag == "base":
+            if base_url is None:
+                base_url = attrs.get("href")
+            continue
+        if link_filter is not None:
+            href = attrs.get("href")
+            if href and not link_filter(href, attrs.get("data-yanked")):
+                continue
+        link = Link.from_element(attrs, page_url=url, base_url=base_url or url)
         if link is None:
             continue
         yield link
 
 
+# Comments, and the contents of <script> and <style>, which are not markup.
+_HTML_SKIPPED_RE = re.compile(
+    r"<!--.*?-->"
+    r"""|<(script|style)(?=[\s/>])(?:[^>"']|"[^"]*"|'[^']*')*>.*?(?:</\1\s*>|\Z)""",
+    re.DOTALL | re.IGNORECASE,
+)
+_HTML_TAG_RE = re.compile(
+    r"""<(a|base)(?=[\s/>])((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE
+)
+_HTML_ATTRIBUTE_RE = re.compile(
+    r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?"""
+)
+
+
+def _iter_html_tags(text: str) -> Iterable[Tuple[str, Dict[str, Optional[str]]]]:
+    """
+    Yield the name and attributes of the <a> and <base> tags of an HTML page.
+
+    Simple API pages are flat lists of anchors, so the page is not tokenized:
+    comments and the contents of <script> and <style> are dropped, and the two
+    tags are matched directly, in the order they appear. Tag and attribute
+    names are lowercased, attribute values may be quoted or bare and have their
+    character references unescaped, and an attribute without a value maps to
+    None. If an attribute is repeated, the last value wins.
+    """
+    if "<!--" in text or "<s" in text or "<S" in text:
+        text = _HTML_SKIPPED_RE.sub("", text)
+    for match in _HTML_TAG_RE.finditer(text):
+        attrs: Dict[str, Optional[str]] = {}
+        for attr in _HTML_ATTRIBUTE_RE.finditer(match[2]):
+            name, double, single, bare = attr.groups()
+            value = next((v for v in (double, single, bare) if v is not None), None)
+            if value is not None and "&" in value:
+                value = html.unescape(value)
+            attrs[name.lower()] = value
+        yield match[1].lower(), attrs
+
+
 class IndexContent:
     """Represents one response (or page), along with its URL"""
 
@@ -264,6 +341,8 @@ class IndexContent:
         encoding: Optional[str],
         url: str,
         cache_link_parsing: bool = True,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
     ) -> None:
         """
         :param encoding: the encoding to decode the given content.
@@ -271,43 +350,125 @@ class IndexContent:
         :param cache_link_parsing: whether links parsed from this page's url
                                    should be cached. PyPI index urls should
                                    have this set to False, for example.
+        :param etag: the ETag header of the response, if any.
+        :param last_modified: the Last-Modified header of the response, if any.
         """
         self.content = content
         self.content_type = content_type
         self.encoding = encoding
         self.url = url
         self.cache_link_parsing = cache_link_parsing
+        self.etag = etag
+        self.last_modified = last_modified
 
     def __str__(self) -> str:
         return redact_auth_from_url(self.url)
 
 
-class HTMLLinkParser(HTMLParser):
-    """
-    HTMLParser that keeps the first base HREF and a list of all anchor
-    elements' attributes.
+class ParsedLinksCache:
+    """A persistent cache of the links parsed from index pages.
+
+    Entries are keyed by the page's URL and the validators (ETag and
+    Last-Modified) of the response it came in, so a page the HTTP cache only
+    had to revalidate is not parsed again. Pages without validators are not
+    cached. Once the cache grows over max_size bytes, the least recently used
+    entries are evicted; this is checked once per run, on the first write.
     """
 
-    def __init__(self, url: str) -> None:
-        super().__init__(convert_charrefs=True)
-
-        self.url: str = url
-        self.base_url: Optional[str] = None
-        self.anchors: List[Dict[str, Optional[str]]] = []
-
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
-        if tag == "base" and self.base_url is None:
-            href = self.get_href(attrs)
-            if href is not None:
-                self.base_url = href
-        elif tag == "a":
-            self.anchors.append(dict(attrs))
-
-    def get_href(self, attrs: List[Tuple[str, Optional[str]]]) -> Optional[str]:
-        for name, value in attrs:
-            if name == "href":
-                return value
-        return None
+    def __init__(self, directory: str, max_size: int = 100 * 1000 * 1000) -> None:
+        assert directory is not None, "Cache directory must not be None."
+        self.directory = directory
+        self.max_size = max_size
+        self._evicted = False
+
+    def _get_cache_path(self, page: IndexContent) -> Optional[str]:
+        if not page.etag and not page.last_modified:
+            return None
+        key = json.dumps(
+            [page.url, page.content_type, page.etag, page.last_modified],
+            separators=(",", ":"),
+        )
+        hashed = hashlib.sha224(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, hashed[:2], hashed[2:])
+
+    def get(
+        self, page: IndexContent, link_filter: Optional[LinkFilter] = None
+    ) -> Optional[List[Link]]:
+        path = self._get_cache_path(page)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                entries = json.loads(f.read())
+            # Record the access, for the eviction of least recently used entries.
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        links = []
+        for url, requires_python, yanked_reason, hashes, metadata in entries:
+            if link_filter is not None and not link_filter(url, yanked_reason):
+                continue
+            links.append(
+                Link(
+                    url,
+                    comes_from=page.url,
+                    requires_python=requires_python,
+                    yanked_reason=yanked_reason,
+                    metadata_file_data=(
+                        None if metadata is None else MetadataFile(metadata[0])
+                    ),
+                    cache_link_parsing=page.cache_link_parsing,
+                    hashes=hashes,
+                )
+            )
+        return links
+
+    def set(self, page: IndexContent, links: Iterable[Link]) -> None:
+        path = self._get_cache_path(page)
+        if path is None:
+            return
+        entries = [
+            [
+                link.url,
+                link.requires_python,
+                link.yanked_reason,
+                link._hashes,
+                (
+                    None
+                    if link.metadata_file_data is None
+                    else [link.metadata_file_data.hashes]
+                ),
+            ]
+            for link in links
+        ]
+        data = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(data)
+            replace(f.name, path)
+            if not self._evicted:
+                self._evicted = True
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                with suppressed_cache_errors():
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total_size += stat.st_size
+        if total_size <= self.max_size:
+            return
+        for _, size, path in sorted(entries):
+            with suppressed_cache_errors():
+                os.remove(path)
+                total_size -= size
+            if total_size <= self.max_size:
+                break
 
 
 def _handle_get_simple_fail(
@@ -330,6 +491,8 @@ def _make_index_content(
         encoding=encoding,
         url=response.url,
         cache_link_parsing=cache_link_parsing,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
     )
 
 
@@ -412,9 +575,13 @@ class LinkCollector:
         self,
         session: PipSession,
         search_scope: SearchScope,
+        links_cache: Optional[ParsedLinksCache] = None,
     ) -> None:
         self.search_scope = search_scope
         self.session = session
+        self.links_cache = links_cache
+        # The validators of every page fetched so far, by the URL requested.
+        self.page_validators: Dict[str, PageValidators] = {}
 
     @classmethod
     def create(
@@ -444,9 +611,15 @@ class LinkCollector:
             index_urls=index_urls,
             no_index=options.no_index,
         )
+        cache_dir = getattr(options, "cache_dir", None)
         link_collector = LinkCollector(
             session=session,
             search_scope=search_scope,
+            links_cache=(
+                ParsedLinksCache(os.path.join(cache_dir, "links"))
+                if cache_dir
+                else None
+            ),
         )
         return link_collector
 
@@ -458,7 +631,45 @@ class LinkCollector:
         """
         Fetch an HTML page containing package links.
         """
-        return _get_index_content(location, session=self.session)
+        page = _get_index_content(location, session=self.session)
+        if page is None:
+            self.page_validators[location.url] = None
+        else:
+            self.page_validators[location.url] = (page.etag, page.last_modified)
+        return page
+
+    def get_page_validators(self, url: str) -> PageValidators:
+        """
+        Get the validators of a page, fetching it unless it was already.
+        """
+        if url not in self.page_validators:
+            self.fetch_response(Link(url))
+        return self.page_validators[url]
+
+    def parse_links(
+        self, page: IndexContent, link_filter: Optional[LinkFilter] = None
+    ) -> List[Link]:
+        """
+        Parse the links of a page, reusing the result of a previous run if the
+        page has not changed since.
+
+        :param link_filter: if given, only the files it accepts are returned.
+        """
+        if self.links_cache is not None:
+            links = self.links_cache.get(page, link_filter)
+            if links is not None:
+                return links
+        elif not page.cache_link_parsing:
+            # Nothing keeps the links of the page around, so skip unwanted
+            # files while parsing instead of creating Links for all of them.
+            return list(_parse_links(page, link_filter))
+
+        links = list(parse_links(page))
+        if self.links_cache is not None:
+            self.links_cache.set(page, links)
+        if link_filter is None:
+            return links
+        return [link for link in links if link_filter(link.url, link.yanked_reason)]
 
     def collect_sources(
         self,
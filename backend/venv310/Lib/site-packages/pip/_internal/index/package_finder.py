@@ -4,14 +4,27 @@ import enum
 import functools
 import itertools
 import logging
+import posixpath
 import re
-from typing import TYPE_CHECKING, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+import threading
+import urllib.parse
+from concurrent.futures import Executor, Future
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.tags import Tag
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import _BaseVersion
-from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.exceptions import (
     BestVersionAlreadyInstalled,
@@ -19,7 +32,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import LinkCollector, PageValidators
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
@@ -28,12 +41,13 @@ from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.models.target_python import TargetPython
 from pip._internal.models.wheel import Wheel
 from pip._internal.req import InstallRequirement
-from pip._internal.utils._log import getLogger
+from pip._internal.utils._log import VERBOSE, getLogger
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.logging import indent_log
 from pip._internal.utils.misc import build_netloc
 from pip._internal.utils.packaging import check_requires_python
+from pip._internal.utils.specifiers import filter_versions, parse_version
 from pip._internal.utils.unpacking import SUPPORTED_EXTENSIONS
 
 if TYPE_CHECKING:
@@ -154,6 +168,34 @@ class LinkEvaluator:
 
         self.project_name = project_name
 
+    def prefilter_link(self, url: str, yanked_reason: Optional[str]) -> bool:
+        """
+        Cheaply tell whether a file of an index page can be a candidate at all.
+
+        This is called with the raw attributes of a file while its page is
+        parsed, so that most incompatible files are skipped before a Link is
+        created for them. It only rejects files evaluate_link() would reject
+        too; anything it lets through is still evaluated in full. Files are
+        not rejected for their requires-python here, as evaluate_link() records
+        those for the resolver to report.
+        """
+        if yanked_reason is not None and not self._allow_yanked:
+            return False
+
+        path, _, fragment = url.partition("#")
+        if not path.endswith(WHEEL_EXTENSION) or "egg=" in fragment:
+            return True
+        if "binary" not in self._formats:
+            return False
+        filename = posixpath.basename(urllib.parse.urlsplit(path).path)
+        try:
+            wheel = Wheel(urllib.parse.unquote(filename))
+        except InvalidWheelFilename:
+            return False
+        if canonicalize_name(wheel.name) != self._canonical_name:
+            return False
+        return wheel.supported(self._target_python.get_unsorted_tags())
+
     def evaluate_link(self, link: Link) -> Tuple[LinkType, str]:
         """
         Determine whether a link is a candidate for installation.
@@ -423,6 +465,7 @@ class CandidateEvaluator:
             prefer_binary=prefer_binary,
             allow_all_prereleases=allow_all_prereleases,
             hashes=hashes,
+            tag_priorities=target_python.get_tag_priorities(),
         )
 
     def __init__(
@@ -433,10 +476,13 @@ class CandidateEvaluator:
         prefer_binary: bool = False,
         allow_all_prereleases: bool = False,
         hashes: Optional[Hashes] = None,
+        tag_priorities: Optional[Dict[Tag, int]] = None,
     ) -> None:
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: A mapping from each of supported_tags to its
+            index, if already computed (see TargetPython.get_tag_priorities).
         """
         self._allow_all_prereleases = allow_all_prereleases
         self._hashes = hashes
@@ -447,9 +493,9 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = {tag: idx for idx, tag in enumerate(supported_tags)}
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -463,7 +509,8 @@ class CandidateEvaluator:
         specifier = self._specifier
         versions = {
             str(v)
-            for v in specifier.filter(
+            for v in filter_versions(
+                specifier,
                 # We turn the version object into a str here because otherwise
                 # when we're debundled but setuptools isn't, Python will see
                 # packaging.version.Version and
@@ -509,7 +556,7 @@ class CandidateEvaluator:
         If not finding wheels, they are sorted by version only.
         If finding wheels, then the sort order is by version, then:
           1. existing installs
-          2. wheels ordered via Wheel.support_index_min(self._supported_tags)
+          2. wheels ordered via Wheel.find_most_preferred_tag()
           3. source archives
         If prefer_binary was set, then all wheels are sorted above sources.
 
@@ -629,6 +676,12 @@ class PackageFinder:
         # These are boring links that have already been logged somehow.
         self._logged_links: Set[Tuple[Link, LinkType, str]] = set()
 
+        # Candidates being looked up in the background, by project name.
+        self._prefetched_candidates: Dict[
+            str, "Future[List[InstallationCandidate]]"
+        ] = {}
+        self._prefetch_lock = threading.Lock()
+
     # Don't include an allow_yanked default value to make sure each call
     # site considers whether yanked releases are allowed. This also causes
     # that decision to be made explicit in the calling code, which helps
@@ -685,6 +738,14 @@ class PackageFinder:
     def index_urls(self) -> List[str]:
         return self.search_scope.index_urls
 
+    @property
+    def page_validators(self) -> Dict[str, PageValidators]:
+        """The validators of the index pages fetched so far, by URL."""
+        return dict(self._link_collector.page_validators)
+
+    def get_page_validators(self, url: str) -> PageValidators:
+        return self._link_collector.get_page_validators(url)
+
     @property
     def trusted_hosts(self) -> Iterable[str]:
         for host_port in self._link_collector.session.pip_trusted_origins:
@@ -792,7 +853,14 @@ class PackageFinder:
         if index_response is None:
             return []
 
-        page_links = list(parse_links(index_response))
+        # Skipping incompatible files early loses the reason each of them is
+        # skipped for, so keep evaluating every link when those are logged.
+        page_links = self._link_collector.parse_links(
+            index_response,
+            link_filter=(
+                None if logger.isEnabledFor(VERBOSE) else link_evaluator.prefilter_link
+            ),
+        )
 
         with indent_log():
             package_links = self.evaluate_links(
@@ -802,6 +870,27 @@ class PackageFinder:
 
         return package_links
 
+    def prefetch(self, project_names: Iterable[str], executor: Executor) -> None:
+        """Start looking up the candidates of project_names in the background.
+
+        The index pages of all the projects are then fetched concurrently,
+        instead of one by one as find_all_candidates() gets to each of them.
+        """
+        with self._prefetch_lock:
+            for project_name in project_names:
+                if project_name in self._prefetched_candidates:
+                    continue
+                self._prefetched_candidates[project_name] = executor.submit(
+                    self._find_all_candidates, project_name
+                )
+
+    def cancel_prefetch(self) -> None:
+        """Cancel the lookups queued by prefetch() that have not started yet."""
+        with self._prefetch_lock:
+            for project_name, future in list(self._prefetched_candidates.items()):
+                if future.cancel():
+                    del self._prefetched_candidates[project_name]
+
     @functools.lru_cache(maxsize=None)
     def find_all_candidates(self, project_name: str) -> List[InstallationCandidate]:
         """Find all available InstallationCandidate for project_name
@@ -812,6 +901,36 @@ class PackageFinder:
         See LinkEvaluator.evaluate_link() for details on which files
         are accepted.
         """
+        owned: Optional["Future[List[InstallationCandidate]]"] = None
+        with self._prefetch_lock:
+            future = self._prefetched_candidates.get(project_name)
+            # A prefetch that has not started yet is taken over by this call,
+            # as the workers may all be busy waiting for it to return.
+            if future is not None and future.cancel():
+                future = None
+                owned = Future()
+                owned.set_running_or_notify_cancel()
+                self._prefetched_candidates[project_name] = owned
+
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                # Look again to report the error the way we normally would.
+                logger.debug("Prefetching %s failed: %s", project_name, e)
+            return self._find_all_candidates(project_name)
+
+        if owned is None:
+            return self._find_all_candidates(project_name)
+        try:
+            candidates = self._find_all_candidates(project_name)
+        except BaseException as e:
+            owned.set_exception(e)
+            raise
+        owned.set_result(candidates)
+        return candidates
+
+    def _find_all_candidates(self, project_name: str) -> List[InstallationCandidate]:
         link_evaluator = self.make_link_evaluator(project_name)
 
         collected_sources = self._link_collector.collect_sources(
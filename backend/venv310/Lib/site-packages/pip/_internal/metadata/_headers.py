@@ -0,0 +1,19 @@
+import email.message
+import email.parser
+import re
+
+# Like in email.feedparser, the header section ends at the first line that
+# starts with a line break.
+_END_OF_HEADERS_RE = re.compile(r"^[\r\n]", re.MULTILINE)
+
+
+def parse_metadata_headers(text: str) -> email.message.Message:
+    """Parse the header section of a core metadata file's content.
+
+    The body, which holds the description of the project from Metadata 2.1
+    onwards and can be huge, is neither parsed nor kept in the message.
+    """
+    match = _END_OF_HEADERS_RE.search(text)
+    if match is not None:
+        text = text[: match.start()]
+    return email.parser.HeaderParser().parsestr(text)
@@ -50,6 +50,10 @@ DistributionVersion = Union[LegacyVersion, Version]
 
 InfoPath = Union[str, pathlib.PurePath]
 
+# Where a backend may keep an index of the distributions installed in a
+# directory, in that directory.
+INSTALLED_INDEX_FILENAME = ".pip-installed-index.json"
+
 logger = logging.getLogger(__name__)
 
 
@@ -404,6 +408,28 @@ class BaseDistribution(Protocol):
         """
         return self._metadata_cached()
 
+    def _metadata_headers_impl(self) -> email.message.Message:
+        raise NotImplementedError()
+
+    @functools.lru_cache(maxsize=1)
+    def _metadata_headers_cached(self) -> email.message.Message:
+        headers = self._metadata_headers_impl()
+        self._add_egg_info_requires(headers)
+        return headers
+
+    @property
+    def metadata_headers(self) -> email.message.Message:
+        """Headers of the distribution's metadata, without its body.
+
+        This is what to use instead of ``metadata`` for anything but the
+        description, which the body of METADATA holds, since parsing long
+        descriptions is slow.
+
+        :raises NoneMetadataError: If the metadata file is available, but does
+            not contain valid metadata.
+        """
+        return self._metadata_headers_cached()
+
     @property
     def metadata_dict(self) -> Dict[str, Any]:
         """PEP 566 compliant JSON-serializable representation of METADATA or PKG-INFO.
@@ -418,14 +444,14 @@ class BaseDistribution(Protocol):
     @property
     def metadata_version(self) -> Optional[str]:
         """Value of "Metadata-Version:" in distribution metadata, if available."""
-        return self.metadata.get("Metadata-Version")
+        return self.metadata_headers.get("Metadata-Version")
 
     @property
     def raw_name(self) -> str:
         """Value of "Name:" in distribution metadata."""
         # The metadata should NEVER be missing the Name: key, but if it somehow
         # does, fall back to the known canonical name.
-        return self.metadata.get("Name", self.canonical_name)
+        return self.metadata_headers.get("Name", self.canonical_name)
 
     @property
     def requires_python(self) -> SpecifierSet:
@@ -434,7 +460,7 @@ class BaseDistribution(Protocol):
         If the key does not exist or contains an invalid value, an empty
         SpecifierSet should be returned.
         """
-        value = self.metadata.get("Requires-Python")
+        value = self.metadata_headers.get("Requires-Python")
         if value is None:
             return SpecifierSet()
         try:
@@ -612,6 +638,13 @@ class BaseEnvironment:
         """
         raise NotImplementedError()
 
+    def update_installed_index(self) -> None:
+        """Update the persistent index of the distributions in each location.
+
+        pip calls this on the locations it installed into or uninstalled from.
+        Backends that keep no such index do nothing.
+        """
+
     def _iter_distributions(self) -> Iterator["BaseDistribution"]:
         """Iterate through installed distributions.
 
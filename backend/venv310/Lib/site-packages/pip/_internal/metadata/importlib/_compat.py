@@ -1,5 +1,8 @@
+import email.message
 import importlib.metadata
-from typing import Any, Optional, Protocol, cast
+from typing import Optional, Protocol
+
+from pip._internal.metadata._headers import parse_metadata_headers
 
 
 class BadMetadata(ValueError):
@@ -43,13 +46,29 @@ def get_info_location(d: importlib.metadata.Distribution) -> Optional[BasePath]:
     return getattr(d, "_path", None)
 
 
+def read_metadata_headers(
+    dist: importlib.metadata.Distribution,
+) -> email.message.Message:
+    """Parse the headers of the distribution's metadata, but not its body.
+
+    The headers are read from the same file as ``metadata`` reads them.
+    """
+    text = (
+        dist.read_text("METADATA")
+        or dist.read_text("PKG-INFO")
+        # Old egg-info files, see importlib.metadata.Distribution.metadata.
+        or dist.read_text("")
+        or ""
+    )
+    return parse_metadata_headers(text)
+
+
 def get_dist_name(dist: importlib.metadata.Distribution) -> str:
     """Get the distribution's project name.
 
-    The ``name`` attribute is only available in Python 3.10 or later. We are
-    targeting exactly that, but Mypy does not know this.
+    This is the ``name`` attribute, without parsing the whole metadata.
     """
-    name = cast(Any, dist).name
+    name = read_metadata_headers(dist).get("Name")
     if not isinstance(name, str):
         raise BadMetadata(dist, reason="invalid metadata entry 'name'")
     return name
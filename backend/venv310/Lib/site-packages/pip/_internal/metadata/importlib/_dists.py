@@ -3,16 +3,7 @@ import importlib.metadata
 import os
 import pathlib
 import zipfile
-from typing import (
-    Collection,
-    Dict,
-    Iterable,
-    Iterator,
-    Mapping,
-    Optional,
-    Sequence,
-    cast,
-)
+from typing import Collection, Iterable, Iterator, List, Mapping, Optional, cast
 
 from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
@@ -26,11 +17,14 @@ from pip._internal.metadata.base import (
     InfoPath,
     Wheel,
 )
+from pip._internal.utils.markers import evaluate_marker
 from pip._internal.utils.misc import normalize_path
+from pip._internal.utils.packaging import get_requirement
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.wheel import parse_wheel, read_wheel_metadata_file
 
-from ._compat import BasePath, get_dist_name
+from ._compat import BasePath, get_dist_name, read_metadata_headers
+from ._index import IndexedMetadata
 
 
 class WheelDistribution(importlib.metadata.Distribution):
@@ -174,7 +168,7 @@ class Distribution(BaseDistribution):
 
     @property
     def version(self) -> DistributionVersion:
-        return parse_version(self._dist.version)
+        return parse_version(self.metadata_headers["Version"])
 
     def is_file(self, path: InfoPath) -> bool:
         return self._dist.read_text(str(path)) is not None
@@ -206,22 +200,62 @@ class Distribution(BaseDistribution):
         # until upstream can improve the protocol. (python/cpython#94952)
         return cast(email.message.Message, self._dist.metadata)
 
+    def _metadata_headers_impl(self) -> email.message.Message:
+        return read_metadata_headers(self._dist)
+
+    def _get_provides_extra(self) -> List[str]:
+        return self.metadata_headers.get_all("Provides-Extra", [])
+
+    def _get_requires_dist(self) -> List[str]:
+        return self.metadata_headers.get_all("Requires-Dist", [])
+
     def iter_provided_extras(self) -> Iterable[str]:
-        return self.metadata.get_all("Provides-Extra", [])
+        return self._get_provides_extra()
 
     def is_extra_provided(self, extra: str) -> bool:
         return any(
             canonicalize_name(provided_extra) == canonicalize_name(extra)
-            for provided_extra in self.metadata.get_all("Provides-Extra", [])
+            for provided_extra in self._get_provides_extra()
         )
 
     def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
-        contexts: Sequence[Dict[str, str]] = [{"extra": e} for e in extras]
-        for req_string in self.metadata.get_all("Requires-Dist", []):
-            req = Requirement(req_string)
+        for req_string in self._get_requires_dist():
+            req = get_requirement(req_string)
             if not req.marker:
                 yield req
-            elif not extras and req.marker.evaluate({"extra": ""}):
+            elif not extras and evaluate_marker(req.marker, ""):
                 yield req
-            elif any(req.marker.evaluate(context) for context in contexts):
+            elif any(evaluate_marker(req.marker, extra) for extra in extras):
                 yield req
+
+
+class IndexedDistribution(Distribution):
+    """An installed distribution whose metadata was found in the installed index.
+
+    Only the metadata kept in the index is served from it; anything else is
+    read from the distribution's files as usual.
+    """
+
+    def __init__(
+        self,
+        dist: importlib.metadata.Distribution,
+        info_location: Optional[BasePath],
+        installed_location: Optional[BasePath],
+        indexed: IndexedMetadata,
+    ) -> None:
+        super().__init__(dist, info_location, installed_location)
+        self._indexed = indexed
+
+    @property
+    def raw_name(self) -> str:
+        return self._indexed.name
+
+    @property
+    def version(self) -> DistributionVersion:
+        return parse_version(self._indexed.version)
+
+    def _get_provides_extra(self) -> List[str]:
+        return self._indexed.provides_extra
+
+    def _get_requires_dist(self) -> List[str]:
+        return self._indexed.requires_dist
@@ -16,7 +16,8 @@ from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 
 from ._compat import BadMetadata, BasePath, get_dist_name, get_info_location
-from ._dists import Distribution
+from ._dists import Distribution, IndexedDistribution
+from ._index import IndexedMetadata, InstalledIndex, get_lookup_index
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,23 @@ def _looks_like_wheel(location: str) -> bool:
     return zipfile.is_zipfile(location)
 
 
+def _get_indexed_metadata(
+    dist: importlib.metadata.Distribution, info_location: pathlib.Path, name: str
+) -> Optional[IndexedMetadata]:
+    if not info_location.name.endswith(".dist-info"):
+        return None
+    metadata = Distribution(dist, info_location, info_location.parent).metadata_headers
+    version = metadata.get("Version")
+    if not isinstance(version, str):
+        return None
+    return IndexedMetadata(
+        name,
+        version,
+        metadata.get_all("Requires-Dist", []),
+        metadata.get_all("Provides-Extra", []),
+    )
+
+
 class _DistributionFinder:
     """Finder to locate distributions.
 
@@ -44,13 +62,23 @@ class _DistributionFinder:
     installations as well. It's useful feature, after all.
     """
 
-    FoundResult = Tuple[importlib.metadata.Distribution, Optional[BasePath]]
+    FoundResult = Tuple[
+        importlib.metadata.Distribution,
+        Optional[BasePath],
+        Optional[IndexedMetadata],
+    ]
 
     def __init__(self) -> None:
         self._found_names: Set[NormalizedName] = set()
 
-    def _find_impl(self, location: str) -> Iterator[FoundResult]:
-        """Find distributions in a location."""
+    def _find_impl(
+        self, location: str, index: Optional[InstalledIndex] = None
+    ) -> Iterator[FoundResult]:
+        """Find distributions in a location.
+
+        If an index of the location is given, the metadata of distributions is
+        looked up in it, and what is not is added to it.
+        """
         # Skip looking inside a wheel. Since a package inside a wheel is not
         # always valid (due to .data directories etc.), its .dist-info entry
         # should not be considered an installed distribution.
@@ -60,28 +88,73 @@ class _DistributionFinder:
         # paths one by one, instead of dumping the list to importlib.metadata.
         for dist in importlib.metadata.distributions(path=[location]):
             info_location = get_info_location(dist)
-            try:
-                raw_name = get_dist_name(dist)
-            except BadMetadata as e:
-                logger.warning("Skipping %s due to %s", info_location, e.reason)
-                continue
+            indexed: Optional[IndexedMetadata] = None
+            if index is not None and info_location is not None:
+                indexed = index.get(info_location.name)
+            if indexed is not None:
+                raw_name = indexed.name
+            else:
+                try:
+                    raw_name = get_dist_name(dist)
+                except BadMetadata as e:
+                    logger.warning("Skipping %s due to %s", info_location, e.reason)
+                    continue
+                if index is not None and isinstance(info_location, pathlib.Path):
+                    indexed = _get_indexed_metadata(dist, info_location, raw_name)
+                    if indexed is not None:
+                        index.add(info_location.name, indexed)
             normalized_name = canonicalize_name(raw_name)
             if normalized_name in self._found_names:
                 continue
             self._found_names.add(normalized_name)
-            yield dist, info_location
+            yield dist, info_location, indexed
+
+    def _find_in_index(
+        self, location: str, name: NormalizedName
+    ) -> Optional[List[BaseDistribution]]:
+        """Find the distribution of a project in the index of a location.
 
-    def find(self, location: str) -> Iterator[BaseDistribution]:
+        Returns None if the index cannot tell.
+        """
+        index = get_lookup_index(location)
+        if index is None:
+            return None
+        info_name = index.find(name)
+        if info_name is None or name in self._found_names:
+            return []
+        indexed = index.get(info_name)
+        if indexed is None:
+            return None
+        self._found_names.add(name)
+        info_location = pathlib.Path(location, info_name)
+        dist = importlib.metadata.Distribution.at(info_location)
+        return [IndexedDistribution(dist, info_location, info_location.parent, indexed)]
+
+    def find(
+        self, location: str, name: Optional[NormalizedName] = None
+    ) -> Iterator[BaseDistribution]:
         """Find distributions in a location.
 
-        The path can be either a directory, or a ZIP archive.
+        The path can be either a directory, or a ZIP archive. If a project name
+        is given, distributions of other projects may be left out.
         """
-        for dist, info_location in self._find_impl(location):
+        if name is not None:
+            found = self._find_in_index(location, name)
+            if found is not None:
+                yield from found
+                return
+        index = InstalledIndex.load(location) if os.path.isdir(location) else None
+        for dist, info_location, indexed in self._find_impl(location, index):
             if info_location is None:
                 installed_location: Optional[BasePath] = None
             else:
                 installed_location = info_location.parent
-            yield Distribution(dist, info_location, installed_location)
+            if indexed is None:
+                yield Distribution(dist, info_location, installed_location)
+            else:
+                yield IndexedDistribution(
+                    dist, info_location, installed_location, indexed
+                )
 
     def find_linked(self, location: str) -> Iterator[BaseDistribution]:
         """Read location in egg-link files and return distributions in there.
@@ -104,7 +177,7 @@ class _DistributionFinder:
             if not target_rel:
                 continue
             target_location = str(path.joinpath(target_rel))
-            for dist, info_location in self._find_impl(target_location):
+            for dist, info_location, _ in self._find_impl(target_location):
                 yield Distribution(dist, info_location, path)
 
     def _find_eggs_in_dir(self, location: str) -> Iterator[BaseDistribution]:
@@ -170,20 +243,32 @@ class Environment(BaseEnvironment):
             return cls(sys.path)
         return cls(paths)
 
-    def _iter_distributions(self) -> Iterator[BaseDistribution]:
+    def _iter_distributions(
+        self, name: Optional[NormalizedName] = None
+    ) -> Iterator[BaseDistribution]:
         finder = _DistributionFinder()
         for location in self._paths:
-            yield from finder.find(location)
+            yield from finder.find(location, name)
             for dist in finder.find_eggs(location):
                 _emit_egg_deprecation(dist.location)
                 yield dist
             # This must go last because that's how pkg_resources tie-breaks.
             yield from finder.find_linked(location)
 
+    def update_installed_index(self) -> None:
+        for location in self._paths:
+            if not os.path.isdir(location):
+                continue
+            index = InstalledIndex.load(location)
+            for _ in _DistributionFinder()._find_impl(location, index):
+                pass
+            index.save()
+
     def get_distribution(self, name: str) -> Optional[BaseDistribution]:
+        canonical_name = canonicalize_name(name)
         matches = (
             distribution
-            for distribution in self.iter_all_distributions()
-            if distribution.canonical_name == canonicalize_name(name)
+            for distribution in self._iter_distributions(canonical_name)
+            if distribution.canonical_name == canonical_name
         )
         return next(matches, None)
@@ -0,0 +1,185 @@
+"""A persistent index of the distributions installed in a directory.
+
+Parsing the METADATA file of every installed distribution is what makes
+looking through an environment slow. The index keeps the metadata pip needs
+most often for each ``.dist-info`` directory of a location in a file next to
+them, and is trusted for a distribution only as long as its METADATA file has
+the same inode, size and modification time as when it was indexed.
+
+Only pip install and pip uninstall write the index, of the directories of the
+scheme they install into or uninstall from. Looking through an environment
+never does, so no file is left in other directories on sys.path.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
+
+from pip._internal.metadata.base import INSTALLED_INDEX_FILENAME
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.unpacking import current_umask
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FORMAT = 1
+
+# How long after a change to a location its modification time is too close to
+# the present to tell whether it has changed again since.
+_RACY_MTIME_NS = 2_000_000_000
+
+StatKey = Tuple[int, int, int]
+
+
+class IndexedMetadata(NamedTuple):
+    name: str
+    version: str
+    requires_dist: List[str]
+    provides_extra: List[str]
+
+
+def _get_stat_key(info_dir: str) -> Optional[StatKey]:
+    try:
+        st = os.stat(os.path.join(info_dir, "METADATA"))
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class InstalledIndex:
+    """The indexed metadata of the ``.dist-info`` directories of a location.
+
+    Entries are kept in the order distributions are found in the location, so
+    that the first of several distributions with the same name wins, as it
+    does when the location is looked through.
+    """
+
+    def __init__(
+        self, location: str, entries: Dict[str, Tuple[StatKey, IndexedMetadata]]
+    ) -> None:
+        self.location = location
+        self._entries = entries
+        self._found: Dict[str, Tuple[StatKey, IndexedMetadata]] = {}
+        self._changed = False
+        self._names: Optional[Dict[NormalizedName, str]] = None
+
+    @classmethod
+    def load(cls, location: str) -> "InstalledIndex":
+        path = os.path.join(location, INSTALLED_INDEX_FILENAME)
+        entries: Dict[str, Tuple[StatKey, IndexedMetadata]] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["format"] != _INDEX_FORMAT:
+                raise ValueError(f"unknown format {data['format']!r}")
+            for info_name, stat_key, *metadata in data["entries"]:
+                entries[info_name] = (tuple(stat_key), IndexedMetadata(*metadata))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring the installed index of %s: %s", location, e)
+            entries.clear()
+        return cls(location, entries)
+
+    def is_complete(self) -> bool:
+        """Whether every distribution of the location is in the index."""
+        try:
+            names = os.listdir(self.location)
+        except OSError:
+            return False
+        info_names = set()
+        for name in names:
+            lowered = name.lower()
+            if lowered.endswith(".egg-info"):
+                # Their metadata is never indexed.
+                return False
+            if lowered.endswith(".dist-info"):
+                info_names.add(name)
+        return info_names == self._entries.keys()
+
+    def get(self, info_name: str) -> Optional[IndexedMetadata]:
+        """Get the indexed metadata of a distribution, if still up to date.
+
+        Every distribution of the location should be either got or added, in
+        the order they are found, before the index is saved.
+        """
+        entry = self._entries.get(info_name)
+        if entry is None:
+            return None
+        stat_key, metadata = entry
+        if _get_stat_key(os.path.join(self.location, info_name)) != stat_key:
+            return None
+        self._found[info_name] = entry
+        return metadata
+
+    def add(self, info_name: str, metadata: IndexedMetadata) -> None:
+        stat_key = _get_stat_key(os.path.join(self.location, info_name))
+        if stat_key is not None:
+            self._found[info_name] = (stat_key, metadata)
+            self._changed = True
+
+    def find(self, name: NormalizedName) -> Optional[str]:
+        """Find the metadata directory of a project's distribution.
+
+        This must only be used on a complete index, see get_lookup_index().
+        The distribution's metadata must then be got with get(), since it may
+        have changed since it was indexed.
+        """
+        if self._names is None:
+            self._names = {}
+            for info_name, (_, metadata) in self._entries.items():
+                self._names.setdefault(canonicalize_name(metadata.name), info_name)
+        return self._names.get(name)
+
+    def save(self) -> None:
+        """Replace the index with what was found in the location.
+
+        Nothing is written if the index was up to date, or if the location is
+        not writable.
+        """
+        if not self._changed and self._found.keys() == self._entries.keys():
+            return
+        self._entries, self._found = self._found, {}
+        self._changed = False
+        self._names = None
+        data = {
+            "format": _INDEX_FORMAT,
+            "entries": [
+                [info_name, stat_key, *metadata]
+                for info_name, (stat_key, metadata) in self._entries.items()
+            ],
+        }
+        path = os.path.join(self.location, INSTALLED_INDEX_FILENAME)
+        try:
+            with adjacent_tmp_file(path) as f:
+                f.write(json.dumps(data).encode("utf-8"))
+            os.chmod(f.name, 0o666 & ~current_umask())
+            replace(f.name, path)
+        except OSError as e:
+            logger.debug("Could not save the installed index of %s: %s", path, e)
+
+
+_lookup_indexes: Dict[str, Tuple[int, Optional[InstalledIndex]]] = {}
+
+
+def get_lookup_index(location: str) -> Optional[InstalledIndex]:
+    """Get the index of a location, if it can be used to find distributions.
+
+    That is, if all the distributions of the location are in it. This is
+    remembered for as long as the location is not modified.
+    """
+    try:
+        mtime = os.stat(location).st_mtime_ns
+    except OSError:
+        return None
+    cached = _lookup_indexes.get(location)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    index = InstalledIndex.load(location)
+    lookup_index = index if index.is_complete() else None
+    if time.time_ns() - mtime > _RACY_MTIME_NS:
+        _lookup_indexes[location] = (mtime, lookup_index)
+    return lookup_index
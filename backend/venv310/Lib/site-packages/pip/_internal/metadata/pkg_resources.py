@@ -23,6 +23,7 @@ from .base import (
     InfoPath,
     Wheel,
 )
+from ._headers import parse_metadata_headers
 
 __all__ = ["NAME", "Distribution", "Environment"]
 
@@ -192,7 +193,7 @@ class Distribution(BaseDistribution):
                 name, _, value = str(entry_point).partition("=")
                 yield EntryPoint(name=name.strip(), value=value.strip(), group=group)
 
-    def _metadata_impl(self) -> email.message.Message:
+    def _read_metadata_text(self) -> str:
         """
         :raises NoneMetadataError: if the distribution reports `has_metadata()`
             True but `get_metadata()` returns None.
@@ -210,10 +211,16 @@ class Distribution(BaseDistribution):
                 displaying_path = repr(self.location)
             logger.warning("No metadata found in %s", displaying_path)
             metadata = ""
+        return metadata
+
+    def _metadata_impl(self) -> email.message.Message:
         feed_parser = email.parser.FeedParser()
-        feed_parser.feed(metadata)
+        feed_parser.feed(self._read_metadata_text())
         return feed_parser.close()
 
+    def _metadata_headers_impl(self) -> email.message.Message:
+        return parse_metadata_headers(self._read_metadata_text())
+
     def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
         if extras:  # pkg_resources raises on invalid extras, so we sanitize.
             extras = frozenset(pkg_resources.safe_extra(e) for e in extras)
@@ -1,7 +1,6 @@
-from pip._vendor.packaging.version import parse as parse_version
-
 from pip._internal.models.link import Link
 from pip._internal.utils.models import KeyBasedCompareMixin
+from pip._internal.utils.specifiers import parse_version
 
 
 class InstallationCandidate(KeyBasedCompareMixin):
@@ -1,5 +1,5 @@
 import sys
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from pip._vendor.packaging.tags import Tag
 
@@ -23,6 +23,7 @@ class TargetPython:
         "py_version_info",
         "_valid_tags",
         "_valid_tags_set",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -65,6 +66,7 @@ class TargetPython:
         # This is used to cache the return value of get_(un)sorted_tags.
         self._valid_tags: Optional[List[Tag]] = None
         self._valid_tags_set: Optional[Set[Tag]] = None
+        self._tag_priorities: Optional[Dict[Tag, int]] = None
 
     def format_given(self) -> str:
         """
@@ -120,3 +122,17 @@ class TargetPython:
             self._valid_tags_set = set(self.get_sorted_tags())
 
         return self._valid_tags_set
+
+    def get_tag_priorities(self) -> Dict[Tag, int]:
+        """Map each supported tag to its index in get_sorted_tags().
+
+        Lower values are more preferred. This lets the priority of a wheel be
+        looked up from its own tags, instead of by scanning the (possibly
+        hundreds of) supported tags for each wheel.
+        """
+        if self._tag_priorities is None:
+            self._tag_priorities = {
+                tag: idx for idx, tag in enumerate(self.get_sorted_tags())
+            }
+
+        return self._tag_priorities
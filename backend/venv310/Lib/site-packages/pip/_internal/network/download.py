@@ -4,12 +4,21 @@ import email.message
 import logging
 import mimetypes
 import os
-from typing import Iterable, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
 
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
+from pip._vendor.requests.exceptions import ChunkedEncodingError
+from pip._vendor.requests.exceptions import ConnectionError as RequestsConnectionError
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
-
-from pip._internal.cli.progress_bars import get_download_progress_renderer
-from pip._internal.exceptions import NetworkConnectionError
+from pip._vendor.urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from pip._internal.cli.progress_bars import (
+    BatchProgressCallback,
+    get_batch_download_progress_renderer,
+    get_download_progress_renderer,
+)
+from pip._internal.exceptions import IncompleteDownloadError, NetworkConnectionError
 from pip._internal.models.index import PyPI
 from pip._internal.models.link import Link
 from pip._internal.network.cache import is_from_cache
@@ -19,6 +28,15 @@ from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
 
 logger = logging.getLogger(__name__)
 
+# Errors raised while streaming a response body that indicate the connection
+# was lost part way through, rather than a problem with the request itself.
+_INTERRUPTED_DOWNLOAD_ERRORS = (
+    ChunkedEncodingError,
+    ProtocolError,
+    ReadTimeoutError,
+    RequestsConnectionError,
+)
+
 
 def _get_http_response_size(resp: Response) -> Optional[int]:
     try:
@@ -112,21 +130,155 @@ def _get_http_response_filename(resp: Response, link: Link) -> str:
     return filename
 
 
-def _http_get_download(session: PipSession, link: Link) -> Response:
+def _http_get_download(
+    session: PipSession,
+    link: Link,
+    range_start: int = 0,
+    if_range: Optional[str] = None,
+) -> Response:
     target_url = link.url.split("#", 1)[0]
-    resp = session.get(target_url, headers=HEADERS, stream=True)
+    headers = HEADERS.copy()
+    if range_start:
+        headers["Range"] = f"bytes={range_start}-"
+        if if_range:
+            headers["If-Range"] = if_range
+    resp = session.get(target_url, headers=headers, stream=True)
     raise_for_status(resp)
     return resp
 
 
+def _get_resume_validator(resp: Response) -> Optional[str]:
+    """Get a validator usable in If-Range to resume downloading resp's body.
+
+    Weak ETags are not allowed in If-Range, so fall back to Last-Modified.
+    """
+    etag = resp.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.headers.get("Last-Modified")
+
+
+def _get_content_range(resp: Response) -> Optional[Tuple[int, Optional[int]]]:
+    """Parse the start offset and complete length of a 206 response."""
+    if resp.status_code != 206:
+        return None
+    # Content-Range: bytes <start>-<end>/<complete length or *>
+    unit, _, content_range = resp.headers.get("Content-Range", "").partition(" ")
+    byte_range, _, complete_length = content_range.partition("/")
+    start, _, _ = byte_range.partition("-")
+    if unit != "bytes" or not start.isdigit():
+        return None
+    return int(start), int(complete_length) if complete_length.isdigit() else None
+
+
+def _resume_download(
+    session: PipSession,
+    link: Link,
+    bytes_received: int,
+    validator: Optional[str],
+) -> Response:
+    """Request the rest of a download, after its first bytes_received bytes.
+
+    The response either continues exactly where the download stopped (a 206),
+    or has the whole file (a 200). Anything else is raised as an interruption.
+    """
+    # Without a validator, the server can't tell us if the file changed
+    # since the first request, so resuming would risk mixing contents.
+    range_start = bytes_received if validator else 0
+    resp = _http_get_download(session, link, range_start, validator)
+    if resp.status_code == 200:
+        return resp
+    content_range = _get_content_range(resp)
+    if content_range is None or content_range[0] != range_start:
+        resp.close()
+        raise ProtocolError(
+            f"Expected the content of {link} from byte {range_start}, "
+            f"got Content-Range: {resp.headers.get('Content-Range')!r}"
+        )
+    return resp
+
+
+def _save_download(
+    session: PipSession,
+    resp: Response,
+    link: Link,
+    filepath: str,
+    prepare: Callable[[Response], Iterable[bytes]],
+    resume_retries: int,
+) -> Response:
+    """Write the body of resp to filepath, resuming it if it gets interrupted.
+
+    The data is written to a ``.part`` file next to filepath, which is only
+    renamed once the download is complete. If the connection drops (or the
+    server sends fewer bytes than it announced), the download is resumed with
+    a ``Range`` request guarded by the original response's ``ETag`` or
+    ``Last-Modified``. Servers that ignore the range, or whose file changed in
+    the meantime, answer with a full response and the download starts over.
+    A resumed response that starts anywhere else, or a failure to connect,
+    counts as another interruption.
+
+    Returns the response that completed the download.
+    """
+    partial_path = f"{filepath}.part"
+    total_length = _get_http_response_size(resp)
+    validator = _get_resume_validator(resp)
+    bytes_received = 0
+    attempts = 0
+
+    with open(partial_path, "wb") as content_file:
+        while True:
+            try:
+                if attempts:
+                    resp = _resume_download(session, link, bytes_received, validator)
+                    content_range = _get_content_range(resp)
+                    if content_range is not None:
+                        if content_range[1] is not None:
+                            total_length = content_range[1]
+                    else:
+                        logger.debug(
+                            "Server did not resume %s; downloading it again", link
+                        )
+                        content_file.seek(0)
+                        content_file.truncate()
+                        bytes_received = 0
+                        total_length = _get_http_response_size(resp)
+                        validator = _get_resume_validator(resp)
+                for chunk in prepare(resp):
+                    content_file.write(chunk)
+                    bytes_received += len(chunk)
+            except _INTERRUPTED_DOWNLOAD_ERRORS as e:
+                logger.debug("Download of %s interrupted: %s", link, e)
+            else:
+                if total_length is None or bytes_received >= total_length:
+                    break
+
+            if attempts >= resume_retries:
+                raise IncompleteDownloadError(
+                    link, bytes_received, total_length, attempts
+                )
+            attempts += 1
+            logger.warning(
+                "Connection lost after %s of %s; resuming (attempt %d of %d)",
+                format_size(bytes_received),
+                redact_auth_from_url(link.url_without_fragment),
+                attempts,
+                resume_retries,
+            )
+
+    os.replace(partial_path, filepath)
+    return resp
+
+
 class Downloader:
     def __init__(
         self,
         session: PipSession,
         progress_bar: str,
+        resume_retries: int = 0,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        self._resume_retries = resume_retries
 
     def __call__(self, link: Link, location: str) -> Tuple[str, str]:
         """Download the file given by link into location."""
@@ -142,10 +294,14 @@ class Downloader:
         filename = _get_http_response_filename(resp, link)
         filepath = os.path.join(location, filename)
 
-        chunks = _prepare_download(resp, link, self._progress_bar)
-        with open(filepath, "wb") as content_file:
-            for chunk in chunks:
-                content_file.write(chunk)
+        resp = _save_download(
+            self._session,
+            resp,
+            link,
+            filepath,
+            lambda r: _prepare_download(r, link, self._progress_bar),
+            self._resume_retries,
+        )
         content_type = resp.headers.get("Content-Type", "")
         return filepath, content_type
 
@@ -155,14 +311,23 @@ class BatchDownloader:
         self,
         session: PipSession,
         progress_bar: str,
+        workers: int = 1,
+        resume_retries: int = 0,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        self._workers = workers
+        self._resume_retries = resume_retries
 
     def __call__(
         self, links: Iterable[Link], location: str
     ) -> Iterable[Tuple[Link, Tuple[str, str]]]:
         """Download the files given by links into location."""
+        links = list(links)
+        if self._workers > 1 and len(links) > 1:
+            yield from self._download_concurrently(links, location)
+            return
+
         for link in links:
             try:
                 resp = _http_get_download(self._session, link)
@@ -178,9 +343,75 @@ class BatchDownloader:
             filename = _get_http_response_filename(resp, link)
             filepath = os.path.join(location, filename)
 
-            chunks = _prepare_download(resp, link, self._progress_bar)
-            with open(filepath, "wb") as content_file:
-                for chunk in chunks:
-                    content_file.write(chunk)
+            resp = _save_download(
+                self._session,
+                resp,
+                link,
+                filepath,
+                lambda r: _prepare_download(r, link, self._progress_bar),
+                self._resume_retries,
+            )
             content_type = resp.headers.get("Content-Type", "")
             yield link, (filepath, content_type)
+
+    def _download_one(
+        self, link: Link, location: str, advance: BatchProgressCallback
+    ) -> Tuple[str, str]:
+        resp = _http_get_download(self._session, link)
+
+        filename = _get_http_response_filename(resp, link)
+        filepath = os.path.join(location, filename)
+
+        def prepare(resp: Response) -> Iterable[bytes]:
+            # Individual progress bars would fight over the terminal, so
+            # progress is reported to the single aggregated display instead.
+            for chunk in _prepare_download(resp, link, "off"):
+                advance(len(chunk), False)
+                yield chunk
+
+        resp = _save_download(
+            self._session, resp, link, filepath, prepare, self._resume_retries
+        )
+        advance(0, True)
+        content_type = resp.headers.get("Content-Type", "")
+        return filepath, content_type
+
+    def _download_concurrently(
+        self, links: List[Link], location: str
+    ) -> Iterable[Tuple[Link, Tuple[str, str]]]:
+        # All workers share the session, and therefore its connection pools;
+        # going past the pool size would only open connections to discard them.
+        max_workers = min(self._workers, len(links), DEFAULT_POOLSIZE)
+        logger.debug("Downloading %d files using %d workers", len(links), max_workers)
+
+        renderer = get_batch_download_progress_renderer(
+            bar_type=self._progress_bar, file_count=len(links)
+        )
+        results: List[Tuple[str, str]] = []
+        with renderer as advance, ThreadPoolExecutor(max_workers) as executor:
+            futures: List["Future[Tuple[str, str]]"] = [
+                executor.submit(self._download_one, link, location, advance)
+                for link in links
+            ]
+            # Collect results in the order the links were given, so that the
+            # error reported (and the order of the results) does not depend on
+            # which download happened to finish first.
+            for link, future in zip(links, futures):
+                try:
+                    results.append(future.result())
+                except NetworkConnectionError as e:
+                    for pending in futures:
+                        pending.cancel()
+                    assert e.response is not None
+                    logger.critical(
+                        "HTTP error %s while getting %s",
+                        e.response.status_code,
+                        link,
+                    )
+                    raise
+                except BaseException:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+        yield from zip(links, results)
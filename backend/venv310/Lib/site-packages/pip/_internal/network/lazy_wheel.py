@@ -2,13 +2,19 @@
 
 __all__ = ["HTTPRangeRequestUnsupported", "dist_from_wheel_url"]
 
+import struct
+import threading
+import urllib.parse
 from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, NamedTuple, Optional, Tuple
 from zipfile import BadZipFile, ZipFile
 
 from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
 from pip._internal.metadata import BaseDistribution, MemoryWheel, get_wheel_distribution
@@ -20,6 +26,35 @@ class HTTPRangeRequestUnsupported(Exception):
     pass
 
 
+class _CentralDirectory(NamedTuple):
+    """The parts of a remote wheel fetched to read its metadata."""
+
+    length: int
+    # Where the central directory starts.
+    offset: int
+    # Downloaded data as (start offset, bytes) pairs, including everything
+    # from the central directory to the end of the file.
+    ranges: Tuple[Tuple[int, bytes], ...]
+
+
+# End of central directory record: signature, number of this disk, disk where
+# the central directory starts, number of entries on this disk, total number
+# of entries, size of the central directory, offset of the central directory
+# and comment length.
+_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+_EOCD_SIGNATURE = b"PK\x05\x06"
+
+# Central directories recently fetched during this run, keyed by URL, so that
+# looking at the same wheel again needs neither a HEAD request nor a tail scan.
+_MAX_CENTRAL_DIRECTORIES = 64
+_central_directories: "OrderedDict[str, _CentralDirectory]" = OrderedDict()
+_central_directories_lock = threading.Lock()
+
+# Origins (scheme://netloc) known to answer a multi-range request with
+# something other than multipart/byteranges.
+_multipart_unsupported: Dict[str, bool] = {}
+
+
 def dist_from_wheel_url(name: str, url: str, session: PipSession) -> BaseDistribution:
     """Return a distribution object from the given wheel URL.
 
@@ -37,6 +72,22 @@ def dist_from_wheel_url(name: str, url: str, session: PipSession) -> BaseDistrib
         return get_wheel_distribution(wheel, canonicalize_name(name))
 
 
+def _get_central_directory(url: str) -> Optional[_CentralDirectory]:
+    with _central_directories_lock:
+        central_directory = _central_directories.get(url)
+        if central_directory is not None:
+            _central_directories.move_to_end(url)
+        return central_directory
+
+
+def _remember_central_directory(url: str, central_directory: _CentralDirectory) -> None:
+    with _central_directories_lock:
+        _central_directories[url] = central_directory
+        _central_directories.move_to_end(url)
+        while len(_central_directories) > _MAX_CENTRAL_DIRECTORIES:
+            _central_directories.popitem(last=False)
+
+
 class LazyZipOverHTTP:
     """File-like object mapped to a ZIP file over HTTP.
 
@@ -49,18 +100,31 @@ class LazyZipOverHTTP:
     def __init__(
         self, url: str, session: PipSession, chunk_size: int = CONTENT_CHUNK_SIZE
     ) -> None:
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers["Content-Length"])
-        self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left: List[int] = []
         self._right: List[int] = []
-        if "bytes" not in head.headers.get("Accept-Ranges", "none"):
-            raise HTTPRangeRequestUnsupported("range request is not supported")
-        self._check_zip()
+        self._central_directory_start = 0
+        cached = _get_central_directory(url)
+        if cached is None:
+            head = session.head(url, headers=HEADERS)
+            raise_for_status(head)
+            assert head.status_code == 200
+            self._length = int(head.headers["Content-Length"])
+        else:
+            self._length = cached.length
+        self._file = NamedTemporaryFile()
+        self.truncate(self._length)
+        if cached is None:
+            if "bytes" not in head.headers.get("Accept-Ranges", "none"):
+                raise HTTPRangeRequestUnsupported("range request is not supported")
+            self._check_zip()
+            self._prefetch_dist_info()
+        else:
+            self._central_directory_start = cached.offset
+            for start, data in cached.ranges:
+                self._write(start, data)
+                self._left.append(start)
+                self._right.append(start + len(data) - 1)
 
     @property
     def mode(self) -> str:
@@ -94,6 +158,8 @@ class LazyZipOverHTTP:
         """
         download_size = max(size, self._chunk_size)
         start, length = self.tell(), self._length
+        if size >= 0 and self._is_downloaded(start, min(start + size, length) - 1):
+            return self._file.read(size)
         stop = length if size < 0 else min(start + download_size, length)
         start = max(0, stop - download_size)
         self._download(start, stop - 1)
@@ -151,19 +217,98 @@ class LazyZipOverHTTP:
             self.seek(pos)
 
     def _check_zip(self) -> None:
-        """Check and download until the file is a valid ZIP."""
+        """Check and download until the file is a valid ZIP.
+
+        The end of central directory record at the end of the file tells
+        where the central directory starts, so it can usually be fetched at
+        once. Files this does not work for, e.g. ZIP64 archives or archives
+        with a long comment, are downloaded chunk by chunk from the end.
+        """
         end = self._length - 1
+        tail_start = max(0, self._length - self._chunk_size)
+        self._download(tail_start, end)
+        offset = self._central_directory_offset(tail_start)
+        if offset is not None:
+            self._download(offset, end)
+            start_dir = self._zip_start_dir()
+            if start_dir is not None:
+                self._central_directory_start = start_dir
+                return
+
         for start in reversed(range(0, end, self._chunk_size)):
             self._download(start, end)
-            with self._stay():
-                try:
-                    # For read-only ZIP files, ZipFile only needs
-                    # methods read, seek, seekable and tell.
-                    ZipFile(self)  # type: ignore
-                except BadZipFile:
-                    pass
-                else:
-                    break
+            start_dir = self._zip_start_dir()
+            if start_dir is not None:
+                self._central_directory_start = start_dir
+                break
+
+    def _zip_start_dir(self) -> Optional[int]:
+        """Get where the central directory starts, if the file is a valid ZIP."""
+        with self._stay():
+            try:
+                # For read-only ZIP files, ZipFile only needs
+                # methods read, seek, seekable and tell.
+                zf = ZipFile(self)  # type: ignore
+            except BadZipFile:
+                return None
+        # Found by ZipFile in the (ZIP64) end of central directory record.
+        return zf.start_dir  # type: ignore[attr-defined]
+
+    def _central_directory_offset(self, tail_start: int) -> Optional[int]:
+        """Find where the central directory starts from the downloaded tail."""
+        with self._stay():
+            self.seek(tail_start)
+            tail = self._file.read()
+        index = tail.rfind(_EOCD_SIGNATURE)
+        if index < 0 or len(tail) - index < _EOCD_STRUCT.size:
+            return None
+        record = _EOCD_STRUCT.unpack_from(tail, index)
+        size, offset = record[5], record[6]
+        if offset == 0xFFFFFFFF or offset + size > tail_start + index:
+            return None
+        return offset
+
+    def _remember_downloaded(self) -> None:
+        ranges = []
+        with self._stay():
+            for start, end in zip(self._left, self._right):
+                self.seek(start)
+                ranges.append((start, self._file.read(end - start + 1)))
+        _remember_central_directory(
+            self._url,
+            _CentralDirectory(
+                self._length, self._central_directory_start, tuple(ranges)
+            ),
+        )
+
+    def _prefetch_dist_info(self) -> None:
+        """Download the members of the .dist-info directory in one go.
+
+        All of them are read to construct the distribution, and fetching
+        them one read at a time would cost a round trip each.
+        """
+        with self._stay():
+            try:
+                infos = ZipFile(self).infolist()  # type: ignore
+            except BadZipFile:
+                return
+        # Each member ends where the next one, or the central directory,
+        # starts.
+        boundaries = sorted(
+            {info.header_offset for info in infos} | {self._central_directory_start}
+        )
+        ranges = []
+        for info in infos:
+            top = info.filename.split("/", 1)[0]
+            if not top.endswith(".dist-info"):
+                continue
+            index = bisect_right(boundaries, info.header_offset)
+            if index < len(boundaries):
+                ranges.append((info.header_offset, boundaries[index] - 1))
+            else:
+                ranges.append((info.header_offset, self._length - 1))
+        self._download_ranges(ranges)
+        self._remember_downloaded()
 
     def _stream_response(
         self, start: int, end: int, base_headers: Dict[str, str] = HEADERS
@@ -197,14 +342,135 @@ class LazyZipOverHTTP:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def _is_downloaded(self, start: int, end: int) -> bool:
+        """Whether bytes from start to end inclusively are available."""
+        index = bisect_right(self._left, start) - 1
+        return index >= 0 and self._right[index] >= end
+
     def _download(self, start: int, end: int) -> None:
         """Download bytes from start to end inclusively."""
-        with self._stay():
+        self._download_ranges([(start, end)])
+
+    def _download_ranges(self, ranges: Iterable[Tuple[int, int]]) -> None:
+        """Download the given inclusive byte ranges, in as few round trips as
+        the server allows."""
+        missing: List[Tuple[int, int]] = []
+        for start, end in ranges:
             left = bisect_left(self._right, start)
             right = bisect_right(self._left, end)
-            for start, end in self._merge(start, end, left, right):
-                response = self._stream_response(start, end)
-                response.raise_for_status()
+            missing.extend(self._merge(start, end, left, right))
+        if not missing:
+            return
+        # Adjacent intervals are better requested as one.
+        missing.sort()
+        coalesced = [missing[0]]
+        for start, end in missing[1:]:
+            if start <= coalesced[-1][1] + 1:
+                coalesced[-1] = (coalesced[-1][0], max(end, coalesced[-1][1]))
+            else:
+                coalesced.append((start, end))
+        missing = coalesced
+        if len(missing) == 1 or not self._fetch_multipart(missing):
+            self._fetch_concurrently(missing)
+
+    def _write(self, start: int, data: bytes) -> None:
+        with self._stay():
+            self.seek(start)
+            self._file.write(data)
+
+    def _fetch_concurrently(self, ranges: List[Tuple[int, int]]) -> None:
+        """Fetch each range with its own request, in parallel."""
+
+        def fetch(interval: Tuple[int, int]) -> bytes:
+            response = self._stream_response(*interval)
+            response.raise_for_status()
+            return b"".join(response_chunks(response, self._chunk_size))
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            response = self._stream_response(start, end)
+            response.raise_for_status()
+            with self._stay():
                 self.seek(start)
                 for chunk in response_chunks(response, self._chunk_size):
                     self._file.write(chunk)
+            return
+        workers = min(len(ranges), DEFAULT_POOLSIZE)
+        with ThreadPoolExecutor(workers) as executor:
+            for (start, _), data in zip(ranges, executor.map(fetch, ranges)):
+                self._write(start, data)
+
+    def _fetch_multipart(self, ranges: List[Tuple[int, int]]) -> bool:
+        """Try to fetch all ranges in a single multipart/byteranges request.
+
+        Return False if the server does not support it, in which case
+        nothing has been written.
+        """
+        origin = urllib.parse.urlsplit(self._url)[:2]
+        origin_key = "{}://{}".format(*origin)
+        if _multipart_unsupported.get(origin_key):
+            return False
+
+        spec = ",".join(f"{start}-{end}" for start, end in ranges)
+        headers = HEADERS.copy()
+        headers["Range"] = f"bytes={spec}"
+        headers["Cache-Control"] = "no-cache"
+        response = self._session.get(self._url, headers=headers, stream=True)
+        content_type = response.headers.get("Content-Type", "")
+        if (
+            response.status_code != 206
+            or not content_type.startswith("multipart/byteranges")
+        ):
+            # Either the ranges were ignored, or coalesced into a single one
+            # whose extent we would have to second-guess. Don't read the body.
+            response.close()
+            _multipart_unsupported[origin_key] = True
+            return False
+
+        boundary = _get_boundary(content_type)
+        body = b"".join(response_chunks(response, self._chunk_size))
+        parts = list(_iter_byteranges(body, boundary))
+        covered = sorted((start, start + len(data) - 1) for start, data in parts)
+        if not _covers(covered, ranges):
+            _multipart_unsupported[origin_key] = True
+            return False
+        for start, data in parts:
+            self._write(start, data)
+        return True
+
+
+def _get_boundary(content_type: str) -> bytes:
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            return value.strip('"').encode("ascii")
+    return b""
+
+
+def _iter_byteranges(body: bytes, boundary: bytes) -> Iterable[Tuple[int, bytes]]:
+    """Parse a multipart/byteranges body into (start offset, data) pairs."""
+    if not boundary:
+        return
+    for part in body.split(b"--" + boundary)[1:]:
+        head, sep, data = part.partition(b"\r\n\r\n")
+        if not sep:
+            continue
+        for line in head.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() != b"content-range":
+                continue
+            # bytes <start>-<end>/<length>
+            byte_range = value.strip().split(b" ", 1)[-1].split(b"/", 1)[0]
+            start, _, end = byte_range.partition(b"-")
+            if start.isdigit() and end.isdigit():
+                yield int(start), data[: int(end) - int(start) + 1]
+            break
+
+
+def _covers(covered: List[Tuple[int, int]], ranges: List[Tuple[int, int]]) -> bool:
+    """Whether the sorted intervals in covered include all of ranges."""
+    for start, end in ranges:
+        index = bisect_right(covered, (start, float("inf"))) - 1
+        if index < 0 or covered[index][1] < end:
+            return False
+    return True
@@ -2,6 +2,7 @@
 """
 
 import os
+import shutil
 
 from pip._vendor.pyproject_hooks import BuildBackendHookCaller
 
@@ -37,3 +38,15 @@ def generate_metadata(
                 raise MetadataGenerationFailed(package_details=details) from error
 
     return os.path.join(metadata_dir, distinfo_dir)
+
+
+def copy_metadata(metadata_directory: str) -> str:
+    """Copy metadata generated before, as if it was generated anew.
+
+    Returns the new metadata directory.
+    """
+    metadata_tmpdir = TempDirectory(kind="modern-metadata", globally_managed=True)
+    distinfo_dir = os.path.basename(metadata_directory)
+    metadata_dir = os.path.join(metadata_tmpdir.path, distinfo_dir)
+    shutil.copytree(metadata_directory, metadata_dir)
+    return metadata_dir
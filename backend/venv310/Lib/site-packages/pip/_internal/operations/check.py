@@ -14,6 +14,8 @@ from pip._internal.metadata import get_default_environment
 from pip._internal.metadata.base import DistributionVersion
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils.deprecation import deprecated
+from pip._internal.utils.markers import evaluate_marker
+from pip._internal.utils.specifiers import specifier_contains
 
 logger = logging.getLogger(__name__)
 
@@ -80,14 +82,14 @@ def check_package_set(
             if name not in package_set:
                 missed = True
                 if req.marker is not None:
-                    missed = req.marker.evaluate({"extra": ""})
+                    missed = evaluate_marker(req.marker, "")
                 if missed:
                     missing_deps.add((name, req))
                 continue
 
             # Check if there's a conflict
             version = package_set[name].version
-            if not req.specifier.contains(version, prereleases=True):
+            if not specifier_contains(req.specifier, version, prereleases=True):
                 conflicting_deps.add((name, version, req))
 
         if missing_deps:
@@ -0,0 +1,154 @@
+"""Byte-compilation of the Python files installed from wheels.
+"""
+
+import compileall
+import contextlib
+import functools
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+# Starting worker processes costs more than compiling a handful of files, so
+# wheels with fewer files than this are compiled in-process until the pool has
+# been started by a larger one.
+PARALLEL_COMPILE_MIN_FILES = 100
+
+# Written in the .dist-info directory of a distribution whose files are still
+# to be compiled, listing them relative to the directory holding .dist-info.
+PENDING_COMPILE_FILENAME = "PIP_COMPILE_PENDING"
+
+
+def _compile_file(path: str) -> Tuple[bool, str]:
+    """Compile one file, returning whether it succeeded and what it printed."""
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            success = compileall.compile_file(path, force=True, quiet=True)
+    return bool(success), stdout.getvalue()
+
+
+# What the worker processes run. It only involves the standard library, as pip
+# itself may be in the middle of being upgraded when the workers start.
+_compile_file_silently = functools.partial(compileall.compile_file, force=True, quiet=2)
+
+
+class BytecodeCompiler:
+    """Compiles the Python files of all the wheels installed in one batch.
+
+    With more than one job, files are compiled by a pool of worker processes
+    shared by every wheel of the batch. Worker processes are spawned rather
+    than forked, since the installing process may be running threads.
+
+    When deferred, nothing is compiled during installation: the files are
+    listed in PENDING_COMPILE_FILENAME instead, for compile_pending() to pick
+    up once the installation has completed.
+    """
+
+    def __init__(self, jobs: int = 1, deferred: bool = False) -> None:
+        self.jobs = jobs
+        self.deferred = deferred
+        self._executor: Optional[Executor] = None
+        # Compiling in-process redirects sys.stdout and filters warnings, which
+        # other threads must not do at the same time.
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+
+    def __enter__(self) -> "BytecodeCompiler":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self, file_count: int) -> Optional[Executor]:
+        if self.jobs <= 1:
+            return None
+        with self._pool_lock:
+            if self._executor is None and file_count >= PARALLEL_COMPILE_MIN_FILES:
+                self._executor = ProcessPoolExecutor(
+                    self.jobs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=warnings.simplefilter,
+                    initargs=("ignore",),
+                )
+            return self._executor
+
+    def _compile_in_parallel(
+        self, executor: Executor, paths: List[str]
+    ) -> Optional[List[Tuple[bool, str]]]:
+        chunksize = max(1, len(paths) // (self.jobs * 4))
+        try:
+            successes = list(
+                executor.map(_compile_file_silently, paths, chunksize=chunksize)
+            )
+        except (BrokenProcessPool, OSError) as e:
+            logger.debug("Parallel byte-compilation failed: %s", e)
+            self.close()
+            self.jobs = 1
+            return None
+        return [
+            (bool(success), "" if success else f"Failed to compile {path}\n")
+            for path, success in zip(paths, successes)
+        ]
+
+    def compile(self, paths: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+        """Compile the given files, yielding each path and whether it compiled.
+
+        Results are yielded in the order of paths, whichever way they are
+        compiled.
+        """
+        paths = list(paths)
+        executor = self._get_executor(len(paths))
+        results: Optional[Iterable[Tuple[bool, str]]] = None
+        if executor is not None:
+            results = self._compile_in_parallel(executor, paths)
+        if results is None:
+            with self._lock:
+                results = [_compile_file(path) for path in paths]
+
+        output: List[str] = []
+        for path, (success, stdout) in zip(paths, results):
+            output.append(stdout)
+            yield path, success
+        logger.debug("".join(output))
+
+
+def compile_pending(info_dir: str, compiler: BytecodeCompiler) -> bool:
+    """Compile the files whose compilation was deferred for a distribution.
+
+    :param info_dir: The .dist-info directory of the distribution.
+    :return: Whether there was anything pending.
+    """
+    pending_path = os.path.join(info_dir, PENDING_COMPILE_FILENAME)
+    try:
+        with open(pending_path, encoding="utf-8") as f:
+            record_paths = f.read().splitlines()
+    except FileNotFoundError:
+        return False
+
+    lib_dir = os.path.dirname(info_dir)
+    paths = (os.path.join(lib_dir, record_path) for record_path in record_paths)
+    for path, success in compiler.compile(p for p in paths if os.path.isfile(p)):
+        if not success:
+            logger.debug("Could not compile %s", path)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(pending_path)
+    return True
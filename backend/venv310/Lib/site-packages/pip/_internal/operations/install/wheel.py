@@ -2,7 +2,6 @@
 """
 
 import collections
-import compileall
 import contextlib
 import csv
 import importlib
@@ -11,7 +10,6 @@ import os.path
 import re
 import shutil
 import sys
-import warnings
 from base64 import urlsafe_b64encode
 from email.message import Message
 from itertools import chain, filterfalse, starmap
@@ -40,6 +38,7 @@ from pip._vendor.distlib.scripts import ScriptMaker
 from pip._vendor.distlib.util import get_export_entry
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.cache import UnpackedWheelStore
 from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_major_minor_version
 from pip._internal.metadata import (
@@ -49,9 +48,14 @@ from pip._internal.metadata import (
 )
 from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
+from pip._internal.operations.install.bytecode import (
+    PENDING_COMPILE_FILENAME,
+    BytecodeCompiler,
+)
 from pip._internal.utils.filesystem import adjacent_tmp_file, replace
-from pip._internal.utils.misc import captured_stdout, ensure_dir, hash_file, partition
+from pip._internal.utils.misc import ensure_dir, hash_file, partition
 from pip._internal.utils.unpacking import (
+    copy_stored_member,
     current_umask,
     is_within_directory,
     set_extracted_file_to_default_mode_plus_executable,
@@ -105,9 +109,13 @@ def fix_script(path: str) -> bool:
         exename = sys.executable.encode(sys.getfilesystemencoding())
         firstline = b"#!" + exename + os.linesep.encode("ascii")
         rest = script.read()
-    with open(path, "wb") as script:
+    # Write a new file rather than rewriting this one, which may be linked to
+    # the unpacked wheel store.
+    with adjacent_tmp_file(path) as script:
         script.write(firstline)
         script.write(rest)
+    shutil.copymode(path, script.name)
+    replace(script.name, path)
     return True
 
 
@@ -349,11 +357,16 @@ def get_console_script_specs(console: Dict[str, str]) -> List[str]:
 
 class ZipBackedFile:
     def __init__(
-        self, src_record_path: RecordPath, dest_path: str, zip_file: ZipFile
+        self,
+        src_record_path: RecordPath,
+        dest_path: str,
+        zip_file: ZipFile,
+        unpacked: Optional[Tuple[UnpackedWheelStore, str]] = None,
     ) -> None:
         self.src_record_path = src_record_path
         self.dest_path = dest_path
         self._zip_file = zip_file
+        self._unpacked = unpacked
         self.changed = False
 
     def _getinfo(self) -> ZipInfo:
@@ -377,11 +390,23 @@ class ZipBackedFile:
         if os.path.exists(self.dest_path):
             os.unlink(self.dest_path)
 
+        if self._unpacked is not None:
+            store, unpacked_dir = self._unpacked
+            try:
+                store.install_file(unpacked_dir, self.src_record_path, self.dest_path)
+            except OSError as e:
+                logger.debug("Extracting %s from the wheel: %s", self.dest_path, e)
+                if os.path.lexists(self.dest_path):
+                    os.unlink(self.dest_path)
+            else:
+                return
+
         zipinfo = self._getinfo()
 
-        with self._zip_file.open(zipinfo) as f:
-            with open(self.dest_path, "wb") as dest:
-                shutil.copyfileobj(f, dest)
+        with open(self.dest_path, "wb") as dest:
+            if not copy_stored_member(self._zip_file, zipinfo, dest):
+                with self._zip_file.open(zipinfo) as f:
+                    shutil.copyfileobj(f, dest)
 
         if zip_item_is_executable(zipinfo):
             set_extracted_file_to_default_mode_plus_executable(self.dest_path)
@@ -432,6 +457,8 @@ def _install_wheel(
     warn_script_location: bool = True,
     direct_url: Optional[DirectUrl] = None,
     requested: bool = False,
+    compiler: Optional[BytecodeCompiler] = None,
+    wheel_store: Optional[UnpackedWheelStore] = None,
 ) -> None:
     """Install a wheel.
 
@@ -443,6 +470,11 @@ def _install_wheel(
     :param pycompile: Whether to byte-compile installed Python files
     :param warn_script_location: Whether to check that scripts are installed
         into a directory on PATH
+    :param compiler: The compiler shared by the wheels installed in the same
+        batch, if any, used when pycompile is True. If it is deferred, the
+        files are only recorded as pending compilation.
+    :param wheel_store: The store to unpack the wheel to and install its files
+        from, if any.
     :raises UnsupportedWheel:
         * when the directory holds an unpacked wheel with incompatible
           Wheel-Version
@@ -450,6 +482,13 @@ def _install_wheel(
     """
     info_dir, metadata = parse_wheel(wheel_zip, name)
 
+    unpacked: Optional[Tuple[UnpackedWheelStore, str]] = None
+    if wheel_store is not None:
+        try:
+            unpacked = (wheel_store, wheel_store.get_unpacked_dir(wheel_path))
+        except OSError as e:
+            logger.warning("Could not unpack %s to the wheel store: %s", wheel_path, e)
+
     if wheel_root_is_purelib(metadata):
         lib_dir = scheme.purelib
     else:
@@ -492,7 +531,7 @@ def _install_wheel(
             normed_path = os.path.normpath(record_path)
             dest_path = os.path.join(dest, normed_path)
             assert_no_path_traversal(dest, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return ZipBackedFile(record_path, dest_path, zip_file, unpacked)
 
         return make_root_scheme_file
 
@@ -525,7 +564,7 @@ def _install_wheel(
 
             dest_path = os.path.join(scheme_path, dest_subpath)
             assert_no_path_traversal(scheme_path, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return ZipBackedFile(record_path, dest_path, zip_file, unpacked)
 
         return make_data_scheme_file
 
@@ -604,19 +643,35 @@ def _install_wheel(
 
     # Compile all of the pyc files for the installed files
     if pycompile:
-        with captured_stdout() as stdout:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore")
-                for path in pyc_source_file_paths():
-                    success = compileall.compile_file(path, force=True, quiet=True)
-                    if success:
-                        pyc_path = pyc_output_path(path)
-                        assert os.path.exists(pyc_path)
-                        pyc_record_path = cast(
-                            "RecordPath", pyc_path.replace(os.path.sep, "/")
-                        )
-                        record_installed(pyc_record_path, pyc_path)
-        logger.debug(stdout.getvalue())
+        if compiler is None:
+            compiler = BytecodeCompiler()
+        if compiler.deferred:
+            # Record the pyc files that will be written, and where the
+            # compilation picks up the files to compile once the install is
+            # complete.
+            pending: List[str] = []
+            for path in pyc_source_file_paths():
+                pending.append(_fs_to_record_path(path, lib_dir))
+                pyc_path = pyc_output_path(path)
+                pyc_record_path = cast("RecordPath", pyc_path.replace(os.path.sep, "/"))
+                record_installed(pyc_record_path, pyc_path)
+            if pending:
+                pending_path = os.path.join(lib_dir, info_dir, PENDING_COMPILE_FILENAME)
+                with open(pending_path, "w", encoding="utf-8") as pending_file:
+                    pending_file.write("".join(f"{p}\n" for p in pending))
+                pending_record_path = cast(
+                    "RecordPath", pending_path.replace(os.path.sep, "/")
+                )
+                record_installed(pending_record_path, pending_path)
+        else:
+            for path, success in compiler.compile(pyc_source_file_paths()):
+                if success:
+                    pyc_path = pyc_output_path(path)
+                    assert os.path.exists(pyc_path)
+                    pyc_record_path = cast(
+                        "RecordPath", pyc_path.replace(os.path.sep, "/")
+                    )
+                    record_installed(pyc_record_path, pyc_path)
 
     maker = PipScriptMaker(None, scheme.scripts)
 
@@ -719,6 +774,8 @@ def install_wheel(
     warn_script_location: bool = True,
     direct_url: Optional[DirectUrl] = None,
     requested: bool = False,
+    compiler: Optional[BytecodeCompiler] = None,
+    wheel_store: Optional[UnpackedWheelStore] = None,
 ) -> None:
     with ZipFile(wheel_path, allowZip64=True) as z:
         with req_error_context(req_description):
@@ -731,4 +788,6 @@ def install_wheel(
                 warn_script_location=warn_script_location,
                 direct_url=direct_url,
                 requested=requested,
+                compiler=compiler,
+                wheel_store=wheel_store,
             )
@@ -7,11 +7,15 @@
 import mimetypes
 import os
 import shutil
+from concurrent.futures import Executor, Future
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
+from pip._vendor.packaging.requirements import InvalidRequirement
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.build_env import BuildEnvironmentInstaller
+from pip._internal.cache import BuildEnvironmentCache, MetadataCache
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
 from pip._internal.exceptions import (
@@ -43,12 +47,14 @@ from pip._internal.utils.direct_url_helpers import (
 )
 from pip._internal.utils.hashes import Hashes, MissingHashes
 from pip._internal.utils.logging import indent_log
+from pip._internal.utils.markers import evaluate_marker, get_default_marker_environment
 from pip._internal.utils.misc import (
     display_path,
     hash_file,
     hide_url,
     redact_auth_from_requirement,
 )
+from pip._internal.utils.packaging import get_requirement
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.unpacking import unpack_file
 from pip._internal.vcs import vcs
@@ -62,6 +68,8 @@ def _get_prepared_distribution(
     finder: PackageFinder,
     build_isolation: bool,
     check_build_deps: bool,
+    build_env_cache: Optional[BuildEnvironmentCache],
+    build_env_installer: Optional[BuildEnvironmentInstaller],
 ) -> BaseDistribution:
     """Prepare a distribution for installation."""
     abstract_dist = make_distribution_for_install_requirement(req)
@@ -69,7 +77,11 @@ def _get_prepared_distribution(
     if tracker_id is not None:
         with build_tracker.track(req, tracker_id):
             abstract_dist.prepare_distribution_metadata(
-                finder, build_isolation, check_build_deps
+                finder,
+                build_isolation,
+                check_build_deps,
+                build_env_cache,
+                build_env_installer,
             )
     return abstract_dist.get_metadata_distribution()
 
@@ -223,12 +235,17 @@ class RequirementPreparer:
         build_tracker: BuildTracker,
         session: PipSession,
         progress_bar: str,
+        download_workers: int,
+        resume_retries: int,
         finder: PackageFinder,
         require_hashes: bool,
         use_user_site: bool,
         lazy_wheel: bool,
         verbosity: int,
         legacy_resolver: bool,
+        metadata_cache: Optional[MetadataCache] = None,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
+        build_env_installer: Optional[BuildEnvironmentInstaller] = None,
     ) -> None:
         super().__init__()
 
@@ -236,8 +253,16 @@ class RequirementPreparer:
         self.build_dir = build_dir
         self.build_tracker = build_tracker
         self._session = session
-        self._download = Downloader(session, progress_bar)
-        self._batch_download = BatchDownloader(session, progress_bar)
+        self._download = Downloader(
+            session, progress_bar, resume_retries=resume_retries
+        )
+        self._batch_download = BatchDownloader(
+            session,
+            progress_bar,
+            workers=download_workers,
+            resume_retries=resume_retries,
+        )
+        self.download_workers = download_workers
         self.finder = finder
 
         # Where still-packed archives should be written to. If None, they are
@@ -265,9 +290,23 @@ class RequirementPreparer:
         # Are we using the legacy resolver?
         self.legacy_resolver = legacy_resolver
 
+        # Where the metadata of wheels is kept across runs, if anywhere.
+        self.metadata_cache = metadata_cache
+
+        # Where isolated build environments are reused from, if anywhere.
+        self.build_env_cache = build_env_cache
+
+        # What installs build dependencies, if not a pip subprocess.
+        self.build_env_installer = build_env_installer
+
         # Memoized downloaded files, as mapping of url: path.
         self._downloaded: Dict[str, str] = {}
 
+        # Metadata being fetched speculatively, as mapping of url: future.
+        self._metadata_futures: Dict[str, "Future[Optional[BaseDistribution]]"] = {}
+        # Urls whose metadata has been asked for, so is no use prefetching.
+        self._metadata_fetched: Set[str] = set()
+
         # Previous "header" printed for a link-based InstallRequirement
         self._previous_requirement_header = ("", "")
 
@@ -353,9 +392,52 @@ class RequirementPreparer:
         # showing the user what the hash should be.
         return req.hashes(trust_internet=False) or MissingHashes()
 
+    def prefetch_metadata(self, req: InstallRequirement, executor: Executor) -> None:
+        """Start fetching the metadata of req in the background.
+
+        This is only done when the metadata can be obtained without
+        downloading the whole distribution. If req later gets prepared, the
+        result is used instead of fetching the metadata again.
+        """
+        assert req.link
+        link = req.link
+        if (
+            link.url in self._metadata_futures
+            or link.url in self._metadata_fetched
+            or link.url in self._downloaded
+        ):
+            return
+        if link.metadata_link() is None and not (
+            self.use_lazy_wheel and link.is_wheel and not link.is_file
+        ):
+            return
+        self._metadata_futures[link.url] = executor.submit(
+            self._fetch_metadata_from_network, req
+        )
+
+    def cancel_prefetch(self) -> None:
+        """Cancel the metadata fetches that have not started yet."""
+        for url, future in list(self._metadata_futures.items()):
+            if future.cancel():
+                del self._metadata_futures[url]
+
     def _fetch_metadata_only(
         self,
         req: InstallRequirement,
+    ) -> Optional[BaseDistribution]:
+        self._metadata_fetched.add(req.link.url)
+        future = self._metadata_futures.pop(req.link.url, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                # Fetch again to report the error the way we normally would.
+                logger.debug("Prefetching metadata for %s failed: %s", req.link, e)
+        return self._fetch_metadata_from_network(req)
+
+    def _fetch_metadata_from_network(
+        self,
+        req: InstallRequirement,
     ) -> Optional[BaseDistribution]:
         if self.legacy_resolver:
             logger.debug(
@@ -367,10 +449,133 @@ class RequirementPreparer:
                 "Metadata-only fetching is not used as hash checking is required",
             )
             return None
+        metadata_dist = self._fetch_metadata_using_cache(req)
+        if metadata_dist is not None:
+            return metadata_dist
         # Try PEP 658 metadata first, then fall back to lazy wheel if unavailable.
-        return self._fetch_metadata_using_link_data_attr(
-            req
-        ) or self._fetch_metadata_using_lazy_wheel(req.link)
+        metadata_dist = self._fetch_metadata_using_link_data_attr(req)
+        if metadata_dist is not None:
+            metadata_link = req.link.metadata_link()
+            assert metadata_link is not None
+            # Only metadata checked against its own hash is cached.
+            if metadata_link.hash is not None:
+                self._cache_metadata(req.link, metadata_dist)
+            return metadata_dist
+        # Nothing checks what is read from a lazy wheel against the hash of
+        # the wheel. It is cached once the whole wheel has been downloaded.
+        return self._fetch_metadata_using_lazy_wheel(req.link)
+
+    def _fetch_metadata_using_cache(
+        self,
+        req: InstallRequirement,
+    ) -> Optional[BaseDistribution]:
+        """Get the metadata of a distribution from the metadata cache, if there."""
+        if self.metadata_cache is None:
+            return None
+        if req.link.is_wheel:
+            metadata_contents = self.metadata_cache.get(req.link)
+        else:
+            metadata_contents = self._read_cached_source_metadata(req)
+        if metadata_contents is None:
+            return None
+        assert req.req is not None
+        logger.verbose(
+            "Using cached dependency information for %s",
+            req.req,
+        )
+        metadata_dist = get_metadata_distribution(
+            metadata_contents,
+            req.link.filename,
+            req.req.name,
+        )
+        if canonicalize_name(metadata_dist.raw_name) != canonicalize_name(req.req.name):
+            # The same file under another name? Don't take any chances.
+            logger.debug("Ignoring cached metadata of %s", req.link)
+            return None
+        return metadata_dist
+
+    def _cache_metadata(self, link: Link, dist: BaseDistribution) -> None:
+        if self.metadata_cache is None or not self.metadata_cache.should_cache(link):
+            return
+        try:
+            metadata_contents = dist.read_text("METADATA").encode("utf-8")
+        except (OSError, UnicodeError) as e:
+            logger.debug("Could not cache metadata of %s: %s", link, e)
+            return
+        self.metadata_cache.set(link, metadata_contents)
+
+    def _get_source_build_options(
+        self, req: InstallRequirement
+    ) -> Optional[Dict[str, Any]]:
+        """Get what the metadata prepared for an sdist depends on, but the sdist.
+
+        The sdist declares its build requirements, which get installed for,
+        and its backend run by, the running interpreter. Without build
+        isolation, the metadata depends on whatever is installed, so it is
+        not cached.
+        """
+        if self.metadata_cache is None or not self.metadata_cache.include_sdists:
+            return None
+        if not self.build_isolation or req.use_pep517 is False or req.editable:
+            return None
+        return {
+            "environment": get_default_marker_environment().values,
+            "use_pep517": req.use_pep517,
+            "config_settings": req.config_settings,
+        }
+
+    def _read_cached_source_metadata(self, req: InstallRequirement) -> Optional[bytes]:
+        """Read the metadata prepared for an sdist before, if there is some
+        prepared with the versions its build requirements would get now.
+
+        Only the static build requirements are checked, as the rest of the
+        build environment is not known without installing it, which is what
+        this avoids.
+        """
+        build_options = self._get_source_build_options(req)
+        if build_options is None or req.req is None:
+            return None
+        assert self.metadata_cache is not None
+        entry = self.metadata_cache.get_source_entry(req.link, build_options)
+        if entry is None:
+            return None
+        for metadata_directory, build_requirements in entry.iter_prepared():
+            if not self._are_build_requirements_current(build_requirements):
+                continue
+            try:
+                with open(os.path.join(metadata_directory, "METADATA"), "rb") as f:
+                    return f.read()
+            except OSError:
+                continue
+        return None
+
+    def _are_build_requirements_current(
+        self, build_requirements: Dict[str, Any]
+    ) -> bool:
+        """Whether each build requirement would still be satisfied with the
+        version of a distribution it was satisfied with before.
+        """
+        try:
+            recorded = [
+                (get_requirement(item["requirement"]), item["version"])
+                for item in build_requirements["requirements"]
+            ]
+        except (InvalidRequirement, KeyError, TypeError):
+            return False
+        for requirement, version in recorded:
+            marker = requirement.marker
+            if marker is not None and not evaluate_marker(marker):
+                if version is not None:
+                    return False
+                continue
+            if requirement.url or version is None:
+                return False
+            best_candidate = self.finder.find_best_candidate(
+                requirement.name, requirement.specifier
+            ).best_candidate
+            if best_candidate is None or str(best_candidate.version) != version:
+                return False
+        return True
 
     def _fetch_metadata_using_link_data_attr(
         self,
@@ -637,13 +842,28 @@ class RequirementPreparer:
         if local_file:
             req.local_file_path = local_file.path
 
+        # Loading pyproject.toml settles use_pep517, so this is worked out
+        # from the options first.
+        build_options = None
+        if not link.is_wheel:
+            build_options = self._get_source_build_options(req)
+        if build_options is not None:
+            assert self.metadata_cache is not None
+            req.metadata_cache_entry = self.metadata_cache.get_source_entry(
+                link, build_options
+            )
+
         dist = _get_prepared_distribution(
             req,
             self.build_tracker,
             self.finder,
             self.build_isolation,
             self.check_build_deps,
+            self.build_env_cache,
+            self.build_env_installer,
         )
+        # The file's hash has been checked, if the link had one.
+        self._cache_metadata(link, dist)
         return dist
 
     def save_linked_requirement(self, req: InstallRequirement) -> None:
@@ -699,6 +919,8 @@ class RequirementPreparer:
                 self.finder,
                 self.build_isolation,
                 self.check_build_deps,
+                self.build_env_cache,
+                self.build_env_installer,
             )
 
             req.check_if_exists(self.use_user_site)
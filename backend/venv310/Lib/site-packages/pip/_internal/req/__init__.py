@@ -1,8 +1,37 @@
 import collections
+import functools
 import logging
-from typing import Generator, List, Optional, Sequence, Tuple
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from pip._internal.utils.logging import indent_log
+from pip._vendor.packaging.utils import canonicalize_name
+
+from pip._internal.cache import UnpackedWheelStore
+from pip._internal.exceptions import InstallationError
+from pip._internal.locations import get_scheme
+from pip._internal.metadata import (
+    FilesystemWheel,
+    get_default_environment,
+    get_wheel_distribution,
+)
+from pip._internal.models.scheme import SCHEME_KEYS
+from pip._internal.operations.install.bytecode import BytecodeCompiler
+from pip._internal.operations.install.wheel import (
+    get_console_script_specs,
+    get_entrypoints,
+)
+from pip._internal.utils.logging import get_indentation, indent_log
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
@@ -34,6 +63,132 @@ def _validate_requirements(
         yield req.name, req
 
 
+def _get_install_paths(
+    requirement: InstallRequirement,
+    root: Optional[str],
+    home: Optional[str],
+    prefix: Optional[str],
+    use_user_site: bool,
+) -> Optional[FrozenSet[str]]:
+    """Get the paths installing a requirement writes to or removes.
+
+    Files in a library directory are reduced to the top-level entry holding
+    them (a package, module or .dist-info directory), so that two wheels
+    sharing a namespace package are not installed at the same time. Other
+    files (scripts, data, headers) are given in full, and so are the scripts
+    generated from entry points, with their Windows launcher variants.
+
+    :return: The paths, or None if they cannot be determined.
+    """
+    assert requirement.req is not None
+    if not requirement.is_wheel or requirement.local_file_path is None:
+        return None
+
+    scheme = get_scheme(
+        requirement.req.name,
+        user=use_user_site,
+        home=home,
+        root=root,
+        isolated=requirement.isolated,
+        prefix=prefix,
+    )
+    lib_dirs = {scheme.purelib, scheme.platlib}
+    paths = set()
+    with zipfile.ZipFile(requirement.local_file_path, allowZip64=True) as z:
+        names = z.namelist()
+    for name in names:
+        parts = [part for part in name.split("/") if part]
+        if not parts:
+            continue
+        if len(parts) > 2 and parts[0].endswith(".data"):
+            scheme_key = parts[1]
+            if scheme_key not in SCHEME_KEYS:
+                return None
+            if scheme_key in ("purelib", "platlib"):
+                paths.add(os.path.join(getattr(scheme, scheme_key), parts[2]))
+            else:
+                paths.add(os.path.join(getattr(scheme, scheme_key), *parts[2:]))
+        else:
+            paths.update(os.path.join(lib_dir, parts[0]) for lib_dir in lib_dirs)
+
+    try:
+        dist = get_wheel_distribution(
+            FilesystemWheel(requirement.local_file_path),
+            canonicalize_name(requirement.req.name),
+        )
+        console, gui = get_entrypoints(dist)
+    except (InstallationError, ValueError):
+        return None
+    script_names = [
+        spec.split("=", 1)[0].strip() for spec in get_console_script_specs(console)
+    ]
+    script_names.extend(gui)
+    for script_name in script_names:
+        for suffix in ("", ".exe", "-script.py", "-script.pyw"):
+            paths.add(os.path.join(scheme.scripts, script_name + suffix))
+
+    if requirement.should_reinstall:
+        dist = get_default_environment().get_distribution(requirement.req.name)
+        if dist is not None:
+            entries = dist.iter_declared_entries()
+            if entries is None or dist.location is None:
+                return None
+            location = os.path.normcase(os.path.abspath(dist.location))
+            for entry in entries:
+                path = os.path.normcase(os.path.join(location, entry))
+                path = os.path.normpath(path)
+                relative = os.path.relpath(path, location).split(os.path.sep)
+                if relative[0] != os.path.pardir:
+                    path = os.path.join(location, relative[0])
+                paths.add(path)
+
+    return frozenset(os.path.normcase(os.path.abspath(path)) for path in paths)
+
+
+def _install_one(
+    req_name: str,
+    requirement: InstallRequirement,
+    global_options: Sequence[str],
+    root: Optional[str],
+    home: Optional[str],
+    prefix: Optional[str],
+    warn_script_location: bool,
+    use_user_site: bool,
+    pycompile: bool,
+    compiler: BytecodeCompiler,
+    wheel_store: Optional[UnpackedWheelStore],
+) -> InstallationResult:
+    if requirement.should_reinstall:
+        logger.info("Attempting uninstall: %s", req_name)
+        with indent_log():
+            uninstalled_pathset = requirement.uninstall(auto_confirm=True)
+    else:
+        uninstalled_pathset = None
+
+    try:
+        requirement.install(
+            global_options,
+            root=root,
+            home=home,
+            prefix=prefix,
+            warn_script_location=warn_script_location,
+            use_user_site=use_user_site,
+            pycompile=pycompile,
+            compiler=compiler,
+            wheel_store=wheel_store,
+        )
+    except Exception:
+        # if install did not succeed, rollback previous uninstall
+        if uninstalled_pathset and not requirement.install_succeeded:
+            uninstalled_pathset.rollback()
+        raise
+    else:
+        if uninstalled_pathset and requirement.install_succeeded:
+            uninstalled_pathset.commit()
+
+    return InstallationResult(req_name)
+
+
 def install_given_reqs(
     requirements: List[InstallRequirement],
     global_options: Sequence[str],
@@ -43,11 +198,25 @@ def install_given_reqs(
     warn_script_location: bool,
     use_user_site: bool,
     pycompile: bool,
+    compile_jobs: int = 1,
+    deferred_compile: bool = False,
+    install_workers: int = 1,
+    wheel_store: Optional[UnpackedWheelStore] = None,
 ) -> List[InstallationResult]:
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    :param compile_jobs: The number of processes byte-compiling the installed
+        files, shared by all the requirements.
+    :param deferred_compile: Whether to only record the installed files as
+        pending byte-compilation, instead of compiling them.
+    :param install_workers: The number of requirements installed at the same
+        time. Requirements whose files overlap are still installed one after
+        the other, in order.
+    :param wheel_store: The store of unpacked wheels to install files from, if
+        any.
     """
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
@@ -59,34 +228,88 @@ def install_given_reqs(
 
     installed = []
 
-    with indent_log():
-        for req_name, requirement in to_install.items():
-            if requirement.should_reinstall:
-                logger.info("Attempting uninstall: %s", req_name)
-                with indent_log():
-                    uninstalled_pathset = requirement.uninstall(auto_confirm=True)
-            else:
-                uninstalled_pathset = None
-
-            try:
-                requirement.install(
-                    global_options,
-                    root=root,
-                    home=home,
-                    prefix=prefix,
-                    warn_script_location=warn_script_location,
-                    use_user_site=use_user_site,
-                    pycompile=pycompile,
-                )
-            except Exception:
-                # if install did not succeed, rollback previous uninstall
-                if uninstalled_pathset and not requirement.install_succeeded:
-                    uninstalled_pathset.rollback()
-                raise
-            else:
-                if uninstalled_pathset and requirement.install_succeeded:
-                    uninstalled_pathset.commit()
+    with indent_log(), BytecodeCompiler(
+        compile_jobs, deferred=deferred_compile
+    ) as compiler:
+        install = functools.partial(
+            _install_one,
+            global_options=global_options,
+            root=root,
+            home=home,
+            prefix=prefix,
+            warn_script_location=warn_script_location,
+            use_user_site=use_user_site,
+            pycompile=pycompile,
+            compiler=compiler,
+            wheel_store=wheel_store,
+        )
+        if install_workers <= 1 or len(to_install) <= 1:
+            for req_name, requirement in to_install.items():
+                installed.append(install(req_name, requirement))
+        else:
+            get_install_paths = functools.partial(
+                _get_install_paths,
+                root=root,
+                home=home,
+                prefix=prefix,
+                use_user_site=use_user_site,
+            )
+            installed = _install_concurrently(
+                to_install, install, get_install_paths, install_workers
+            )
+
+    return installed
 
-            installed.append(InstallationResult(req_name))
 
+def _install_concurrently(
+    to_install: Dict[str, InstallRequirement],
+    install: Callable[[str, InstallRequirement], InstallationResult],
+    get_install_paths: Callable[[InstallRequirement], Optional[FrozenSet[str]]],
+    workers: int,
+) -> List[InstallationResult]:
+    """Install requirements in a thread pool.
+
+    A requirement is only started once every earlier requirement it shares
+    paths with has finished; one whose paths are unknown waits for all of
+    them, and holds back all the later ones. Each requirement keeps rolling
+    back its own uninstallation if it fails. Once one fails, no more are
+    started, and the error is raised once those in progress have finished.
+    """
+    indentation = get_indentation()
+
+    def install_with_indentation(
+        req_name: str, requirement: InstallRequirement
+    ) -> InstallationResult:
+        with indent_log(indentation):
+            return install(req_name, requirement)
+
+    futures: Dict[str, "Future[InstallationResult]"] = {}
+    # The paths of the requirements in progress, None standing for all paths.
+    in_progress: Dict["Future[InstallationResult]", Optional[FrozenSet[str]]] = {}
+
+    def conflicts(paths: Optional[FrozenSet[str]]) -> bool:
+        return any(
+            paths is None or other is None or not paths.isdisjoint(other)
+            for other in in_progress.values()
+        )
+
+    failed = False
+    with ThreadPoolExecutor(workers) as executor:
+        for req_name, requirement in to_install.items():
+            paths = get_install_paths(requirement)
+            while in_progress and (conflicts(paths) or len(in_progress) >= workers):
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del in_progress[future]
+                    failed = failed or future.exception() is not None
+            if failed:
+                break
+            future = executor.submit(install_with_indentation, req_name, requirement)
+            futures[req_name] = future
+            in_progress[future] = paths
+
+    installed = []
+    for future in futures.values():
+        # Raises the error of the first requirement that failed to install.
+        installed.append(future.result())
     return installed
@@ -1,4 +1,6 @@
 import functools
+import hashlib
+import json
 import logging
 import os
 import shutil
@@ -18,6 +20,7 @@ from pip._vendor.packaging.version import parse as parse_version
 from pip._vendor.pyproject_hooks import BuildBackendHookCaller
 
 from pip._internal.build_env import BuildEnvironment, NoOpBuildEnvironment
+from pip._internal.cache import SourceMetadataEntry, UnpackedWheelStore
 from pip._internal.exceptions import InstallationError, PreviousBuildDirError
 from pip._internal.locations import get_scheme
 from pip._internal.metadata import (
@@ -29,11 +32,12 @@ from pip._internal.metadata import (
 from pip._internal.metadata.base import FilesystemWheel
 from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
-from pip._internal.operations.build.metadata import generate_metadata
+from pip._internal.operations.build.metadata import copy_metadata, generate_metadata
 from pip._internal.operations.build.metadata_editable import generate_editable_metadata
 from pip._internal.operations.build.metadata_legacy import (
     generate_metadata as generate_metadata_legacy,
 )
+from pip._internal.operations.install.bytecode import BytecodeCompiler
 from pip._internal.operations.install.editable_legacy import (
     install_editable as install_editable_legacy,
 )
@@ -42,6 +46,7 @@ from pip._internal.pyproject import load_pyproject_toml, make_pyproject_path
 from pip._internal.req.req_uninstall import UninstallPathSet
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.markers import evaluate_marker
 from pip._internal.utils.misc import (
     ConfiguredBuildBackendHookCaller,
     ask_path_exists,
@@ -52,7 +57,7 @@ from pip._internal.utils.misc import (
     redact_auth_from_requirement,
     redact_auth_from_url,
 )
-from pip._internal.utils.packaging import safe_extra
+from pip._internal.utils.packaging import get_requirement, safe_extra
 from pip._internal.utils.subprocess import runner_with_spinner_message
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.unpacking import unpack_file
@@ -164,6 +169,10 @@ class InstallRequirement:
         # can ensure that the wheel matches the metadata (see the PEP for
         # details).
         self.metadata_directory: Optional[str] = None
+        # Where the metadata the backend prepares is cached, if it is. What it
+        # prepared before in the same build environment is used instead of
+        # preparing it again.
+        self.metadata_cache_entry: Optional[SourceMetadataEntry] = None
 
         # The static build requirements (from pyproject.toml)
         self.pyproject_requires: Optional[List[str]] = None
@@ -283,11 +292,11 @@ class InstallRequirement:
             extras_requested = ("",)
         if self.markers is not None:
             return any(
-                self.markers.evaluate({"extra": extra})
+                evaluate_marker(self.markers, extra)
                 # TODO: Remove these two variants when packaging is upgraded to
                 # support the marker comparison logic specified in PEP 685.
-                or self.markers.evaluate({"extra": safe_extra(extra)})
-                or self.markers.evaluate({"extra": canonicalize_name(extra)})
+                or evaluate_marker(self.markers, safe_extra(extra))
+                or evaluate_marker(self.markers, canonicalize_name(extra))
                 for extra in extras_requested
             )
         else:
@@ -554,16 +563,68 @@ class InstallRequirement:
                 f"Consider using a build backend that supports PEP 660."
             )
 
+    def _prepare_metadata_using_cache(
+        self, entry: SourceMetadataEntry, details: str
+    ) -> None:
+        assert self.pep517_backend is not None
+        installed = self.build_env.get_installed_distributions()
+        build_env_key = hashlib.sha256(
+            json.dumps(
+                [[dist.canonical_name, str(dist.version)] for dist in installed]
+            ).encode()
+        ).hexdigest()
+        cached_metadata_directory = entry.get(build_env_key)
+        if cached_metadata_directory is not None:
+            logger.info("Using cached metadata for %s", details)
+            self.metadata_directory = copy_metadata(cached_metadata_directory)
+            return
+        self.metadata_directory = generate_metadata(
+            build_env=self.build_env,
+            backend=self.pep517_backend,
+            details=details,
+        )
+        entry.set(
+            build_env_key,
+            self.metadata_directory,
+            self._describe_build_requirements(installed),
+        )
+
+    def _describe_build_requirements(
+        self, installed: List[BaseDistribution]
+    ) -> Dict[str, Any]:
+        """Describe what the static build requirements were satisfied with.
+
+        :return: Each build requirement from pyproject.toml, with the version
+            of the distribution installed for it, or None if none was (as its
+            markers did not apply).
+        """
+        versions = {dist.canonical_name: str(dist.version) for dist in installed}
+        return {
+            "requirements": [
+                {
+                    "requirement": requirement_string,
+                    "version": versions.get(
+                        canonicalize_name(get_requirement(requirement_string).name)
+                    ),
+                }
+                for requirement_string in self.pyproject_requires or ()
+            ],
+        }
+
     def prepare_metadata(self) -> None:
         """Ensure that project metadata is available.
 
-        Under PEP 517 and PEP 660, call the backend hook to prepare the metadata.
+        Under PEP 517 and PEP 660, call the backend hook to prepare the metadata,
+        unless it prepared it before in the same build environment and it was
+        cached.
         Under legacy processing, call setup.py egg-info.
         """
         assert self.source_dir, f"No source dir for {self}"
         details = self.name or f"from {self.link}"
 
-        if self.use_pep517:
+        if self.use_pep517 and self.metadata_cache_entry is not None:
+            self._prepare_metadata_using_cache(self.metadata_cache_entry, details)
+        elif self.use_pep517:
             assert self.pep517_backend is not None
             if (
                 self.editable
@@ -817,6 +878,8 @@ class InstallRequirement:
         warn_script_location: bool = True,
         use_user_site: bool = False,
         pycompile: bool = True,
+        compiler: Optional[BytecodeCompiler] = None,
+        wheel_store: Optional[UnpackedWheelStore] = None,
     ) -> None:
         assert self.req is not None
         scheme = get_scheme(
@@ -862,6 +925,8 @@ class InstallRequirement:
             warn_script_location=warn_script_location,
             direct_url=self.download_info if self.is_direct else None,
             requested=self.user_supplied,
+            compiler=compiler,
+            wheel_store=wheel_store,
         )
         self.install_succeeded = True
 
@@ -1,8 +1,11 @@
 import contextlib
 import functools
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     FrozenSet,
     Iterable,
@@ -47,7 +50,10 @@ from pip._internal.req.req_install import (
 from pip._internal.resolution.base import InstallRequirementProvider
 from pip._internal.utils.compatibility_tags import get_supported
 from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.markers import get_default_marker_environment
 from pip._internal.utils.packaging import get_requirement
+from pip._internal.utils.specifiers import specifier_contains
+from pip._internal.utils.urls import url_to_path
 from pip._internal.utils.virtualenv import running_under_virtualenv
 
 from .base import Candidate, CandidateVersion, Constraint, Requirement
@@ -59,6 +65,7 @@ from .candidates import (
     LinkCandidate,
     RequiresPythonCandidate,
     as_base_candidate,
+    make_install_req_from_link,
 )
 from .found_candidates import FoundCandidates, IndexCandidateInfo
 from .requirements import (
@@ -82,6 +89,10 @@ logger = logging.getLogger(__name__)
 C = TypeVar("C")
 Cache = Dict[Link, C]
 
+# How many of the most preferred candidates of a project to fetch metadata
+# for ahead of time. The resolver usually settles on the first one.
+PREFETCH_CANDIDATES = 2
+
 
 class CollectedRootRequirements(NamedTuple):
     requirements: List[Requirement]
@@ -119,6 +130,14 @@ class Factory:
             Tuple[int, FrozenSet[NormalizedName]], ExtrasCandidate
         ] = {}
 
+        # Metadata of likely candidates is fetched in the background when
+        # downloads are allowed to run in parallel.
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        if preparer.download_workers > 1:
+            self._prefetch_executor = ThreadPoolExecutor(preparer.download_workers)
+        self._prefetch_futures: List["Future[None]"] = []
+        self._prefetched_specs: Set[Tuple[NormalizedName, str]] = set()
+
         if not ignore_installed:
             env = get_default_environment()
             self._installed_dists = {
@@ -243,6 +262,77 @@ class Factory:
                     return None
             return self._link_candidate_cache[link]
 
+    def prefetch_candidates(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching metadata of the best candidates of requirements.
+
+        This is called as soon as requirements are known to the resolver, so
+        that the metadata of their candidates is fetched concurrently rather
+        than one at a time when each candidate gets visited.
+        """
+        if self._prefetch_executor is None:
+            return
+        ireqs: List[Tuple[NormalizedName, InstallRequirement]] = []
+        for requirement in requirements:
+            _, ireq = requirement.get_candidate_lookup()
+            if ireq is not None and ireq.req is not None:
+                ireqs.append((canonicalize_name(ireq.req.name), ireq))
+        # Index pages first, as finding the best candidates needs them.
+        self._finder.prefetch([name for name, _ in ireqs], self._prefetch_executor)
+        for name, ireq in ireqs:
+            assert ireq.req is not None
+            key = (name, str(ireq.req.specifier))
+            if key in self._prefetched_specs:
+                continue
+            self._prefetched_specs.add(key)
+            future = self._prefetch_executor.submit(
+                self._prefetch_best_candidates, ireq, name, self._prefetch_executor
+            )
+            self._prefetch_futures.append(future)
+
+    def _prefetch_best_candidates(
+        self,
+        template: InstallRequirement,
+        name: NormalizedName,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        assert template.req is not None
+        if not self._force_reinstall and name in self._installed_dists:
+            return
+        result = self._finder.find_best_candidate(
+            project_name=name,
+            specifier=template.req.specifier,
+            hashes=template.hashes(trust_internet=False),
+        )
+        icans = [ican for ican in result.iter_applicable() if not ican.link.is_yanked]
+        # PackageFinder returns earlier versions first, so we reverse.
+        for ican in list(reversed(icans))[:PREFETCH_CANDIDATES]:
+            link = ican.link
+            if link in self._link_candidate_cache or link in self._build_failures:
+                continue
+            if self.get_wheel_cache_entry(link, name) is not None:
+                continue
+            ireq = make_install_req_from_link(link, template)
+            self.preparer.prefetch_metadata(ireq, executor)
+
+    def cancel_prefetch(self) -> None:
+        """Stop prefetching that has not started yet.
+
+        This waits for the work that has already started, so nothing is
+        left running in the background once resolution is over.
+        """
+        if self._prefetch_executor is None:
+            return
+        for future in self._prefetch_futures:
+            future.cancel()
+        # Candidates being looked at may still queue metadata fetches, so
+        # let them finish before cancelling what they queued.
+        wait(self._prefetch_futures)
+        self._prefetch_futures.clear()
+        self.preparer.cancel_prefetch()
+        self._finder.cancel_prefetch()
+        self._prefetch_executor.shutdown(wait=True)
+        self._prefetch_executor = None
+
     def _iter_found_candidates(
         self,
         ireqs: Sequence[InstallRequirement],
@@ -281,7 +371,9 @@ class Factory:
                 return None
             # Don't use the installed distribution if its version does not fit
             # the current dependency graph.
-            if not specifier.contains(installed_dist.version, prereleases=True):
+            if not specifier_contains(
+                specifier, installed_dist.version, prereleases=True
+            ):
                 return None
             candidate = self._make_candidate_from_dist(
                 dist=installed_dist,
@@ -516,6 +608,17 @@ class Factory:
         self, root_ireqs: List[InstallRequirement]
     ) -> CollectedRootRequirements:
         collected = CollectedRootRequirements([], {}, {})
+        if self._prefetch_executor is not None:
+            # Fetch the index pages of all named requirements and constraints
+            # up front, while any URL requirements are being prepared below.
+            self._finder.prefetch(
+                {
+                    canonicalize_name(ireq.name)
+                    for ireq in root_ireqs
+                    if ireq.name and not ireq.link and ireq.match_markers()
+                },
+                self._prefetch_executor,
+            )
         for i, ireq in enumerate(root_ireqs):
             if ireq.constraint:
                 # Ensure we only accept valid constraints
@@ -607,6 +710,40 @@ class Factory:
             supported_tags=get_supported(),
         )
 
+    def describe_environment(self) -> Dict[str, Any]:
+        """Describe what the candidates found depend on, besides the index.
+
+        The description can be serialized to JSON, and is the same for as long
+        as finding a requirement would give the same candidates.
+        """
+        finder = self._finder
+        find_links = []
+        for location in finder.find_links:
+            path = url_to_path(location) if location.startswith("file:") else location
+            # The files of a local directory are not listed on any page.
+            if os.path.isdir(path):
+                find_links.append([location, sorted(os.listdir(path))])
+            else:
+                find_links.append([location, None])
+        return {
+            "index_urls": finder.index_urls,
+            "find_links": find_links,
+            "tags": [str(tag) for tag in finder.target_python.get_sorted_tags()],
+            "markers": get_default_marker_environment().values,
+            "python_version": str(self._python_candidate.version),
+            "allow_all_prereleases": finder.allow_all_prereleases,
+            "prefer_binary": finder.prefer_binary,
+            "no_binary": sorted(finder.format_control.no_binary),
+            "only_binary": sorted(finder.format_control.only_binary),
+            "force_reinstall": self._force_reinstall,
+            "ignore_requires_python": self._ignore_requires_python,
+            "use_user_site": self._use_user_site,
+            "installed": sorted(
+                [name, str(dist.version), dist.editable]
+                for name, dist in self._installed_dists.items()
+            ),
+        }
+
     def get_dist_to_uninstall(self, candidate: Candidate) -> Optional[BaseDistribution]:
         # TODO: Are there more cases this needs to return True? Editable?
         dist = self._installed_dists.get(candidate.project_name)
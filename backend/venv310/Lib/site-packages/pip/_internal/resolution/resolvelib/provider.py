@@ -6,11 +6,14 @@ from typing import (
     Iterable,
     Iterator,
     Mapping,
+    NamedTuple,
+    Optional,
     Sequence,
     TypeVar,
     Union,
 )
 
+from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.resolvelib.providers import AbstractProvider
 
 from .base import Candidate, Constraint, Requirement
@@ -241,7 +244,11 @@ class PipProvider(_ProviderBase):
 
     def get_dependencies(self, candidate: Candidate) -> Sequence[Requirement]:
         with_requires = not self._ignore_dependencies
-        return [r for r in candidate.iter_dependencies(with_requires) if r is not None]
+        requirements = [
+            r for r in candidate.iter_dependencies(with_requires) if r is not None
+        ]
+        self._factory.prefetch_candidates(requirements)
+        return requirements
 
     @staticmethod
     def is_backtrack_cause(
@@ -253,3 +260,75 @@ class PipProvider(_ProviderBase):
             if backtrack_cause.parent and identifier == backtrack_cause.parent.name:
                 return True
         return False
+
+
+class Pin(NamedTuple):
+    """The candidate a resolution picked for an identifier."""
+
+    version: str
+    url: Optional[str]
+    installed: bool
+
+    @classmethod
+    def from_candidate(cls, candidate: Candidate) -> "Pin":
+        link = candidate.source_link
+        return cls(
+            str(candidate.version),
+            None if link is None else link.url,
+            candidate.is_installed,
+        )
+
+    def matches(self, candidate: Candidate) -> bool:
+        return self == Pin.from_candidate(candidate)
+
+
+class PinnedProvider(PipProvider):
+    """A provider that only offers the candidates a resolution picked before.
+
+    Resolving with it checks that those candidates can still be found, and
+    still satisfy each other's requirements, with nothing to backtrack on.
+    """
+
+    def __init__(
+        self,
+        factory: Factory,
+        constraints: Dict[str, Constraint],
+        ignore_dependencies: bool,
+        upgrade_strategy: str,
+        user_requested: Dict[str, int],
+        pins: Mapping[str, Pin],
+    ) -> None:
+        # Only the pinned version of each project is looked for.
+        constraints = dict(constraints)
+        for identifier, pin in pins.items():
+            name, _, _ = identifier.partition("[")
+            constraint = constraints.get(name, Constraint.empty())
+            constraints[name] = Constraint(
+                constraint.specifier & SpecifierSet(f"==={pin.version}"),
+                constraint.hashes,
+                constraint.links,
+            )
+        super().__init__(
+            factory=factory,
+            constraints=constraints,
+            ignore_dependencies=ignore_dependencies,
+            upgrade_strategy=upgrade_strategy,
+            user_requested=user_requested,
+        )
+        self._pins = pins
+
+    def find_matches(
+        self,
+        identifier: str,
+        requirements: Mapping[str, Iterator[Requirement]],
+        incompatibilities: Mapping[str, Iterator[Candidate]],
+    ) -> Iterable[Candidate]:
+        pin = self._pins.get(identifier)
+        if pin is None:
+            return ()
+        for candidate in super().find_matches(
+            identifier, requirements, incompatibilities
+        ):
+            if pin.matches(candidate):
+                return [candidate]
+        return ()
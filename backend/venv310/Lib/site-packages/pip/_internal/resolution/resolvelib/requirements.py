@@ -3,6 +3,7 @@ from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 
 from pip._internal.req.constructors import install_req_drop_extras
 from pip._internal.req.req_install import InstallRequirement
+from pip._internal.utils.specifiers import specifier_contains
 
 from .base import Candidate, CandidateLookup, Requirement, format_name
 
@@ -84,7 +85,7 @@ class SpecifierRequirement(Requirement):
         # prerelease candidates if the user does not expect them.
         assert self._ireq.req, "Specifier-backed ireq is always PEP 508"
         spec = self._ireq.req.specifier
-        return spec.contains(candidate.version, prereleases=True)
+        return specifier_contains(spec, candidate.version, prereleases=True)
 
 
 class SpecifierWithoutExtrasRequirement(SpecifierRequirement):
@@ -124,7 +125,9 @@ class RequiresPythonRequirement(Requirement):
         return str(self)
 
     def get_candidate_lookup(self) -> CandidateLookup:
-        if self.specifier.contains(self._candidate.version, prereleases=True):
+        if specifier_contains(
+            self.specifier, self._candidate.version, prereleases=True
+        ):
             return self._candidate, None
         return None, None
 
@@ -133,7 +136,7 @@ class RequiresPythonRequirement(Requirement):
         # We can safely always allow prereleases here since PackageFinder
         # already implements the prerelease logic, and would have filtered out
         # prerelease candidates if the user does not expect them.
-        return self.specifier.contains(candidate.version, prereleases=True)
+        return specifier_contains(self.specifier, candidate.version, prereleases=True)
 
 
 class UnsatisfiableRequirement(Requirement):
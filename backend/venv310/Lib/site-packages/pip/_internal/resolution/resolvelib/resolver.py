@@ -1,22 +1,32 @@
 import contextlib
 import functools
+import hashlib
+import json
 import logging
 import os
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
 
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.resolvelib import BaseReporter, ResolutionImpossible
+from pip._vendor.resolvelib import (
+    BaseReporter,
+    ResolutionImpossible,
+    ResolutionTooDeep,
+)
 from pip._vendor.resolvelib import Resolver as RLResolver
 from pip._vendor.resolvelib.structs import DirectedGraph
 
-from pip._internal.cache import WheelCache
+from pip._internal.cache import ResolutionCache, WheelCache
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.operations.prepare import RequirementPreparer
 from pip._internal.req.constructors import install_req_extend_extras
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_set import RequirementSet
 from pip._internal.resolution.base import BaseResolver, InstallRequirementProvider
-from pip._internal.resolution.resolvelib.provider import PipProvider
+from pip._internal.resolution.resolvelib.provider import (
+    Pin,
+    PinnedProvider,
+    PipProvider,
+)
 from pip._internal.resolution.resolvelib.reporter import (
     PipDebuggingReporter,
     PipReporter,
@@ -24,7 +34,7 @@ from pip._internal.resolution.resolvelib.reporter import (
 from pip._internal.utils.packaging import get_requirement
 
 from .base import Candidate, Requirement
-from .factory import Factory
+from .factory import CollectedRootRequirements, Factory
 
 if TYPE_CHECKING:
     from pip._vendor.resolvelib.resolvers import Result as RLResult
@@ -34,6 +44,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Changed whenever what the cache key of a resolution covers changes.
+RESOLUTION_CACHE_VERSION = 1
+
 
 class Resolver(BaseResolver):
     _allowed_strategies = {"eager", "only-if-needed", "to-satisfy-only"}
@@ -51,6 +64,7 @@ class Resolver(BaseResolver):
         force_reinstall: bool,
         upgrade_strategy: str,
         py_version_info: Optional[Tuple[int, ...]] = None,
+        resolution_cache: Optional[ResolutionCache] = None,
     ):
         super().__init__()
         assert upgrade_strategy in self._allowed_strategies
@@ -68,6 +82,8 @@ class Resolver(BaseResolver):
         )
         self.ignore_dependencies = ignore_dependencies
         self.upgrade_strategy = upgrade_strategy
+        self._finder = finder
+        self._resolution_cache = resolution_cache
         self._result: Optional[Result] = None
 
     def resolve(
@@ -90,11 +106,27 @@ class Resolver(BaseResolver):
             reporter,
         )
 
+        self.factory.prefetch_candidates(collected.requirements)
         try:
-            limit_how_complex_resolution_can_be = 200000
-            result = self._result = resolver.resolve(
-                collected.requirements, max_rounds=limit_how_complex_resolution_can_be
-            )
+            result = None
+            # What a local directory, VCS or archive URL depends on can change
+            # without its URL changing, so resolutions involving one are not
+            # cached.
+            cache_key: Optional[str] = None
+            if self._resolution_cache is not None and not any(
+                ireq.link for ireq in root_reqs
+            ):
+                cache_key = self._get_cache_key(root_reqs)
+                result = self._resolve_from_cache(cache_key, collected, reporter)
+            if result is None:
+                limit_how_complex_resolution_can_be = 200000
+                result = resolver.resolve(
+                    collected.requirements,
+                    max_rounds=limit_how_complex_resolution_can_be,
+                )
+                if cache_key is not None:
+                    self._cache_result(cache_key, result)
+            self._result = result
 
         except ResolutionImpossible as e:
             error = self.factory.get_installation_error(
@@ -103,6 +135,9 @@ class Resolver(BaseResolver):
             )
             raise error from e
 
+        finally:
+            self.factory.cancel_prefetch()
+
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         # process candidates with extras last to ensure their base equivalent is
         # already in the req_set if appropriate.
@@ -182,6 +217,112 @@ class Resolver(BaseResolver):
             req.needs_more_preparation = False
         return req_set
 
+    def _get_cache_key(self, root_reqs: List[InstallRequirement]) -> str:
+        """Get the digest of everything resolving root_reqs depends on.
+
+        That is except for the index pages, whose validators are checked when
+        the result is reused.
+        """
+        requirements = [
+            [
+                None if ireq.req is None else str(ireq.req),
+                sorted(ireq.extras),
+                None if ireq.markers is None else str(ireq.markers),
+                ireq.hash_options,
+                ireq.editable,
+                ireq.constraint,
+                ireq.user_supplied,
+            ]
+            for ireq in root_reqs
+        ]
+        key_parts = {
+            "version": RESOLUTION_CACHE_VERSION,
+            "requirements": requirements,
+            "environment": self.factory.describe_environment(),
+            "ignore_dependencies": self.ignore_dependencies,
+            "upgrade_strategy": self.upgrade_strategy,
+        }
+        data = json.dumps(key_parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _resolve_from_cache(
+        self,
+        cache_key: str,
+        collected: CollectedRootRequirements,
+        reporter: BaseReporter,
+    ) -> Optional["Result"]:
+        """Reuse the result of an earlier resolution of the same requirements.
+
+        The candidates picked then are resolved again without looking at any
+        other, which checks that they can all still be found and satisfy each
+        other. The result is only reused if none of the index pages consulted
+        has changed since either.
+        """
+        assert self._resolution_cache is not None
+        entry = self._resolution_cache.get(cache_key)
+        if entry is None:
+            return None
+        try:
+            pins = {
+                identifier: Pin(version, url, installed)
+                for identifier, (version, url, installed) in entry["pins"].items()
+            }
+            pages: Dict[str, Optional[List[Optional[str]]]] = entry["pages"]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+        provider = PinnedProvider(
+            factory=self.factory,
+            constraints=collected.constraints,
+            ignore_dependencies=self.ignore_dependencies,
+            upgrade_strategy=self.upgrade_strategy,
+            user_requested=collected.user_requested,
+            pins=pins,
+        )
+        resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
+            provider,
+            reporter,
+        )
+        try:
+            result = resolver.resolve(collected.requirements, max_rounds=len(pins) + 1)
+        except (ResolutionImpossible, ResolutionTooDeep):
+            logger.debug("The cached resolution no longer applies")
+            return None
+        if result.mapping.keys() != pins.keys():
+            logger.debug("The cached resolution no longer applies")
+            return None
+
+        for url, validators in pages.items():
+            current = self._finder.get_page_validators(url)
+            if validators != (None if current is None else list(current)):
+                logger.debug("Not using the cached resolution, %s has changed", url)
+                return None
+
+        logger.info("Using cached resolution")
+        return result
+
+    def _cache_result(self, cache_key: str, result: "Result") -> None:
+        assert self._resolution_cache is not None
+        pages = self._finder.page_validators
+        for url, validators in pages.items():
+            if validators == (None, None):
+                logger.debug(
+                    "Not caching the resolution, %s cannot be checked for changes",
+                    url,
+                )
+                return
+        entry = {
+            "pins": {
+                identifier: list(Pin.from_candidate(candidate))
+                for identifier, candidate in result.mapping.items()
+            },
+            "pages": {
+                url: None if validators is None else list(validators)
+                for url, validators in pages.items()
+            },
+        }
+        self._resolution_cache.set(cache_key, entry)
+
     def get_installation_order(
         self, req_set: RequirementSet
     ) -> List[InstallRequirement]:
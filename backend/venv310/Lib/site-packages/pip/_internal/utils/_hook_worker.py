@@ -0,0 +1,129 @@
+"""This is run by pip in a subprocess, to run Python scripts one after another.
+
+pip uses it to call build backend hooks without starting an interpreter, and
+importing the backend, for every hook call. It is run with the environment of
+a build, without pip on sys.path, so it must not import anything from pip.
+
+It expects:
+- Command line args: token
+- Requests on stdin, one JSON object per line:
+  - {"argv": [script, args...], "cwd": ..., "env": {...}}
+
+Results:
+- The output of each script on stdout, followed by the token and the exit
+  status the script would have had as a process.
+"""
+
+import importlib
+import json
+import os
+import os.path
+import runpy
+import sys
+import traceback
+
+
+def contained_in(filename, directory):
+    """Test if a file is located within the given directory."""
+    filename = os.path.normcase(os.path.abspath(filename))
+    directory = os.path.normcase(os.path.abspath(directory))
+    return os.path.commonprefix([filename, directory]) == directory
+
+
+def imported_from(module, directory):
+    """Test if a module was imported from within the given directory.
+
+    Namespace packages have no file, so they are located by their paths.
+    """
+    spec = getattr(module, "__spec__", None)
+    if spec is not None and spec.has_location and spec.origin is not None:
+        if contained_in(spec.origin, directory):
+            return True
+    elif spec is None:
+        filename = getattr(module, "__file__", None)
+        if filename is not None and contained_in(filename, directory):
+            return True
+    paths = getattr(module, "__path__", None) or []
+    return any(contained_in(path, directory) for path in paths)
+
+
+def exit_status(code):
+    """Get the exit status of a process exiting with SystemExit(code)."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_script(argv, cwd, env):
+    """Run a script like ``python *argv`` would, in this process.
+
+    What the script changes in the process is undone afterwards, including
+    the modules it imported from its working directory.
+    """
+    saved_cwd = os.getcwd()
+    saved_environ = dict(os.environ)
+    saved_path = sys.path[:]
+    saved_argv = sys.argv[:]
+    saved_modules = set(sys.modules)
+    saved_streams = sys.stdout, sys.stderr
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        sys.argv = list(argv)
+        sys.path.insert(0, os.path.dirname(os.path.abspath(argv[0])))
+        # Directories may have changed since the last script imported from them.
+        importlib.invalidate_caches()
+        try:
+            runpy.run_path(argv[0], run_name="__main__")
+        except SystemExit as e:
+            return exit_status(e.code)
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+    finally:
+        source_dir = os.getcwd() if cwd is None else cwd
+        for name in set(sys.modules) - saved_modules:
+            if imported_from(sys.modules[name], source_dir):
+                del sys.modules[name]
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = saved_streams
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        os.chdir(saved_cwd)
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit("Needs args: token")
+    token = sys.argv[1]
+
+    # Scripts find their own directory on sys.path, not this one.
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if sys.path and os.path.abspath(sys.path[0]) == script_dir:
+        del sys.path[0]
+
+    # Requests come on the original stdin. Scripts, and the processes they
+    # start, get an empty one instead, like pip gives to subprocesses.
+    requests = os.fdopen(os.dup(0), encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+
+    for line in requests:
+        request = json.loads(line)
+        status = run_script(request["argv"], request["cwd"], request["env"])
+        sys.stdout.write(f"{token} {status}\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ import threading
 from dataclasses import dataclass
 from io import TextIOWrapper
 from logging import Filter
-from typing import Any, ClassVar, Generator, List, Optional, TextIO, Type
+from typing import Any, ClassVar, Generator, List, Optional, TextIO, Tuple, Type
 
 from pip._vendor.rich.console import (
     Console,
@@ -31,6 +31,10 @@ from pip._internal.utils.misc import ensure_dir
 _log_state = threading.local()
 subprocess_logger = getLogger("pip.subprocessor")
 
+# A log record held back by capture_logs(), with the indentation it was
+# emitted at.
+CapturedRecord = Tuple[int, logging.LogRecord]
+
 
 class BrokenStdoutLoggingError(Exception):
     """
@@ -70,6 +74,40 @@ def get_indentation() -> int:
     return getattr(_log_state, "indentation", 0)
 
 
+@contextlib.contextmanager
+def capture_logs() -> Generator[List[CapturedRecord], None, None]:
+    """
+    A context manager which holds back the log messages emitted inside it by
+    the current thread, for replay_logs() to emit them later, all together.
+
+    Inside another one, messages replayed in it are held back by the other.
+    """
+    outer_captured = getattr(_log_state, "captured", None)
+    captured: List[CapturedRecord] = []
+    _log_state.captured = captured
+    try:
+        yield captured
+    finally:
+        _log_state.captured = outer_captured
+
+
+def capturing_logs() -> bool:
+    return getattr(_log_state, "captured", None) is not None
+
+
+def replay_logs(captured: List[CapturedRecord]) -> None:
+    """
+    Emit the log messages held back by capture_logs(), in the current thread.
+    """
+    indentation = get_indentation()
+    try:
+        for record_indentation, record in captured:
+            _log_state.indentation = record_indentation
+            logging.getLogger(record.name).handle(record)
+    finally:
+        _log_state.indentation = indentation
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -211,6 +249,22 @@ class MaxLevelFilter(Filter):
         return record.levelno < self.level
 
 
+class CaptureFilter(Filter):
+
+    """
+    A logging Filter that holds back the records of threads capturing them.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        captured = getattr(_log_state, "captured", None)
+        if captured is None:
+            return True
+        # Every handler sees the record, but it is to be replayed only once.
+        if not captured or captured[-1][1] is not record:
+            captured.append((get_indentation(), record))
+        return False
+
+
 class ExcludeLoggerFilter(Filter):
 
     """
@@ -277,6 +331,9 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
             "version": 1,
             "disable_existing_loggers": False,
             "filters": {
+                "capture": {
+                    "()": "pip._internal.utils.logging.CaptureFilter",
+                },
                 "exclude_warnings": {
                     "()": "pip._internal.utils.logging.MaxLevelFilter",
                     "level": logging.WARNING,
@@ -307,7 +364,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stdout"],
-                    "filters": ["exclude_subprocess", "exclude_warnings"],
+                    "filters": ["capture", "exclude_subprocess", "exclude_warnings"],
                     "formatter": "indent",
                 },
                 "console_errors": {
@@ -315,7 +372,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stderr"],
-                    "filters": ["exclude_subprocess"],
+                    "filters": ["capture", "exclude_subprocess"],
                     "formatter": "indent",
                 },
                 # A handler responsible for logging to the console messages
@@ -325,7 +382,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "stream": log_streams["stderr"],
                     "no_color": no_color,
-                    "filters": ["restrict_to_subprocess"],
+                    "filters": ["capture", "restrict_to_subprocess"],
                     "formatter": "indent",
                 },
                 "user_log": {
@@ -334,6 +391,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "filename": additional_log_file,
                     "encoding": "utf-8",
                     "delay": True,
+                    "filters": ["capture"],
                     "formatter": "indent_with_timestamp",
                 },
             },
@@ -0,0 +1,58 @@
+"""Memoized evaluation of environment markers.
+
+``Marker.evaluate()`` gathers the values of the environment afresh, and
+parses the versions it compares, every time it is called. Pip evaluates the
+markers of every dependency it comes across, often several times, and they are
+mostly the same few markers: requirements parsed with get_requirement() share
+their Marker objects, so results are remembered per marker object.
+"""
+
+import functools
+import threading
+import weakref
+from typing import Dict, Mapping
+
+from pip._vendor.packaging.markers import (
+    Marker,
+    _evaluate_markers,
+    default_environment,
+)
+
+
+class MarkerEnvironment:
+    """A snapshot of the values markers are evaluated against.
+
+    It needs not be the environment pip is running in. Evaluations are
+    remembered for as long as the environment and the marker exist.
+    """
+
+    def __init__(self, values: Mapping[str, str]) -> None:
+        self.values = dict(values)
+        self._results: "weakref.WeakKeyDictionary[Marker, Dict[str, bool]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def evaluate(self, marker: Marker, extra: str = "") -> bool:
+        """Evaluate a marker like ``marker.evaluate({"extra": extra})``."""
+        with self._lock:
+            results = self._results.get(marker)
+            if results is None:
+                results = self._results[marker] = {}
+            result = results.get(extra)
+        if result is None:
+            environment = dict(self.values, extra=extra)
+            result = _evaluate_markers(marker._markers, environment)
+            results[extra] = result
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_marker_environment() -> MarkerEnvironment:
+    """Get the environment of the running interpreter."""
+    return MarkerEnvironment(default_environment())
+
+
+def evaluate_marker(marker: Marker, extra: str = "") -> bool:
+    """Evaluate a marker for the running interpreter, with an extra."""
+    return get_default_marker_environment().evaluate(marker, extra)
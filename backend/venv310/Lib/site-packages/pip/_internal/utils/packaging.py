@@ -3,9 +3,12 @@ import logging
 import re
 from typing import NewType, Optional, Tuple, cast
 
-from pip._vendor.packaging import specifiers, version
+from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.requirements import Requirement
 
+from pip._internal.utils.pep508 import parse_requirement
+from pip._internal.utils.specifiers import parse_version, specifier_contains
+
 NormalizedExtra = NewType("NormalizedExtra", str)
 
 logger = logging.getLogger(__name__)
@@ -28,21 +31,32 @@ def check_requires_python(
     if requires_python is None:
         # The package provides no information
         return True
-    requires_python_specifier = specifiers.SpecifierSet(requires_python)
+    requires_python_specifier = _get_requires_python_specifier(requires_python)
+
+    python_version = parse_version(".".join(map(str, version_info)))
+    return specifier_contains(requires_python_specifier, python_version)
+
 
-    python_version = version.parse(".".join(map(str, version_info)))
-    return python_version in requires_python_specifier
+@functools.lru_cache(maxsize=None)
+def _get_requires_python_specifier(requires_python: str) -> specifiers.SpecifierSet:
+    # The links of a project mostly share a handful of Requires-Python values.
+    return specifiers.SpecifierSet(requires_python)
 
 
-@functools.lru_cache(maxsize=512)
+@functools.lru_cache(maxsize=10000)
 def get_requirement(req_string: str) -> Requirement:
     """Construct a packaging.Requirement object with caching"""
     # Parsing requirement strings is expensive, and is also expected to happen
     # with a low diversity of different arguments (at least relative the number
     # constructed). This method adds a cache to requirement object creation to
     # minimize repeated parsing of the same string to construct equivalent
-    # Requirement objects.
-    return Requirement(req_string)
+    # Requirement objects. The returned objects are shared, and must not be
+    # modified.
+    req = parse_requirement(req_string)
+    if req is None:
+        # Not simple enough for the fast parser, or invalid.
+        req = Requirement(req_string)
+    return req
 
 
 def safe_extra(extra: str) -> NormalizedExtra:
@@ -0,0 +1,220 @@
+"""A fast parser for PEP 508 requirements and environment markers.
+
+packaging parses requirements and markers with pyparsing grammars, which is
+slow for the thousands of Requires-Dist entries pip goes through when
+resolving or checking an environment. This hand-written parser produces the
+same objects as packaging for the forms found in practice. It returns None for
+anything else, including invalid strings, which are then left to packaging so
+that they are accepted or rejected exactly as before.
+"""
+
+import re
+from typing import Any, List, Optional, Tuple
+
+from pip._vendor.packaging.markers import ALIASES, Marker, Op, Value, Variable
+from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.specifiers import Specifier, SpecifierSet
+
+# What pyparsing skips between tokens.
+_WHITESPACE = " \t\n\r"
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+
+_REQUIREMENT_RE = re.compile(
+    r"""
+    [ \t\n\r]*
+    (?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)
+    [ \t\n\r]*
+    (?:\[(?P<extras>[^\]]*)\])?
+    (?P<specifier>[^;]*)
+    (?:;(?P<marker>.*))?
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Unanchored, like the regex pyparsing matches each specifier with.
+_SPECIFIER_RE = re.compile(Specifier._regex_str, re.VERBOSE | re.IGNORECASE)
+
+# The tokens of the marker grammar of packaging, with the same precedence.
+# Like its literals, they need no word boundary.
+_MARKER_TOKEN_RE = re.compile(
+    r"""
+    [ \t\n\r]*
+    (?:
+        (?P<variable>
+            implementation_version
+            |platform_python_implementation
+            |implementation_name
+            |python_full_version
+            |platform_release
+            |platform_version
+            |platform_machine
+            |platform_system
+            |python_version
+            |sys_platform
+            |os_name
+            |os\.name
+            |sys\.platform
+            |platform\.version
+            |platform\.machine
+            |platform\.python_implementation
+            |python_implementation
+            |extra
+        )
+        |(?P<op>===|==|>=|<=|!=|~=|>|<|not[ ]in|in)
+        |'(?P<single_quoted>[^'\n\r\\]*)'
+        |"(?P<double_quoted>[^"\n\r\\]*)"
+        |(?P<boolop>and|or)
+        |(?P<paren>[()])
+    )
+    """,
+    re.VERBOSE,
+)
+
+_Token = Tuple[str, str]
+
+
+def _tokenize_marker(text: str) -> Optional[List[_Token]]:
+    tokens = []
+    end = len(text.rstrip(_WHITESPACE))
+    pos = 0
+    while pos < end:
+        match = _MARKER_TOKEN_RE.match(text, pos)
+        if match is None:
+            return None
+        kind = match.lastgroup
+        assert kind is not None
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def _make_marker_var(token: _Token) -> Optional[Any]:
+    kind, value = token
+    if kind == "variable":
+        return Variable(ALIASES.get(value, value))
+    if kind in ("single_quoted", "double_quoted"):
+        return Value(value)
+    return None
+
+
+def _parse_marker_expr(
+    tokens: List[_Token], pos: int
+) -> Tuple[Optional[List[Any]], int]:
+    """Parse tokens[pos:] as far as they form a marker expression.
+
+    The result is structured like the parse results of packaging: a flat list
+    of items and boolean operators, with a nested list for each parenthesized
+    expression.
+    """
+    markers: List[Any] = []
+    while True:
+        if pos < len(tokens) and tokens[pos] == ("paren", "("):
+            inner, pos = _parse_marker_expr(tokens, pos + 1)
+            if inner is None or pos >= len(tokens) or tokens[pos] != ("paren", ")"):
+                return None, pos
+            markers.append(inner)
+            pos += 1
+        else:
+            if pos + 3 > len(tokens):
+                return None, pos
+            lhs = _make_marker_var(tokens[pos])
+            kind, op = tokens[pos + 1]
+            rhs = _make_marker_var(tokens[pos + 2])
+            if lhs is None or kind != "op" or rhs is None:
+                return None, pos
+            markers.append((lhs, Op(op), rhs))
+            pos += 3
+        if pos < len(tokens) and tokens[pos][0] == "boolop":
+            markers.append(tokens[pos][1])
+            pos += 1
+        else:
+            return markers, pos
+
+
+def parse_marker(text: str) -> Optional[Marker]:
+    """Parse an environment marker, if it is simple enough.
+
+    :return: The same Marker as packaging would create, or None if the marker
+        must be left to packaging.
+    """
+    if not text.isascii():
+        return None
+    tokens = _tokenize_marker(text)
+    if not tokens:
+        return None
+    markers, pos = _parse_marker_expr(tokens, 0)
+    if markers is None or pos != len(tokens):
+        return None
+    marker = Marker.__new__(Marker)
+    marker._markers = markers
+    return marker
+
+
+def _parse_specifier(text: str) -> Optional[str]:
+    """Check the version specifiers of a requirement, and normalize them.
+
+    :return: The specifiers joined like packaging joins them before creating
+        a SpecifierSet, or None if they must be left to packaging.
+    """
+    text = text.strip(_WHITESPACE)
+    if not text:
+        return ""
+    if text[0] == "(":
+        if text[-1] != ")":
+            return None
+        text = text[1:-1]
+    specifiers = []
+    for specifier in text.split(","):
+        specifier = specifier.strip(_WHITESPACE)
+        # An arbitrary equality can contain anything, even commas.
+        if specifier.startswith("==="):
+            return None
+        match = _SPECIFIER_RE.match(specifier)
+        if match is None or match.end() != len(specifier):
+            return None
+        specifiers.append(specifier)
+    return ",".join(specifiers)
+
+
+def parse_requirement(text: str) -> Optional[Requirement]:
+    """Parse a requirement, if it is simple enough.
+
+    Requirements with a URL are never parsed here.
+
+    :return: The same Requirement as packaging would create, or None if the
+        requirement must be left to packaging.
+    """
+    if not text.isascii():
+        return None
+    match = _REQUIREMENT_RE.fullmatch(text)
+    if match is None:
+        return None
+
+    extras = set()
+    extras_text = match.group("extras")
+    if extras_text is not None and extras_text.strip(_WHITESPACE):
+        for extra in extras_text.split(","):
+            extra = extra.strip(_WHITESPACE)
+            if not _IDENTIFIER_RE.fullmatch(extra):
+                return None
+            extras.add(extra)
+
+    specifier = _parse_specifier(match.group("specifier"))
+    if specifier is None:
+        return None
+
+    marker: Optional[Marker] = None
+    marker_text = match.group("marker")
+    if marker_text is not None:
+        marker = parse_marker(marker_text)
+        if marker is None:
+            return None
+
+    requirement = Requirement.__new__(Requirement)
+    requirement.name = match.group("name")
+    requirement.url = None
+    requirement.extras = extras
+    requirement.specifier = SpecifierSet(specifier)
+    requirement.marker = marker
+    return requirement
@@ -0,0 +1,248 @@
+"""Interned versions, and specifier sets compiled for matching many versions.
+
+packaging parses the version of a specifier again each time it matches a
+version against it, and often the version being matched too. Finding and
+resolving candidates matches every version of a project against the same few
+specifiers, so versions are interned here, and specifier sets are compiled
+once into predicates on parsed versions. These match exactly what
+``SpecifierSet.contains()`` and ``SpecifierSet.filter()`` would.
+"""
+
+import functools
+import itertools
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pip._vendor.packaging.specifiers import (
+    BaseSpecifier,
+    LegacySpecifier,
+    ParsedVersion,
+    SpecifierSet,
+    UnparsedVersion,
+    VersionTypeVar,
+    _is_not_suffix,
+    _pad_version,
+    _version_split,
+)
+from pip._vendor.packaging.version import LegacyVersion, Version, parse
+
+_Predicate = Callable[[ParsedVersion], bool]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_version(version: str) -> ParsedVersion:
+    """Parse a version like packaging.version.parse(), interning the result.
+
+    The returned objects are shared, and must not be modified.
+    """
+    return parse(version)
+
+
+def _coerce_version(version: UnparsedVersion) -> ParsedVersion:
+    if isinstance(version, (Version, LegacyVersion)):
+        return version
+    return parse_version(version)
+
+
+def _public(version: Version) -> Version:
+    if version.local is None:
+        return version
+    return parse_version(version.public)  # type: ignore[return-value]
+
+
+def _compile_equal(spec: str) -> _Predicate:
+    if spec.endswith(".*"):
+        split_spec = _version_split(spec[:-2])
+
+        def matches_prefix(prospective: ParsedVersion) -> bool:
+            split_prospective = _version_split(prospective.public)
+            shortened_prospective = split_prospective[: len(split_spec)]
+            padded_spec, padded_prospective = _pad_version(
+                split_spec, shortened_prospective
+            )
+            return padded_prospective == padded_spec
+
+        return matches_prefix
+
+    spec_version = Version(spec)
+    if spec_version.local:
+        return lambda prospective: prospective == spec_version
+    return lambda prospective: _public(prospective) == spec_version
+
+
+def _compile_compatible(spec: str) -> _Predicate:
+    prefix = ".".join(
+        list(itertools.takewhile(_is_not_suffix, _version_split(spec)))[:-1]
+    )
+    greater_than_equal = _compile_greater_than_equal(spec)
+    equal = _compile_equal(prefix + ".*")
+    return lambda prospective: greater_than_equal(prospective) and equal(prospective)
+
+
+def _compile_not_equal(spec: str) -> _Predicate:
+    equal = _compile_equal(spec)
+    return lambda prospective: not equal(prospective)
+
+
+def _compile_less_than_equal(spec: str) -> _Predicate:
+    spec_version = Version(spec)
+    return lambda prospective: _public(prospective) <= spec_version
+
+
+def _compile_greater_than_equal(spec: str) -> _Predicate:
+    spec_version = Version(spec)
+    return lambda prospective: _public(prospective) >= spec_version
+
+
+def _compile_less_than(spec: str) -> _Predicate:
+    spec_version = Version(spec)
+    spec_base_version = Version(spec_version.base_version)
+
+    def less_than(prospective: ParsedVersion) -> bool:
+        if not prospective < spec_version:
+            return False
+        # Pre-releases of the version in the specifier are not less than it,
+        # unless it is a pre-release itself.
+        if not spec_version.is_prerelease and prospective.is_prerelease:
+            if parse_version(prospective.base_version) == spec_base_version:
+                return False
+        return True
+
+    return less_than
+
+
+def _compile_greater_than(spec: str) -> _Predicate:
+    spec_version = Version(spec)
+    spec_base_version = Version(spec_version.base_version)
+
+    def greater_than(prospective: ParsedVersion) -> bool:
+        if not prospective > spec_version:
+            return False
+        # Neither are post-releases of the version in the specifier, unless it
+        # is a post-release itself, nor local versions of it.
+        if not spec_version.is_postrelease and prospective.is_postrelease:
+            if parse_version(prospective.base_version) == spec_base_version:
+                return False
+        if prospective.local is not None:
+            if parse_version(prospective.base_version) == spec_base_version:
+                return False
+        return True
+
+    return greater_than
+
+
+_COMPILERS = {
+    "~=": _compile_compatible,
+    "==": _compile_equal,
+    "!=": _compile_not_equal,
+    "<=": _compile_less_than_equal,
+    ">=": _compile_greater_than_equal,
+    "<": _compile_less_than,
+    ">": _compile_greater_than,
+}
+
+
+class _CompiledSpecifierSet(NamedTuple):
+    predicates: List[_Predicate]
+    prereleases: Optional[bool]
+
+
+_SpecifierKey = Tuple[str, str, Optional[bool]]
+_SpecifierSetKey = Tuple[Tuple[_SpecifierKey, ...], Optional[bool]]
+
+_compiled_specifier_sets: Dict[_SpecifierSetKey, _CompiledSpecifierSet] = {}
+
+
+def _compile_specifier(operator: str, spec: str) -> _Predicate:
+    if operator == "===":
+        return lambda prospective: str(prospective).lower() == spec.lower()
+    predicate = _COMPILERS[operator](spec)
+
+    def matches(prospective: ParsedVersion) -> bool:
+        # Only an arbitrary equality can match a legacy version.
+        return isinstance(prospective, Version) and predicate(prospective)
+
+    return matches
+
+
+def _get_compiled(specifier: SpecifierSet) -> Optional[_CompiledSpecifierSet]:
+    """Get a specifier set compiled, or None if it has legacy specifiers.
+
+    Those coerce versions in ways that are not worth replicating.
+    """
+    specifier_keys = []
+    for s in specifier:
+        if isinstance(s, LegacySpecifier):
+            return None
+        specifier_keys.append((s.operator, s.version, s._prereleases))
+    # Specifiers that compare equal, like ~=1.0 and ~=1.0.0, can still match
+    # different versions, so the spelling of each specifier is the key.
+    key = (tuple(specifier_keys), specifier._prereleases)
+    compiled = _compiled_specifier_sets.get(key)
+    if compiled is None:
+        compiled = _CompiledSpecifierSet(
+            [_compile_specifier(operator, spec) for operator, spec, _ in key[0]],
+            specifier.prereleases,
+        )
+        _compiled_specifier_sets[key] = compiled
+    return compiled
+
+
+def specifier_contains(
+    specifier: BaseSpecifier,
+    version: UnparsedVersion,
+    prereleases: Optional[bool] = None,
+) -> bool:
+    """Check whether a version matches a specifier, like its contains()."""
+    compiled = None
+    if isinstance(specifier, SpecifierSet):
+        compiled = _get_compiled(specifier)
+    if compiled is None:
+        return specifier.contains(version, prereleases=prereleases)
+    parsed_version = _coerce_version(version)
+    if prereleases is None:
+        prereleases = compiled.prereleases
+    if not prereleases and parsed_version.is_prerelease:
+        return False
+    return all(p(parsed_version) for p in compiled.predicates)
+
+
+def filter_versions(
+    specifier: BaseSpecifier,
+    versions: Iterable[VersionTypeVar],
+    prereleases: Optional[bool] = None,
+) -> List[VersionTypeVar]:
+    """Filter versions with a specifier, like its filter()."""
+    compiled = None
+    if isinstance(specifier, SpecifierSet):
+        compiled = _get_compiled(specifier)
+    if compiled is None:
+        return list(specifier.filter(versions, prereleases=prereleases))
+    if prereleases is None:
+        prereleases = compiled.prereleases
+
+    filtered: List[VersionTypeVar] = []
+    if compiled.predicates:
+        # Every specifier rejects pre-releases unless they are allowed.
+        for version in versions:
+            parsed_version = _coerce_version(version)
+            if not prereleases and parsed_version.is_prerelease:
+                continue
+            if all(p(parsed_version) for p in compiled.predicates):
+                filtered.append(version)
+        return filtered
+
+    # Without specifiers, legacy versions are filtered out, and so are
+    # pre-releases unless there is nothing else.
+    found_prereleases: List[VersionTypeVar] = []
+    for version in versions:
+        parsed_version = _coerce_version(version)
+        if isinstance(parsed_version, LegacyVersion):
+            continue
+        if parsed_version.is_prerelease and not prereleases:
+            if not filtered:
+                found_prereleases.append(version)
+        else:
+            filtered.append(version)
+    if not filtered and found_prereleases and prereleases is None:
+        return found_prereleases
+    return filtered
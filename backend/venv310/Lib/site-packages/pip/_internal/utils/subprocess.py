@@ -1,15 +1,22 @@
+import contextlib
+import json
 import logging
 import os
 import shlex
 import subprocess
+import threading
+import uuid
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Generator,
     Iterable,
     List,
     Mapping,
     Optional,
+    Set,
+    Tuple,
     Union,
 )
 
@@ -28,6 +35,15 @@ if TYPE_CHECKING:
 
 CommandArgs = List[Union[str, HiddenText]]
 
+_subprocess_state = threading.local()
+
+_HOOK_WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "_hook_worker.py")
+
+# How many hook workers are kept waiting for calls, at most.
+_MAX_IDLE_HOOK_WORKERS = 4
+
+_HookWorkerKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
 
 def make_command(*args: Union[str, HiddenText, CommandArgs]) -> CommandArgs:
     """
@@ -68,6 +84,191 @@ def reveal_command_args(args: Union[List[str], CommandArgs]) -> List[str]:
     return [arg.secret if isinstance(arg, HiddenText) else arg for arg in args]
 
 
+@contextlib.contextmanager
+def subprocess_environ(environ: Mapping[str, str]) -> Generator[None, None, None]:
+    """
+    A context manager which sets environment variables for the subprocesses
+    started by the current thread inside it. Unlike changing os.environ, this
+    does not affect other threads.
+    """
+    old_environ = getattr(_subprocess_state, "environ", {})
+    _subprocess_state.environ = {**old_environ, **environ}
+    try:
+        yield
+    finally:
+        _subprocess_state.environ = old_environ
+
+
+class _HookWorker:
+    """A Python process running scripts one after another, for hook calls."""
+
+    def __init__(self, python: str, env: Mapping[str, str]) -> None:
+        self.token = uuid.uuid4().hex
+        self._proc = subprocess.Popen(
+            [python, _HOOK_WORKER_SCRIPT, self.token],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env,
+            errors="backslashreplace",
+        )
+
+    def send(self, cmd: List[str], cwd: Optional[str], env: Mapping[str, str]) -> None:
+        """Have the worker run a script, like the command would."""
+        assert self._proc.stdin
+        request = {"argv": cmd[1:], "cwd": cwd, "env": dict(env)}
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+
+    def readline(self) -> str:
+        assert self._proc.stdout
+        return self._proc.stdout.readline()
+
+    def close(self) -> int:
+        """Stop the worker, and return its exit status."""
+        assert self._proc.stdin and self._proc.stdout
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            # It has already exited.
+            pass
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc.stdout.close()
+        return self._proc.returncode
+
+
+class _HookCall:
+    """A hook call served by a worker.
+
+    It is read by call_subprocess() like the process it replaces.
+    """
+
+    def __init__(
+        self, pool: "HookWorkerPool", key: _HookWorkerKey, worker: _HookWorker
+    ) -> None:
+        self._pool = pool
+        self._key = key
+        self._worker = worker
+        # No input is sent to the script.
+        self.stdin = None
+        self.stdout = self
+        self.returncode: Optional[int] = None
+
+    def readline(self) -> str:
+        if self.returncode is not None:
+            return ""
+        line = self._worker.readline()
+        if not line:
+            # The worker itself exited.
+            self.returncode = self._pool.discard(self._worker) or 1
+            return ""
+        output, token, status = line.partition(self._worker.token)
+        if not token:
+            return line
+        self.returncode = int(status)
+        if self.returncode:
+            # What failed may have left the worker in a bad state.
+            self._pool.discard(self._worker)
+        else:
+            self._pool.release(self._key, self._worker)
+        return output
+
+    def close(self) -> None:
+        pass
+
+    def wait(self) -> Optional[int]:
+        return self.returncode
+
+
+class HookWorkerPool:
+    """Long-lived processes calling build backend hooks.
+
+    A worker serves the hook calls made with the same interpreter and Python
+    environment variables, which determine its sys.path, like the calls for
+    a build environment, or for several identical ones. So the build backend
+    is imported once for all of them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._workers: Set[_HookWorker] = set()
+        self._idle: List[Tuple[_HookWorkerKey, _HookWorker]] = []
+
+    def call(
+        self, cmd: List[str], cwd: Optional[str], env: Mapping[str, str]
+    ) -> _HookCall:
+        """Run a hook command in a worker, instead of a new process."""
+        python = cmd[0]
+        python_environ = sorted(
+            (name, value) for name, value in env.items() if name.startswith("PYTHON")
+        )
+        key = (python, tuple(python_environ))
+        worker = None
+        with self._lock:
+            for i in reversed(range(len(self._idle))):
+                if self._idle[i][0] == key:
+                    _, worker = self._idle.pop(i)
+                    break
+        if worker is not None:
+            try:
+                worker.send(cmd, cwd, env)
+            except OSError:
+                # It has exited since its last call.
+                self.discard(worker)
+                worker = None
+        if worker is None:
+            worker = _HookWorker(python, env)
+            with self._lock:
+                self._workers.add(worker)
+            worker.send(cmd, cwd, env)
+        return _HookCall(self, key, worker)
+
+    def release(self, key: _HookWorkerKey, worker: _HookWorker) -> None:
+        with self._lock:
+            self._idle.append((key, worker))
+            if len(self._idle) <= _MAX_IDLE_HOOK_WORKERS:
+                return
+            _, worker = self._idle.pop(0)
+        self.discard(worker)
+
+    def discard(self, worker: _HookWorker) -> int:
+        """Stop a worker, and return its exit status."""
+        with self._lock:
+            self._workers.discard(worker)
+        return worker.close()
+
+    def close(self) -> None:
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+            self._idle.clear()
+        for worker in workers:
+            worker.close()
+
+
+_hook_worker_pool: Optional[HookWorkerPool] = None
+
+
+@contextlib.contextmanager
+def hook_workers() -> Generator[None, None, None]:
+    """
+    A context manager in which build backend hooks are called by long-lived
+    workers, rather than by a new process each.
+    """
+    global _hook_worker_pool
+    old_pool = _hook_worker_pool
+    pool = _hook_worker_pool = HookWorkerPool()
+    try:
+        yield
+    finally:
+        _hook_worker_pool = old_pool
+        pool.close()
+
+
 def call_subprocess(
     cmd: Union[List[str], CommandArgs],
     show_stdout: bool = False,
@@ -79,6 +280,7 @@ def call_subprocess(
     spinner: Optional[SpinnerInterface] = None,
     log_failed_cmd: Optional[bool] = True,
     stdout_only: Optional[bool] = False,
+    use_hook_worker: bool = False,
     *,
     command_desc: str,
 ) -> str:
@@ -94,6 +296,9 @@ def call_subprocess(
       stdout_only: if true, return only stdout, else return both. When true,
         logging of both stdout and stderr occurs when the subprocess has
         terminated, else logging occurs as subprocess output is produced.
+      use_hook_worker: if true, and inside hook_workers(), the command is run
+        by a hook worker. It must run a Python script calling a build backend
+        hook, and not need to be a process of its own.
     """
     if extra_ok_returncodes is None:
         extra_ok_returncodes = []
@@ -133,21 +338,27 @@ def call_subprocess(
 
     log_subprocess("Running command %s", command_desc)
     env = os.environ.copy()
+    env.update(getattr(_subprocess_state, "environ", {}))
     if extra_environ:
         env.update(extra_environ)
     for name in unset_environ:
         env.pop(name, None)
+    pool = _hook_worker_pool if use_hook_worker and not stdout_only else None
+    proc: Union["subprocess.Popen[str]", _HookCall]
     try:
-        proc = subprocess.Popen(
-            # Convert HiddenText objects to the underlying str.
-            reveal_command_args(cmd),
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT if not stdout_only else subprocess.PIPE,
-            cwd=cwd,
-            env=env,
-            errors="backslashreplace",
-        )
+        if pool is not None:
+            proc = pool.call(reveal_command_args(cmd), cwd, env)
+        else:
+            proc = subprocess.Popen(
+                # Convert HiddenText objects to the underlying str.
+                reveal_command_args(cmd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if not stdout_only else subprocess.PIPE,
+                cwd=cwd,
+                env=env,
+                errors="backslashreplace",
+            )
     except Exception as exc:
         if log_failed_cmd:
             subprocess_logger.critical(
@@ -159,8 +370,8 @@ def call_subprocess(
     all_output = []
     if not stdout_only:
         assert proc.stdout
-        assert proc.stdin
-        proc.stdin.close()
+        if proc.stdin:
+            proc.stdin.close()
         # In this mode, stdout and stderr are in the same pipe.
         while True:
             line: str = proc.stdout.readline()
@@ -184,6 +395,7 @@ def call_subprocess(
     else:
         # In this mode, stdout and stderr are in different pipes.
         # We must use communicate() which is the only safe way to read both.
+        assert isinstance(proc, subprocess.Popen)
         out, err = proc.communicate()
         # log line by line to preserve pip log indenting
         for out_line in out.splitlines():
@@ -255,6 +467,7 @@ def runner_with_spinner_message(message: str) -> Callable[..., None]:
                 cwd=cwd,
                 extra_environ=extra_environ,
                 spinner=spinner,
+                use_hook_worker=True,
             )
 
     return runner
@@ -1,14 +1,19 @@
 """Utilities related archives.
 """
 
+import functools
+import io
 import logging
+import mmap
 import os
 import shutil
 import stat
+import struct
 import tarfile
 import zipfile
-from typing import Iterable, List, Optional
-from zipfile import ZipInfo
+import zlib
+from typing import BinaryIO, Iterable, List, Optional
+from zipfile import ZipFile, ZipInfo
 
 from pip._internal.exceptions import InstallationError
 from pip._internal.utils.filetypes import (
@@ -40,8 +45,13 @@ except ImportError:
     logger.debug("lzma module is not available")
 
 
+@functools.lru_cache(maxsize=None)
 def current_umask() -> int:
-    """Get the current umask which involves having to set it temporarily."""
+    """Get the current umask which involves having to set it temporarily.
+
+    The result is cached, since pip never changes the umask, and setting it
+    temporarily would affect the files created by other threads meanwhile.
+    """
     mask = os.umask(0)
     os.umask(mask)
     return mask
@@ -100,6 +110,60 @@ def zip_item_is_executable(info: ZipInfo) -> bool:
     return bool(mode and stat.S_ISREG(mode) and mode & 0o111)
 
 
+# The start of the local file header of a zip member, up to the lengths of its
+# file name and extra field, after which its data begins.
+_LOCAL_FILE_HEADER = struct.Struct("<4s22xHH")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# Small enough for each chunk to still be in the CPU cache when it gets written
+# after its CRC has been computed.
+_STORED_MEMBER_CHUNK_SIZE = 256 * 1024
+
+
+def copy_stored_member(zip: ZipFile, info: ZipInfo, dest: BinaryIO) -> bool:
+    """Copy a member stored without compression straight from the zip file.
+
+    The zip file is mapped in memory and the member's data written to dest
+    from the mapping, checking its CRC on the way, which avoids the reads
+    into intermediate buffers of ZipFile.open().
+
+    Returns False, having written nothing, when the member is compressed or
+    cannot be copied this way; it must then be extracted with ZipFile.open().
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return False
+    if info.file_size < io.DEFAULT_BUFFER_SIZE:
+        # Not worth mapping the file.
+        return False
+    try:
+        fileno = zip.fp.fileno()  # type: ignore[union-attr]
+        mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    with mapping, memoryview(mapping) as data:
+        header_end = info.header_offset + _LOCAL_FILE_HEADER.size
+        with data[info.header_offset : header_end] as header:
+            if len(header) != _LOCAL_FILE_HEADER.size:
+                return False
+            signature, name_length, extra_length = _LOCAL_FILE_HEADER.unpack(header)
+        if signature != _LOCAL_FILE_HEADER_SIGNATURE:
+            return False
+        start = header_end + name_length + extra_length
+        end = start + info.file_size
+        if end > len(data):
+            raise zipfile.BadZipFile(f"Truncated file {info.filename!r}")
+
+        crc = 0
+        for offset in range(start, end, _STORED_MEMBER_CHUNK_SIZE):
+            with data[offset : min(offset + _STORED_MEMBER_CHUNK_SIZE, end)] as chunk:
+                crc = zlib.crc32(chunk, crc)
+                dest.write(chunk)
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return True
+
+
 def unzip_file(filename: str, location: str, flatten: bool = True) -> None:
     """
     Unzip the file (with path `filename`) to the destination `location`.  All
@@ -134,12 +198,12 @@ def unzip_file(filename: str, location: str, flatten: bool = True) -> None:
                 ensure_dir(dir)
                 # Don't use read() to avoid allocating an arbitrarily large
                 # chunk of memory for the file's content
-                fp = zip.open(name)
                 try:
                     with open(fn, "wb") as destfp:
-                        shutil.copyfileobj(fp, destfp)
+                        if not copy_stored_member(zip, info, destfp):
+                            with zip.open(info) as fp:
+                                shutil.copyfileobj(fp, destfp)
                 finally:
-                    fp.close()
                     if zip_item_is_executable(info):
                         set_extracted_file_to_default_mode_plus_executable(fn)
     finally:
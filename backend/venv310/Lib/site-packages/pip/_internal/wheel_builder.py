@@ -5,7 +5,8 @@ import logging
 import os.path
 import re
 import shutil
-from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, ContextManager, Iterable, List, Optional, Tuple
 
 from pip._vendor.packaging.utils import canonicalize_name, canonicalize_version
 from pip._vendor.packaging.version import InvalidVersion, Version
@@ -19,7 +20,13 @@ from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_editable import build_wheel_editable
 from pip._internal.operations.build.wheel_legacy import build_wheel_legacy
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import (
+    CapturedRecord,
+    capture_logs,
+    get_indentation,
+    indent_log,
+    replay_logs,
+)
 from pip._internal.utils.misc import ensure_dir, hash_file
 from pip._internal.utils.setuptools_build import make_setuptools_clean_args
 from pip._internal.utils.subprocess import call_subprocess
@@ -171,9 +178,12 @@ def _build_one(
     build_options: List[str],
     global_options: List[str],
     editable: bool,
+    in_thread: bool = False,
 ) -> Optional[str]:
     """Build one wheel.
 
+    :param in_thread: Whether other wheels may be built at the same time, in
+        other threads.
     :return: The filename of the built wheel, or None if the build failed.
     """
     artifact = "editable" if editable else "wheel"
@@ -189,7 +199,10 @@ def _build_one(
         return None
 
     # Install build deps into temporary directory (PEP 518)
-    with req.build_env:
+    build_env: ContextManager[None] = req.build_env
+    if in_thread:
+        build_env = req.build_env.for_current_thread()
+    with build_env:
         wheel_path = _build_one_inside_env(
             req, output_dir, build_options, global_options, editable
         )
@@ -290,15 +303,58 @@ def _clean_one_legacy(req: InstallRequirement, global_options: List[str]) -> boo
         return False
 
 
+def _build_concurrently(
+    requirements: List[InstallRequirement],
+    build_one: Callable[[InstallRequirement], Optional[str]],
+    jobs: int,
+) -> List[Optional[str]]:
+    """Build wheels in a thread pool, each in its own subprocesses.
+
+    The log messages of each build are held back until it has finished, and
+    then emitted together, in the order of the requirements.
+    """
+    indentation = get_indentation()
+
+    def build_with_captured_logs(
+        req: InstallRequirement, captured: List[CapturedRecord]
+    ) -> Optional[str]:
+        with indent_log(indentation), capture_logs() as records:
+            try:
+                return build_one(req)
+            finally:
+                captured.extend(records)
+
+    wheel_files = []
+    with ThreadPoolExecutor(jobs) as executor:
+        builds: List[Tuple["Future[Optional[str]]", List[CapturedRecord]]] = []
+        for req in requirements:
+            captured: List[CapturedRecord] = []
+            future = executor.submit(build_with_captured_logs, req, captured)
+            builds.append((future, captured))
+        try:
+            for future, captured in builds:
+                wait([future])
+                replay_logs(captured)
+                wheel_files.append(future.result())
+        except BaseException:
+            # Don't start any more builds, as this one raises.
+            for future, _ in builds:
+                future.cancel()
+            raise
+    return wheel_files
+
+
 def build(
     requirements: Iterable[InstallRequirement],
     wheel_cache: WheelCache,
     verify: bool,
     build_options: List[str],
     global_options: List[str],
+    jobs: int = 1,
 ) -> BuildResult:
     """Build wheels.
 
+    :param jobs: The number of wheels built at the same time.
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
@@ -311,19 +367,30 @@ def build(
         ", ".join(req.name for req in requirements),  # type: ignore
     )
 
+    requirements = list(requirements)
+    in_thread = jobs > 1 and len(requirements) > 1
+
+    def build_one(req: InstallRequirement) -> Optional[str]:
+        assert req.name
+        return _build_one(
+            req,
+            _get_cache_dir(req, wheel_cache),
+            verify,
+            build_options,
+            global_options,
+            req.editable and req.permit_editable_wheels,
+            in_thread=in_thread,
+        )
+
     with indent_log():
+        if in_thread:
+            wheel_files = _build_concurrently(requirements, build_one, jobs)
+        else:
+            wheel_files = [build_one(req) for req in requirements]
+
         build_successes, build_failures = [], []
-        for req in requirements:
-            assert req.name
+        for req, wheel_file in zip(requirements, wheel_files):
             cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req,
-                cache_dir,
-                verify,
-                build_options,
-                global_options,
-                req.editable and req.permit_editable_wheels,
-            )
             if wheel_file:
                 # Record the download origin in the cache
                 if req.download_info is not None: